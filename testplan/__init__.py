@@ -3,7 +3,14 @@
 import os
 import sys
 
-sys.dont_write_bytecode = True
+# Bytecode is only cached in the directory given by TESTPLAN_PYCACHE_PREFIX,
+# shared by all testplan processes, never next to the sources.
+TESTPLAN_PYCACHE_PREFIX = "TESTPLAN_PYCACHE_PREFIX"
+if os.environ.get(TESTPLAN_PYCACHE_PREFIX) and hasattr(sys, "pycache_prefix"):
+    sys.pycache_prefix = os.environ[TESTPLAN_PYCACHE_PREFIX]
+    sys.dont_write_bytecode = False
+elif not getattr(sys, "pycache_prefix", None):
+    sys.dont_write_bytecode = True
 
 TESTPLAN_DEPENDENCIES_PATH = "TESTPLAN_DEPENDENCIES_PATH"
 if TESTPLAN_DEPENDENCIES_PATH in os.environ:
@@ -9,7 +9,6 @@ from testplan.common.utils.callable import arity
 from testplan.common.utils.validation import is_subclass, has_method
 from testplan.parser import TestplanParser
 from testplan.runners import LocalRunner
-from testplan.runnable.interactive import TestRunnerIHandler
 from testplan.environment import Environments
 from testplan.common.utils import logger
 from testplan.common.utils import path
@@ -158,6 +157,11 @@ class Testplan(entity.RunnableManager):
         `TestRunnerIHandler <testplan.runnable.interactive.TestRunnerIHandler>`
     :param extra_deps: Extra module dependencies for interactive reload.
     :type extra_deps: ``list`` of ``module``
+    :param bytecode_cache: Cache the bytecode of the modules imported by
+        testplan and its worker processes, in the given directory or in a
+        directory next to the default runpaths if ``True``, instead of
+        compiling them in every process. Requires Python 3.8+.
+    :type bytecode_cache: ``bool`` or ``str``
     """
 
     CONFIG = TestplanConfig
@@ -199,8 +203,9 @@ class Testplan(entity.RunnableManager):
         verbose=False,
         debug=False,
         timeout=None,
-        interactive_handler=TestRunnerIHandler,
+        interactive_handler=None,
         extra_deps=None,
+        bytecode_cache=False,
         **options
     ):
 
@@ -251,6 +256,7 @@ class Testplan(entity.RunnableManager):
             timeout=timeout,
             interactive_handler=interactive_handler,
             extra_deps=extra_deps,
+            bytecode_cache=bytecode_cache,
             **options
         )
         for resource in self._cfg.resources:
@@ -356,8 +362,9 @@ class Testplan(entity.RunnableManager):
         verbose=False,
         debug=False,
         timeout=None,
-        interactive_handler=TestRunnerIHandler,
+        interactive_handler=None,
         extra_deps=None,
+        bytecode_cache=False,
         **options
     ):
         """
@@ -413,6 +420,7 @@ class Testplan(entity.RunnableManager):
                     timeout=timeout,
                     interactive_handler=interactive_handler,
                     extra_deps=extra_deps,
+                    bytecode_cache=bytecode_cache,
                     **options
                 )
                 try:
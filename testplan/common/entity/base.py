@@ -18,7 +18,7 @@ from schema import Or, And, Use
 
 from testplan.common.config import Config, ConfigOption
 from testplan.common.utils.thread import execute_as_thread
-from testplan.common.utils.timing import wait
+from testplan.common.utils.timing import wait, Timer
 from testplan.common.utils.path import makeemptydirs, makedirs, default_runpath
 from testplan.common.utils import logger
 
@@ -36,6 +36,7 @@ class Environment(object):
         self.parent = parent
         self.start_exceptions = OrderedDict()
         self.stop_exceptions = OrderedDict()
+        self.stop_timer = Timer()
         self._logger = None
 
     @property
@@ -54,7 +55,7 @@ class Environment(object):
             if self.parent is not None:
                 self._logger = self.parent.logger
             else:
-                self._logger = Entity.logger
+                self._logger = logger.TESTPLAN_LOGGER
         return self._logger
 
     def add(self, item, uid=None):
@@ -195,35 +196,74 @@ class Environment(object):
     def stop(self, reversed=False):
         """
         Stop all resources in reverse order and log exceptions.
+
+        Consecutive resources with ``async_stop`` enabled are stopped
+        concurrently while the others are stopped one at a time, keeping
+        their position in the stop order. The stop latency of each resource
+        is recorded in ``stop_timer``.
         """
         resources = list(self._resources.values())
         if reversed is True:
             resources = resources[::-1]
 
-        # Stop all resources
+        self.stop_timer = Timer()
+        concurrent = []
+
         for resource in resources:
             if (resource.status.tag is None) or (
                 resource.status.tag == resource.STATUS.STOPPED
             ):
                 # Skip resources not even triggered to start.
                 continue
-            try:
+            if resource.cfg.async_stop:
+                concurrent.append(resource)
+                continue
+
+            self._stop_concurrently(concurrent)
+            concurrent = []
+            self._stop_resource(resource)
+
+        self._stop_concurrently(concurrent)
+
+    def _stop_resource(self, resource):
+        """Stop a resource, wait for it to be stopped and log exceptions."""
+        uid = str(resource.uid())
+        try:
+            with self.stop_timer.record(uid):
                 resource.stop()
-            except Exception:
-                msg = "While stopping resource [{}]\n{}".format(
-                    resource.cfg.name, traceback.format_exc()
-                )
-                self.stop_exceptions[resource] = msg
+                resource.wait(resource.STATUS.STOPPED)
+        except Exception:
+            msg = "While stopping resource [{}]\n{}".format(
+                resource.cfg.name, traceback.format_exc()
+            )
+            self.stop_exceptions[resource] = msg
+        else:
+            self.logger.debug(
+                "Stopped resource [%s] in %.3fs",
+                uid,
+                self.stop_timer[uid].elapsed,
+            )
 
-        # Wait resources status to be STOPPED.
+    def _stop_concurrently(self, resources):
+        """Stop resources in parallel threads."""
+        if len(resources) <= 1:
+            for resource in resources:
+                self._stop_resource(resource)
+            return
+
+        threads = []
         for resource in resources:
-            if resource in self.stop_exceptions:
-                continue
-            elif resource.status.tag is None:
-                # Skip resources not even triggered to start.
-                continue
-            else:
-                resource.wait(resource.STATUS.STOPPED)
+            thread = threading.Thread(
+                target=self._stop_resource,
+                args=(resource,),
+                name="Stop-{}".format(resource.uid()),
+            )
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
 
     def stop_in_pool(self, pool, reversed=False):
         """
@@ -847,6 +887,10 @@ class Runnable(Entity):
         """Determines if current object should run."""
         return True
 
+    def _interactive_handler_class(self):
+        """Class of the handler for interactive mode execution."""
+        return self.cfg.interactive_handler
+
     def run(self):
         """Executes the defined steps and populates the result object."""
         try:
@@ -858,7 +902,7 @@ class Runnable(Entity):
                         )
                     )
                 self.logger.test_info("Starting %s in interactive mode", self)
-                self._ihandler = self.cfg.interactive_handler(
+                self._ihandler = self._interactive_handler_class()(
                     target=self, http_port=self.cfg.interactive_port
                 )
                 thread = threading.Thread(target=self._ihandler)
@@ -919,7 +963,10 @@ class ResourceConfig(EntityConfig):
     @classmethod
     def get_options(cls):
         """Resource specific config options."""
-        return {ConfigOption("async_start", default=True): bool}
+        return {
+            ConfigOption("async_start", default=True): bool,
+            ConfigOption("async_stop", default=True): bool,
+        }
 
 
 class ResourceStatus(EntityStatus):
@@ -965,6 +1012,9 @@ class Resource(Entity):
 
     :param async_start: Resource can start asynchronously.
     :type async_start: ``bool``
+    :param async_stop: Resource can be stopped concurrently with other
+        resources of the same environment.
+    :type async_stop: ``bool``
 
     Also inherits all
     :py:class:`~testplan.common.entity.base.Entity` options.
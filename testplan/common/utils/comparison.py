@@ -1,5 +1,6 @@
 import operator
 import decimal
+import itertools
 
 try:
     from collections.abc import Mapping, Iterable
@@ -476,31 +477,31 @@ def _partition(results):
     return lhs_vals, rhs_vals
 
 
-def _cmp_dicts(lhs, rhs, ignore, only, report_mode, value_cmp_func):
+def _should_ignore_key(key, ignore, only):
     """
-    Compares dictionaries
+    Decide if a key should be ignored.
+
+    Decision is based on ``ignore`` and ``only``.
+    If ``only`` is ``True`` then keys that are
+     not in ``lhs`` will be ignored.
     """
+    if key in ignore:
+        should_ignore = True
+    elif only is not None:
+        should_ignore = key not in only
+    else:
+        should_ignore = False
+    return should_ignore
 
-    def should_ignore_key(key):
-        """
-            Decide if a key should be ignored.
-
-            Decision is based on ``ignore`` and ``only``.
-            If ``only`` is ``True`` then keys that are
-             not in ``lhs`` will be ignored.
-        """
-        if key in ignore:
-            should_ignore = True
-        elif only is not None:
-            should_ignore = key not in only
-        else:
-            should_ignore = False
-        return should_ignore
 
+def _cmp_dicts(lhs, rhs, ignore, only, report_mode, value_cmp_func):
+    """
+    Compares dictionaries
+    """
     results = []
     match = Match.IGNORED
     for iter_key, lhs_val, rhs_val in _idictzip_all(lhs, rhs):
-        if should_ignore_key(iter_key):
+        if _should_ignore_key(iter_key, ignore, only):
             if report_mode == ReportOptions.ALL:
                 results.append(
                     _build_res(
@@ -674,6 +675,93 @@ def _rec_compare(
     return _build_res(key=key, match=Match.FAIL, lhs=fmt(lhs), rhs=fmt(rhs))
 
 
+def _rec_passes(lhs, rhs, ignore, only, value_cmp_func):
+    """
+    Recursive deep comparison that only decides whether ``lhs`` and ``rhs``
+    match, same as ``_rec_compare`` but without building any result and
+    stopping at the first mismatch.
+    """
+    lhs_cat = _categorise(lhs)
+    rhs_cat = _categorise(rhs)
+
+    ## NO VALS
+    if (
+        ((lhs_cat == Category.ABSENT) or (rhs_cat == Category.ABSENT))
+        and (lhs_cat != Category.CALLABLE)
+        and (rhs_cat != Category.CALLABLE)
+    ):
+        return lhs_cat == rhs_cat
+
+    ## CALLABLES
+    if lhs_cat == rhs_cat == Category.CALLABLE:
+        return lhs == rhs
+
+    if lhs_cat == Category.CALLABLE:
+        return compare_with_callable(callable_obj=lhs, value=rhs)[0]
+
+    if rhs_cat == Category.CALLABLE:
+        return compare_with_callable(callable_obj=rhs, value=lhs)[0]
+
+    ## REGEXES
+    if lhs_cat == rhs_cat == Category.REGEX:
+        return Match.to_bool(RegexAdapter.compare(lhs, rhs))
+
+    if lhs_cat == Category.REGEX:
+        return Match.to_bool(RegexAdapter.match(regex=lhs, value=rhs))
+
+    if rhs_cat == Category.REGEX:
+        return Match.to_bool(RegexAdapter.match(regex=rhs, value=lhs))
+
+    ## VALUES
+    if lhs_cat == rhs_cat == Category.VALUE:
+        return bool(value_cmp_func(lhs, rhs))
+
+    ## ITERABLE
+    if lhs_cat == rhs_cat == Category.ITERABLE:
+        return all(
+            _rec_passes(lhs_item, rhs_item, ignore, only, value_cmp_func)
+            for lhs_item, rhs_item in six.moves.zip_longest(lhs, rhs)
+        )
+
+    ## DICTS
+    if lhs_cat == rhs_cat == Category.DICT:
+        return all(
+            _rec_passes(lhs_val, rhs_val, ignore, only, value_cmp_func)
+            for iter_key, lhs_val, rhs_val in _idictzip_all(lhs, rhs)
+            if not _should_ignore_key(iter_key, ignore, only)
+        )
+
+    ## DIFF TYPES
+    return False
+
+
+def _first_failure(lhs, rhs, ignore, only, value_cmp_func):
+    """
+    Compares dictionaries, stopping at the first top level key that does
+    not match. Only the comparison of that key is built, with passing
+    nested comparisons discarded.
+    """
+    for iter_key, lhs_val, rhs_val in _idictzip_all(lhs, rhs):
+        if _should_ignore_key(iter_key, ignore, only):
+            continue
+        if not _rec_passes(lhs_val, rhs_val, ignore, only, value_cmp_func):
+            return (
+                False,
+                [
+                    _rec_compare(
+                        lhs_val,
+                        rhs_val,
+                        ignore,
+                        only,
+                        iter_key,
+                        ReportOptions.FAILS_ONLY,
+                        value_cmp_func,
+                    )
+                ],
+            )
+    return True, []
+
+
 def untyped_fixtag(x, y):
     """
     Custom stringify logic for fix msg tag value, strips off insignificant
@@ -743,6 +831,7 @@ def compare(
     only=None,
     report_mode=ReportOptions.ALL,
     value_cmp_func=COMPARE_FUNCTIONS["native_equality"],
+    fail_fast=False,
 ):
     """
     Compare two iterable key, value objects (e.g. dict or dict-like mapping)
@@ -750,6 +839,10 @@ def compare(
 
     Ignore has precedence over only.
 
+    In ``fail_fast`` mode the comparison stops at the first mismatching
+    top level key and the comparison table only contains the failed
+    comparison of that key, ``report_mode`` is not used.
+
     :param lhs: object compared against rhs
     :type lhs: ``dict`` interface (``__contains__`` and ``.items()``)
     :param rhs: object compared against lhs
@@ -766,6 +859,8 @@ def compare(
     :param value_cmp_func: function to compare values in a dict. Defaults
         to COMPARE_FUNCTIONS['native_equality'].
     :type value_cmp_func: Callable[[Any, Any], bool]
+    :param fail_fast: Stop at the first mismatch, only reporting it.
+    :type fail_fast: ``bool``
 
     :return: Tuple of comparison bool ``(passed: True, failed: False)`` and
              a description object for the testdb report
@@ -799,6 +894,9 @@ def compare(
 
     ignore = ignore or []
 
+    if fail_fast:
+        return _first_failure(lhs, rhs, ignore, only, value_cmp_func)
+
     match, comparisons = _cmp_dicts(
         lhs, rhs, ignore, only, report_mode, value_cmp_func
     )
@@ -818,6 +916,392 @@ def compare(
     return Match.to_bool(match), comparisons
 
 
+# Exact types that ``_categorise`` always treats as plain values, used to
+# skip the full category dispatch for the most common actual values.
+_VALUE_TYPES = frozenset(
+    six.string_types + six.integer_types + (float, bool, bytes, bytearray)
+)
+
+
+def _categorise_actual(obj):
+    """
+    Check type of an actual (received) object, short-circuiting for
+    plain values.
+    """
+    if type(obj) in _VALUE_TYPES:
+        return Category.VALUE
+    return _categorise(obj)
+
+
+class _CompiledNode(object):
+    """
+    .. warning::
+
+      Internal API.
+
+    Comparison against a single expected value, compiled by
+    :py:class:`DictMatcher`. The base class falls back to
+    :py:func:`_rec_compare`, subclasses precompute the expected side and
+    provide a fast path for the common category of actual values.
+    """
+
+    def __init__(self, matcher, rhs):
+        self.matcher = matcher
+        self.rhs = rhs
+
+    def fallback(self, lhs, key):
+        """Compare ``lhs`` against the expected value without compilation."""
+        return self.matcher.rec_compare(lhs, self.rhs, key)
+
+    def compare(self, lhs, key):
+        """
+        Compare an actual value against the compiled expected value.
+
+        :return: Result tuple, same as returned by :py:func:`_rec_compare`
+        :rtype: ``tuple``
+        """
+        return self.fallback(lhs, key)
+
+
+class _CompiledValue(_CompiledNode):
+    """Expected plain value, compared using ``value_cmp_func``."""
+
+    def __init__(self, matcher, rhs):
+        super(_CompiledValue, self).__init__(matcher, rhs)
+        self.rhs_fmt = fmt(rhs)
+
+    def compare(self, lhs, key):
+        lhs_t = type(lhs)
+        if lhs_t not in _VALUE_TYPES:
+            if _categorise(lhs) != Category.VALUE:
+                return self.fallback(lhs, key)
+            lhs_fmt = fmt(lhs)
+        elif issubclass(lhs_t, int):
+            # Same as ``fmt`` for plain values
+            lhs_fmt = (0, lhs_t.__name__, str(lhs))
+        else:
+            lhs_fmt = (0, lhs_t.__name__, lhs)
+
+        if self.matcher.value_cmp_func(lhs, self.rhs):
+            return key, Match.PASS, lhs_fmt, self.rhs_fmt
+        return key, Match.FAIL, lhs_fmt, self.rhs_fmt
+
+
+class _CompiledCallable(_CompiledNode):
+    """Expected comparator, called with the actual value."""
+
+    def __init__(self, matcher, rhs):
+        super(_CompiledCallable, self).__init__(matcher, rhs)
+        self.rhs_fmt = (0, "func", callable_name(rhs))
+
+    def compare(self, lhs, key):
+        if _categorise_actual(lhs) == Category.CALLABLE:
+            return self.fallback(lhs, key)
+        result, error = compare_with_callable(callable_obj=self.rhs, value=lhs)
+        return _build_res(
+            key=key,
+            match=Match.from_bool(result),
+            lhs="Value: {}, Error: {}".format(lhs, error)
+            if error
+            else fmt(lhs),
+            rhs=self.rhs_fmt,
+        )
+
+
+class _CompiledRegex(_CompiledNode):
+    """Expected regular expression, matched against the actual value."""
+
+    def __init__(self, matcher, rhs):
+        super(_CompiledRegex, self).__init__(matcher, rhs)
+        self.rhs_fmt = RegexAdapter.serialize(rhs)
+
+    def compare(self, lhs, key):
+        if _categorise_actual(lhs) in (
+            Category.ABSENT,
+            Category.CALLABLE,
+            Category.REGEX,
+        ):
+            return self.fallback(lhs, key)
+        return _build_res(
+            key=key,
+            match=RegexAdapter.match(regex=self.rhs, value=lhs),
+            lhs=fmt(lhs),
+            rhs=self.rhs_fmt,
+        )
+
+
+class _CompiledIterable(_CompiledNode):
+    """Expected iterable, compared item by item."""
+
+    def __init__(self, matcher, rhs):
+        super(_CompiledIterable, self).__init__(matcher, rhs)
+        self.nodes = [matcher.compile(item) for item in rhs]
+
+    def compare(self, lhs, key):
+        if _categorise_actual(lhs) != Category.ITERABLE:
+            return self.fallback(lhs, key)
+
+        results = []
+        match = Match.IGNORED
+        for lhs_item, node in six.moves.zip_longest(lhs, self.nodes):
+            if node is None:
+                result = self.matcher.rec_compare(lhs_item, None, None)
+            else:
+                result = node.compare(lhs_item, None)
+            match = Match.combine(match, result[1])
+            results.append(result)
+
+        lhs_vals, rhs_vals = _partition(results)
+        return _build_res(
+            key=key, match=match, lhs=(1, lhs_vals), rhs=(1, rhs_vals)
+        )
+
+
+class _CompiledDict(_CompiledNode):
+    """
+    Expected mapping, key sets and ignored keys are resolved upfront.
+    """
+
+    def __init__(self, matcher, rhs):
+        super(_CompiledDict, self).__init__(matcher, rhs)
+        self.keys = []
+        self.nodes = {}
+        self.ignored = {}
+        for rhs_key, rhs_val in rhs.items():
+            self.keys.append(rhs_key)
+            if matcher.should_ignore_key(rhs_key):
+                self.ignored[rhs_key] = fmt(rhs_val)
+            else:
+                self.nodes[rhs_key] = matcher.compile(rhs_val)
+
+    def compare(self, lhs, key):
+        if _categorise_actual(lhs) != Category.DICT:
+            return self.fallback(lhs, key)
+        match, results = self.compare_items(lhs)
+        lhs_vals, rhs_vals = _partition(results)
+        return _build_res(
+            key=key, match=match, lhs=(2, lhs_vals), rhs=(2, rhs_vals)
+        )
+
+    def _compare_key(self, iter_key, lhs_val):
+        """
+        Compare the value under a key that is not a compiled node.
+
+        :return: Result tuple or ``None`` if the key is ignored
+        :rtype: ``tuple``
+        """
+        matcher = self.matcher
+        if iter_key in self.ignored or (
+            iter_key not in self.nodes and matcher.should_ignore_key(iter_key)
+        ):
+            if matcher.report_mode == ReportOptions.ALL:
+                return _build_res(
+                    key=iter_key,
+                    match=Match.IGNORED,
+                    lhs=fmt(lhs_val),
+                    rhs=self.ignored.get(iter_key, fmt(Absent)),
+                )
+            return None
+        return matcher.rec_compare(lhs_val, Absent, iter_key)
+
+    def compare_items(self, lhs):
+        """
+        Compare the items of an actual mapping.
+
+        :return: Match level and list of result tuples, same as returned by
+                 :py:func:`_cmp_dicts`
+        :rtype: ``tuple``
+        """
+        nodes = self.nodes
+        fails_only = self.matcher.fails_only
+        results = []
+        passed = failed = False
+
+        absent_items = (
+            (iter_key, Absent) for iter_key in self.keys if iter_key not in lhs
+        )
+        for iter_key, lhs_val in itertools.chain(lhs.items(), absent_items):
+            node = nodes.get(iter_key)
+            if node is not None:
+                result = node.compare(lhs_val, iter_key)
+            else:
+                result = self._compare_key(iter_key, lhs_val)
+                if result is None or result[1] == Match.IGNORED:
+                    if result is not None:
+                        results.append(result)
+                    continue
+
+            if result[1] == Match.FAIL:
+                failed = True
+            else:
+                passed = passed or result[1] == Match.PASS
+                if fails_only:
+                    continue
+            results.append(result)
+
+        if failed:
+            return Match.FAIL, results
+        elif passed:
+            return Match.PASS, results
+        return Match.IGNORED, results
+
+
+class DictMatcher(object):
+    """
+    Compiled form of an expected dict, for matching many actual dicts
+    against the same expectation.
+
+    The expected side, comparators included, is categorised and formatted
+    once, and the set of ignored keys is resolved upfront. Calling
+    :py:meth:`compare` with an actual dict gives the same result as
+    :py:func:`compare` with the same arguments, but without redoing this
+    work for every actual dict.
+
+    .. code-block:: python
+
+        matcher = DictMatcher(
+            expected={'foo': 1, 'bar': In(['blue', 'red'])},
+            ignore=['seq_num'],
+        )
+        for msg in messages:
+            passed, comparisons = matcher.compare(msg)
+
+    :param expected: object that actual objects are compared against,
+                     can contain custom comparators (e.g. regex, lambda
+                     functions)
+    :type expected: ``dict`` interface (``__contains__`` and ``.items()``)
+    :param ignore: list of keys to ignore in the comparison
+    :type ignore: ``list``
+    :param only: list of keys to exclusively consider in the comparison
+    :type only: ``list``
+    :param report_mode: Specify which comparisons should be kept and reported.
+                        See ReportOptions enum for more detail.
+    :type report_mode: ``ReportOptions``
+    :param value_cmp_func: function to compare values in a dict. Defaults
+        to COMPARE_FUNCTIONS['native_equality'].
+    :type value_cmp_func: Callable[[Any, Any], bool]
+    :param fail_fast: Stop at the first mismatch, only reporting it.
+    :type fail_fast: ``bool``
+    """
+
+    def __init__(
+        self,
+        expected,
+        ignore=None,
+        only=None,
+        report_mode=ReportOptions.ALL,
+        value_cmp_func=COMPARE_FUNCTIONS["native_equality"],
+        fail_fast=False,
+    ):
+        if report_mode not in (
+            ReportOptions.ALL,
+            ReportOptions.NO_IGNORED,
+            ReportOptions.FAILS_ONLY,
+        ):
+            raise ValueError("Invalid report mode {}".format(report_mode))
+
+        self.expected = expected
+        self.ignore = ignore
+        self.only = only
+        self.report_mode = report_mode
+        self.fails_only = report_mode == ReportOptions.FAILS_ONLY
+        self.value_cmp_func = value_cmp_func
+        self.fail_fast = fail_fast
+
+        self._ignore_set = frozenset(ignore or [])
+        self._only_set = None if only is None else frozenset(only)
+        self._root = (
+            None
+            if expected is None or expected is Absent
+            else _CompiledDict(self, expected)
+        )
+
+    def should_ignore_key(self, key):
+        """
+        Decide if a key should be ignored, ``ignore`` has precedence over
+        ``only``.
+        """
+        if key in self._ignore_set:
+            return True
+        if self._only_set is not None:
+            return key not in self._only_set
+        return False
+
+    def rec_compare(self, lhs, rhs, key):
+        """Uncompiled comparison, used for values that need no dispatch."""
+        return _rec_compare(
+            lhs,
+            rhs,
+            self.ignore or [],
+            self.only,
+            key,
+            self.report_mode,
+            self.value_cmp_func,
+        )
+
+    def compile(self, rhs):
+        """
+        Compile an expected value into a node.
+
+        :param rhs: expected value
+        :type rhs: ``object``
+        :return: Compiled comparison node
+        :rtype: ``_CompiledNode``
+        """
+        category = _categorise(rhs)
+        if category == Category.VALUE:
+            return _CompiledValue(self, rhs)
+        elif category == Category.CALLABLE:
+            return _CompiledCallable(self, rhs)
+        elif category == Category.REGEX:
+            return _CompiledRegex(self, rhs)
+        elif category == Category.ITERABLE:
+            return _CompiledIterable(self, rhs)
+        elif category == Category.DICT:
+            return _CompiledDict(self, rhs)
+        return _CompiledNode(self, rhs)
+
+    def compare(self, actual):
+        """
+        Compare an actual object against the compiled expected object.
+
+        :param actual: object compared against the expected object
+        :type actual: ``dict`` interface (``__contains__`` and ``.items()``)
+        :return: Tuple of comparison bool ``(passed: True, failed: False)``
+                 and a description object for the testdb report
+        :rtype: ``tuple`` of (``bool``, ``list`` of ``tuple``)
+        """
+        if (
+            self.fail_fast
+            or self._root is None
+            or actual is None
+            or actual is Absent
+        ):
+            return compare(
+                lhs=actual,
+                rhs=self.expected,
+                ignore=self.ignore,
+                only=self.only,
+                report_mode=self.report_mode,
+                value_cmp_func=self.value_cmp_func,
+                fail_fast=self.fail_fast,
+            )
+
+        match, comparisons = self._root.compare_items(actual)
+
+        # For the keys in only not matching anything,
+        # we report them as absent in expected and value.
+        if isinstance(self.only, list) and self.only:
+            keys_found = set(elem[0] for elem in comparisons)
+            for key in self.only:
+                if key not in keys_found:
+                    comparisons.append(
+                        (key, Match.IGNORED, Absent.descr, Absent.descr)
+                    )
+
+        return Match.to_bool(match), comparisons
+
+
 def _best_permutation(grid):
     """
     Given a square matrix of errors comparing actual
@@ -24,6 +24,9 @@ Class SequenceMatcher:
 
 Class Differ:
     For producing human-readable deltas from sequences of lines of text.
+
+Function line_opcodes(a, b):
+    Line level opcodes of two sequences of lines, used by Differ.
 """
 
 import os
@@ -40,6 +43,7 @@ __all__ = [
     "SequenceMatcher",
     "get_close_matches",
     "Differ",
+    "line_opcodes",
     "IS_CHARACTER_JUNK",
     "IS_LINE_JUNK",
     "diff",
@@ -277,6 +281,7 @@ class SequenceMatcher(object):
         self.matching_blocks = self.opcodes = self._ratio = None
 
         # cache the data for self.find_longest_match()
+        self.a_content = None
         ajunk = (
             {elt for elt in self.a if self.isjunk(elt)}
             if self.isjunk
@@ -379,6 +384,13 @@ class SequenceMatcher(object):
         self.isbjunk = bjunk.__contains__
         self.isbpopular = popular.__contains__
 
+        # Elements of a are looked up by their real content, as instances of
+        # FuzzyMatchingString with different values can be equal. When more
+        # than one key of b2j is equal to an element, the first one is used.
+        self.content2j = content2j = {}
+        for elt, indices in b2j.items():
+            content2j.setdefault(_real_content(elt), indices)
+
     def find_longest_match(self, alo, ahi, blo, bhi):
         """Find longest matching block in a[alo:ahi] and b[blo:bhi].
 
@@ -435,7 +447,10 @@ class SequenceMatcher(object):
         # Windiff ends up at the same place as diff, but by pairing up
         # the unique 'b's and then matching the first two 'a's.
 
-        a, b, b2j = self.a, self.b, self.b2j
+        a, b, content2j = self.a, self.b, self.content2j
+        if self.a_content is None:
+            self.a_content = [_real_content(elt) for elt in a]
+        a_content, nothing = self.a_content, []
         isajunk, isbjunk = self.isajunk, self.isbjunk
         besti, bestj, bestsize = alo, blo, 0
         # find longest junk-free match
@@ -447,15 +462,7 @@ class SequenceMatcher(object):
             # b2j has no junk keys, the loop is skipped if a[i] is junk
             j2lenget = j2len.get
             newj2len = {}
-            indices = []
-            # TODO: (need improve) time consuming in this loop. For immutable
-            # string we could get indices from b2j directly, but we may compare
-            # mutable objects here, i.e. instances of FuzzyMatchingString.
-            for key, val in b2j.items():
-                if a[i] == key:
-                    indices = val
-                    break
-            for j in indices:
+            for j in content2j.get(a_content[i], nothing):
                 # a[i] matches b[j]
                 if j < blo:
                     continue
@@ -837,6 +844,298 @@ def get_close_matches(word, possibilities, n=3, cutoff=0.6):
     return [x for score, x in result]
 
 
+########################################################################
+###  Linear space line diff
+########################################################################
+
+
+def _line_key(line, ignore_space_change=False, ignore_whitespaces=False):
+    """
+    Return the content of a line that takes part in the comparison, same
+    as SpaceIgnoredString.real_content but avoiding regular expressions.
+    """
+    if ignore_whitespaces:
+        return "".join(line.split())
+    elif ignore_space_change:
+        content = " ".join(line.split())
+        return " " + content if content and line[:1].isspace() else content
+    return line
+
+
+def _hash_lines(a, b, ignore_space_change=False, ignore_whitespaces=False):
+    """
+    Map the lines of `a` and `b` to integers, lines get the same number
+    iff they are considered equal, so the diff only compares integers.
+    """
+    ids = {}
+    keys_a = [
+        ids.setdefault(
+            _line_key(str(line), ignore_space_change, ignore_whitespaces),
+            len(ids),
+        )
+        for line in a
+    ]
+    keys_b = [
+        ids.setdefault(
+            _line_key(str(line), ignore_space_change, ignore_whitespaces),
+            len(ids),
+        )
+        for line in b
+    ]
+    return keys_a, keys_b
+
+
+def _middle_snake(a, alo, ahi, b, blo, bhi):
+    """
+    Find the middle snake of the shortest edit script between a[alo:ahi]
+    and b[blo:bhi] by running Myers' algorithm from both ends at the same
+    time. Returns (x, y, u, v), the snake runs from (x, y) to (u, v).
+
+    Both ranges must be non-empty and must not share a common prefix or
+    suffix, which guarantees that the snake splits the problem.
+
+    Like GNU diff, the search for the shortest edit script is given up past
+    a cost in the order of the square root of the input size, the ranges
+    are then split at the furthest point reached (an empty snake).
+    """
+    n, m = ahi - alo, bhi - blo
+    delta = n - m
+    odd = delta & 1
+    limit = (n + m + 1) // 2 + 1
+    too_expensive = max(256, int((n + m) ** 0.5))
+    offset = limit + 1
+    forward = [0] * (2 * offset + 1)
+    backward = [0] * (2 * offset + 1)
+
+    for d in range(limit):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (
+                k != d and forward[offset + k - 1] < forward[offset + k + 1]
+            ):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[alo + x] == b[blo + y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+
+            if (
+                odd
+                and -d < delta - k < d
+                and x + backward[offset + delta - k] >= n
+            ):
+                return alo + x0, blo + y0, alo + x, blo + y
+
+        for k in range(-d, d + 1, 2):
+            if k == -d or (
+                k != d and backward[offset + k - 1] < backward[offset + k + 1]
+            ):
+                x = backward[offset + k + 1]
+            else:
+                x = backward[offset + k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[ahi - 1 - x] == b[bhi - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + k] = x
+
+            if (
+                not odd
+                and -d <= delta - k <= d
+                and x + forward[offset + delta - k] >= n
+            ):
+                return alo + n - x, blo + m - y, alo + n - x0, blo + m - y0
+
+        if d >= too_expensive:
+            best, point = 0, None
+            for k in range(-d, d + 1, 2):
+                for steps, backwards in (
+                    (forward[offset + k], False),
+                    (backward[offset + k], True),
+                ):
+                    x = min(steps, n)
+                    y = x - k
+                    if y > m:
+                        x, y = m + k, m
+                    if 0 <= x <= n and 0 <= y and best < x + y < n + m:
+                        best = x + y
+                        point = (n - x, m - y) if backwards else (x, y)
+            if point is not None:
+                return (
+                    alo + point[0],
+                    blo + point[1],
+                    alo + point[0],
+                    blo + point[1],
+                )
+
+    raise RuntimeError("No middle snake found")  # unreachable
+
+
+def _myers_matches(a, b):
+    """
+    Return the matching (i, j) index pairs of a longest common subsequence
+    of `a` and `b`, in increasing order. Uses the linear space variant of
+    Myers' O(ND) algorithm with common prefix & suffix stripping, very
+    different inputs get a common subsequence close to the longest one.
+    """
+    matches = []
+    stack = [(0, len(a), 0, len(b))]
+
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            matches.append((alo, blo))
+            alo += 1
+            blo += 1
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            matches.append((ahi, bhi))
+        if alo == ahi or blo == bhi:
+            continue
+
+        x, y, u, v = _middle_snake(a, alo, ahi, b, blo, bhi)
+        matches.extend((x + i, y + i) for i in range(u - x))
+        stack.append((alo, x, blo, y))
+        stack.append((u, ahi, v, bhi))
+
+    matches.sort()
+    return matches
+
+
+def _grow_blocks(keys_a, keys_b, matches):
+    """
+    Group the matching (i, j) index pairs into [i, j, size] blocks and grow
+    them over the adjacent lines that are equal, junk lines included, the
+    same way SequenceMatcher does: the longest blocks are grown first, a
+    block grows through the neighbours it runs into but never past them.
+    """
+    blocks = []
+    for i, j in matches:
+        if blocks and blocks[-1][0] + blocks[-1][2] == i:
+            if blocks[-1][1] + blocks[-1][2] == j:
+                blocks[-1][2] += 1
+                continue
+        blocks.append([i, j, 1])
+
+    # Blocks are chained to their neighbours, merged ones are unlinked
+    prev = list(range(-1, len(blocks) - 1))
+    succ = list(range(1, len(blocks))) + [None]
+    order = sorted(
+        range(len(blocks)), key=lambda idx: (-blocks[idx][2], blocks[idx][1])
+    )
+    for idx in order:
+        if blocks[idx] is None:
+            continue
+        i, j, size = blocks[idx]
+
+        while True:
+            before = prev[idx]
+            if before < 0:
+                lo_i = lo_j = 0
+            else:
+                lo_i = blocks[before][0] + blocks[before][2]
+                lo_j = blocks[before][1] + blocks[before][2]
+            while i > lo_i and j > lo_j and keys_a[i - 1] == keys_b[j - 1]:
+                i, j, size = i - 1, j - 1, size + 1
+            if before < 0 or (i, j) != (lo_i, lo_j):
+                break
+            i, j = blocks[before][0], blocks[before][1]
+            size += blocks[before][2]
+            blocks[before] = None
+            prev[idx] = prev[before]
+            if prev[idx] >= 0:
+                succ[prev[idx]] = idx
+
+        while True:
+            after = succ[idx]
+            if after is None:
+                hi_i, hi_j = len(keys_a), len(keys_b)
+            else:
+                hi_i, hi_j = blocks[after][0], blocks[after][1]
+            while (
+                i + size < hi_i
+                and j + size < hi_j
+                and keys_a[i + size] == keys_b[j + size]
+            ):
+                size += 1
+            if after is None or (i + size, j + size) != (hi_i, hi_j):
+                break
+            size += blocks[after][2]
+            blocks[after] = None
+            succ[idx] = succ[after]
+            if succ[idx] is not None:
+                prev[succ[idx]] = idx
+
+        blocks[idx] = [i, j, size]
+
+    return [block for block in blocks if block is not None]
+
+
+def line_opcodes(
+    a, b, linejunk=None, ignore_space_change=False, ignore_whitespaces=False
+):
+    """
+    Compare two sequences of lines, return a list of 5-tuples describing
+    how to turn `a` into `b`, in the format of SequenceMatcher.get_opcodes.
+
+    Lines are hashed to integers up front and lines that do not exist in
+    the other sequence are dropped before running the O(ND) diff, so that
+    large inputs with few or localized changes are compared quickly and in
+    linear space.
+
+    Lines for which `linejunk` returns true are not used to line up the
+    sequences, they only get matched when next to other matching lines.
+    Unlike Differ.get_opcodes, replaced blocks are not looked into for
+    similar or equal junk lines.
+    """
+    keys_a, keys_b = _hash_lines(a, b, ignore_space_change, ignore_whitespaces)
+
+    # Lines unique to one side can never be matched, leaving them out
+    # keeps the edit distance (and so the running time) down.
+    common = set(keys_a).intersection(keys_b)
+
+    if linejunk is not None:
+        checked = set()
+        for line, key in zip(b, keys_b):
+            if key in common and key not in checked:
+                checked.add(key)
+                if linejunk(str(line)):
+                    common.discard(key)
+
+    index_a = [i for i, key in enumerate(keys_a) if key in common]
+    index_b = [j for j, key in enumerate(keys_b) if key in common]
+
+    matches = [
+        (index_a[x], index_b[y])
+        for x, y in _myers_matches(
+            [keys_a[i] for i in index_a], [keys_b[j] for j in index_b]
+        )
+    ]
+
+    opcodes = []
+    i = j = 0
+    for x, y, size in _grow_blocks(keys_a, keys_b, matches) + [
+        [len(a), len(b), 0]
+    ]:
+        if x > i and y > j:
+            opcodes.append(("replace", i, x, j, y))
+        elif x > i:
+            opcodes.append(("delete", i, x, j, y))
+        elif y > j:
+            opcodes.append(("insert", i, x, j, y))
+        if size:
+            opcodes.append(("equal", x, x + size, y, y + size))
+        i, j = x + size, y + size
+
+    return opcodes
+
+
 class FuzzyMatchingString(str):
     """
     Inherits built-in str, but two strings can be considered equal when
@@ -865,6 +1164,13 @@ class FuzzyMatchingString(str):
         return None
 
 
+def _real_content(elt):
+    "Return what an element of a sequence is compared by"
+    if isinstance(elt, FuzzyMatchingString):
+        return elt.real_content()
+    return elt
+
+
 class SpaceIgnoredString(FuzzyMatchingString):
     """
     Inherits FuzzyMatchingString, ingores whitespace and space change
@@ -876,25 +1182,29 @@ class SpaceIgnoredString(FuzzyMatchingString):
     ):
         self.ignore_space_change = ignore_space_change
         self.ignore_whitespaces = ignore_whitespaces
+        self._real_content = None
 
     def real_content(self):
-        if self.ignore_whitespaces:
-            return re.sub(r"\s+", "", self)
-        elif self.ignore_space_change:
-            # gnu diff ignores all whitespace (include line-feed) in the
-            # right side when compare with -b or --ignore-space-change,
-            # just simulatethat behavior
-            return re.sub(r"\s+", " ", self).rstrip()
-        else:
-            return str(self)
+        # lines are compared many times while diffing, compute content once
+        if self._real_content is None:
+            if self.ignore_whitespaces:
+                self._real_content = re.sub(r"\s+", "", self)
+            elif self.ignore_space_change:
+                # gnu diff ignores all whitespace (include line-feed) in the
+                # right side when compare with -b or --ignore-space-change,
+                # just simulatethat behavior
+                self._real_content = re.sub(r"\s+", " ", self).rstrip()
+            else:
+                self._real_content = str(self)
+        return self._real_content
 
 
 class Differ(object):
     r"""
     Differ is a class for comparing sequences of lines of text, and
     producing human-readable differences or deltas.  Differ uses
-    SequenceMatcher both to compare sequences of lines, and to compare
-    sequences of characters within similar (near-matching) lines.
+    line_opcodes() to compare sequences of lines, and SequenceMatcher to
+    compare sequences of characters within similar (near-matching) lines.
 
     Use get_opcodes() and get_merged_opcodes() to get a list of 5-tuples
     describing how to turn a into b. The former can give detailed
@@ -996,7 +1306,23 @@ class Differ(object):
         ('insert', 3, 3, 2, 3)
         """
 
+        for opcode in self._get_opcodes(a, b):
+            yield opcode
+
+    def _get_opcodes(self, a, b, detailed=True):
+        """
+        Generate the opcodes of get_opcodes(). If `detailed` is False, the
+        replaced blocks that would be merged back together by
+        `_merge_opcodes` are not looked into.
+        """
         assert all(str(i) != "" for i in a) and all(str(j) != "" for j in b)
+        opcodes = line_opcodes(
+            a,
+            b,
+            linejunk=self.linejunk,
+            ignore_space_change=self.ignore_space_change,
+            ignore_whitespaces=self.ignore_whitespaces,
+        )
         if self.ignore_space_change or self.ignore_whitespaces:
             new_a, new_b = [], []
             for i in a:
@@ -1013,9 +1339,14 @@ class Differ(object):
                 )
             a, b = new_a, new_b
 
-        cruncher = SequenceMatcher(self.linejunk, a, b)
-        for tag, alo, ahi, blo, bhi in cruncher.get_opcodes():
-            if tag == "replace":
+        for tag, alo, ahi, blo, bhi in opcodes:
+            if tag == "replace" and not (
+                detailed or self._has_equal_lines(a, alo, ahi, b, blo, bhi)
+            ):
+                # without any pair of equal lines, `_fancy_replace` only
+                # gives non-equal opcodes which get merged as this one
+                g = ((tag, alo, ahi, blo, bhi),)
+            elif tag == "replace":
                 # `_fancy_replace` can give us a more specific result, for
                 # example, it can recognize completely equal lines among
                 # a block of line junks. it is also useful when we want to
@@ -1029,6 +1360,22 @@ class Differ(object):
             for tag, alo, ahi, blo, bhi in g:
                 yield (tag, alo, ahi, blo, bhi)
 
+    def _has_equal_lines(self, a, alo, ahi, b, blo, bhi):
+        "Check if any line of a[alo:ahi] is equal to a line of b[blo:bhi]"
+        keys = set(
+            _line_key(
+                str(a[i]), self.ignore_space_change, self.ignore_whitespaces
+            )
+            for i in range(alo, ahi)
+        )
+        return any(
+            _line_key(
+                str(b[j]), self.ignore_space_change, self.ignore_whitespaces
+            )
+            in keys
+            for j in range(blo, bhi)
+        )
+
     def get_merged_opcodes(self, a, b):
         r"""
         Similar like get_opcodes(), but the adjacent items might be merge
@@ -1051,7 +1398,7 @@ class Differ(object):
         ('replace', 11, 13, 10, 11)
         """
 
-        g = self._merge_opcodes(self.get_opcodes(a, b))
+        g = self._merge_opcodes(self._get_opcodes(a, b, detailed=False))
         if self.ignore_blank_lines:
             g = self._merge_opcodes(self._verify_blank_lines(a, b, g))
 
@@ -1115,7 +1462,7 @@ class Differ(object):
                     _check_adjacent_blank_block(codes, i - 2)
                     _check_adjacent_blank_block(codes, i + 2)
 
-        g = self._merge_opcodes(self.get_opcodes(a, b))
+        g = self._merge_opcodes(self._get_opcodes(a, b, detailed=False))
         if self.ignore_blank_lines:
             g = self._verify_blank_lines(a, b, g)
         codes = list(g)
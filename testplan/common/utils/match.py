@@ -1,15 +1,130 @@
 """
 Module of utility types and functions that perform matching.
 """
+import bisect
+import io
+import itertools
+import locale
+import operator
 import os
 import time
 import re
 import six
 
+try:
+    from functools import lru_cache
+except ImportError:  # Python 2
+    from functools32 import lru_cache
+
+try:
+    from itertools import accumulate as _accumulate
+except ImportError:  # Python 2
+    _accumulate = None
+
 from . import timing
 from . import logger
 
 LOG_MATCHER_INTERVAL = 0.25
+LOG_MATCHER_CHUNK_SIZE = 1024 * 1024
+
+# Maximum number of compiled patterns kept by ``compile_regex``
+REGEX_CACHE_SIZE = 256
+
+_ENCODING = locale.getpreferredencoding(False)
+
+_ONES = itertools.repeat(1)
+
+
+@lru_cache(maxsize=REGEX_CACHE_SIZE)
+def _compile_regex(pattern_type, pattern, flags):
+    # ``pattern_type`` keeps str and bytes patterns apart (equal on Python 2),
+    # functools32.lru_cache does not support ``typed=True``
+    return re.compile(pattern, flags)
+
+
+def compile_regex(regex, flags=0):
+    """
+    Compile a regex pattern, patterns are cached by ``(pattern, flags)`` in a
+    bounded LRU so repeated assertions with the same pattern reuse it.
+
+    :param regex: regex string or compiled regular expression
+        (``re.compile``), the latter is returned as it is
+    :type regex: ``Union[str, re.Pattern]``
+    :param flags: Regex flags, used when compiling a string pattern.
+    :type flags: ``int``
+
+    :return: Compiled regular expression
+    :rtype: ``re.Pattern``
+    """
+    if hasattr(regex, "match"):
+        return regex
+    return _compile_regex(type(regex), regex, flags)
+
+
+def _decode_line(raw):
+    """
+    Decodes a line read in binary mode, without its line terminator, the
+    way text mode reading would.
+    """
+    if raw.endswith(b"\r"):
+        raw = raw[:-1]
+    return raw.decode(_ENCODING, "replace")
+
+
+def _split_lines(data):
+    """
+    Splits newline terminated data read in binary mode into lines.
+
+    :return: Raw lines without line terminators and decoded lines with a
+        universal ``\\n`` line terminator.
+    :rtype: ``tuple`` of ``list``
+    """
+    raw_lines = data.split(b"\n")
+    raw_lines.pop()
+    text = data.decode(_ENCODING, "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+
+    lines = text.splitlines(True)
+    if len(lines) != len(raw_lines):
+        # Other line boundaries than ``\\n`` were split on, or decoding
+        # did not keep lines apart
+        lines = [_decode_line(raw) + "\n" for raw in raw_lines]
+    return raw_lines, lines
+
+
+def _line_ends(offset, raw_lines):
+    """
+    End positions of consecutive lines starting at ``offset``, given the
+    lines without their ``\\n`` line terminator.
+    """
+    sizes = six.moves.map(len, raw_lines)
+    if _accumulate is None:
+        line_ends = []
+        for size in sizes:
+            offset += size + 1
+            line_ends.append(offset)
+        return line_ends
+
+    line_ends = list(
+        _accumulate(
+            itertools.chain(
+                [offset], six.moves.map(operator.add, sizes, _ONES)
+            )
+        )
+    )
+    del line_ends[0]
+    return line_ends
+
+
+def _matching_indexes(regex, lines):
+    """
+    Generator of the indexes of the lines matching a regex, the lines are
+    matched lazily.
+    """
+    return itertools.compress(
+        six.moves.range(len(lines)), six.moves.map(regex.match, lines)
+    )
 
 
 def match_regexps_in_file(logpath, log_extracts, return_unmatched=False):
@@ -50,16 +165,29 @@ class LogMatcher(logger.Loggable):
     remembers the line number of the match and subsequent matches are scanned
     from the current line number. This can be useful when matched lines are not
     unique for the entire log file.
+
+    The file is read in chunks of ``chunk_size`` bytes and the start offsets
+    of the lines read so far are kept in an index, which gives the line
+    numbers of matches and is extended incrementally as the file grows.
+    While waiting for new lines, the file size is checked at exponentially
+    increasing intervals (up to ``LOG_MATCHER_INTERVAL``) so that lines
+    written shortly after reaching the end of file are picked up quickly.
     """
 
-    def __init__(self, log_path):
+    def __init__(self, log_path, chunk_size=LOG_MATCHER_CHUNK_SIZE):
         """
         :param log_path: Path to the log file.
         :type log_path: ``str``
+        :param chunk_size: Number of bytes read from the file at once.
+        :type chunk_size: ``int``
         """
         self.log_path = log_path
         self.position = 0
         self.marks = {}
+        self.chunk_size = chunk_size
+        # Start offsets of the indexed lines, the last one is the end offset
+        # of the last complete line indexed so far.
+        self._line_offsets = [0]
         super(LogMatcher, self).__init__()
 
     def seek(self, mark=None):
@@ -77,9 +205,7 @@ class LogMatcher(logger.Loggable):
 
     def seek_eof(self):
         """Sets current file position to the current end of file."""
-        with open(self.log_path, "r") as log:
-            log.seek(0, os.SEEK_END)
-            self.position = log.tell()
+        self.position = self._file_size()
 
     def seek_sof(self):
         """Sets current file position to the start of file."""
@@ -95,6 +221,193 @@ class LogMatcher(logger.Loggable):
         """
         self.marks[name] = self.position
 
+    def line_number(self, position):
+        """
+        Returns the (zero based) number of the line containing a file
+        position, using the index of lines read so far.
+
+        :param position: File position, in bytes.
+        :type position: ``int``
+
+        :return: Line number or ``None`` if the position is past the lines
+            read so far.
+        :rtype: ``int`` or ``NoneType``
+        """
+        if position >= self._line_offsets[-1]:
+            return None
+        return bisect.bisect_right(self._line_offsets, position) - 1
+
+    def _file_size(self):
+        try:
+            return os.path.getsize(self.log_path)
+        except OSError:
+            return 0
+
+    def _iter_chunks(self, start, end=None):
+        """
+        Reads lines of the file in chunks, from the ``start`` position up to
+        the ``end`` position (or end of file), extending the line index
+        along the way.
+
+        A line that is not terminated yet at the end of file is yielded last,
+        on its own and with ``complete`` set to ``False``.
+
+        :return: Generator of ``(first_line_no, line_ends, lines, complete)``
+            tuples, ``line_ends`` being the end position of each line.
+        :rtype: ``generator`` of ``tuple``
+        """
+        offsets = self._line_offsets
+        if self._file_size() < offsets[-1]:
+            # File was truncated or replaced, the index is no longer valid
+            del offsets[1:]
+
+        # Reading always starts at an indexed line so the index has no gaps
+        line_no = bisect.bisect_right(offsets, start) - 1
+        offset = offsets[line_no]
+        pending = b""
+
+        with io.open(self.log_path, "rb") as log:
+            log.seek(offset)
+            while end is None or offset < end:
+                chunk = log.read(self.chunk_size)
+                if not chunk:
+                    break
+                data = pending + chunk
+                split = data.rfind(b"\n") + 1
+                pending = data[split:]
+                if not split:
+                    continue
+
+                chunk_start = offset
+                raw_lines, lines = _split_lines(data[:split])
+                line_ends = _line_ends(offset, raw_lines)
+                offset = line_ends[-1]
+
+                # Extend the index with the lines past its end
+                known_lines = len(offsets) - 1 - line_no
+                if known_lines < len(line_ends):
+                    offsets.extend(line_ends[max(known_lines, 0) :])
+
+                first_line_no = line_no
+                line_no += len(lines)
+
+                # Only keep lines that end after start and begin before end
+                low = bisect.bisect_right(line_ends, start)
+                high = len(lines)
+                if end is not None:
+                    high = min(high, bisect.bisect_left(line_ends, end) + 1)
+                if low >= high:
+                    if high < len(lines):
+                        return
+                    continue
+
+                line_start = line_ends[low - 1] if low else chunk_start
+                if line_start < start:
+                    lines[low] = (
+                        _decode_line(raw_lines[low][start - line_start :])
+                        + "\n"
+                    )
+                yield (
+                    first_line_no + low,
+                    line_ends[low:high],
+                    lines[low:high],
+                    True,
+                )
+                if high < len(lines):
+                    return
+
+            if pending and (end is None or offset < end):
+                if offset < start:
+                    pending = pending[start - offset :]
+                yield line_no, [offset + len(pending)], [
+                    _decode_line(pending)
+                ], False
+
+    def _wait_for_change(self, size, end_time):
+        """
+        Waits until the size of the file changes from ``size`` bytes.
+
+        :return: ``True`` if the file changed, ``False`` on timeout.
+        :rtype: ``bool``
+        """
+        for interval in timing.exponential_interval(
+            initial=0.005, maximum=LOG_MATCHER_INTERVAL
+        ):
+            if self._file_size() != size:
+                return True
+            remaining = end_time - time.time()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+
+    def match_each(self, regexes, timeout=5, raise_on_timeout=True):
+        """
+        Matches each of the regexes against the lines of the log file from
+        the current position, in a single pass. Every line is matched
+        against the regexes that have not matched yet, until all of them
+        have matched, waiting up to ``timeout`` seconds for new lines. The
+        position is then moved after the last line needed for a match.
+
+        :param regexes: regex strings or compiled regular expressions
+            (``re.compile``)
+        :type regexes: ``list`` of ``Union[str, re.Pattern]``
+        :param timeout: Seconds to wait for matching lines to be written.
+        :type timeout: ``float``
+        :param raise_on_timeout: Raise an Exception if not all regexes have
+            matched before timeout.
+        :type raise_on_timeout: ``bool``
+
+        :return: The match of each regex, ``None`` for regexes that did not
+            match if ``raise_on_timeout`` is ``False``.
+        :rtype: ``list`` of ``re.Match``
+        """
+        regexes = [compile_regex(regex) for regex in regexes]
+        matches = [None] * len(regexes)
+        outstanding = list(range(len(regexes)))
+        last_end = self.position
+        start_time = time.time()
+        end_time = start_time + timeout
+
+        position = eof = self.position
+        while outstanding:
+            size = self._file_size()
+            chunks = self._iter_chunks(position)
+            for _, line_ends, lines, complete in chunks:
+                for idx in list(outstanding):
+                    regex = regexes[idx]
+                    found = next(_matching_indexes(regex, lines), None)
+                    if found is not None:
+                        matches[idx] = regex.match(lines[found])
+                        outstanding.remove(idx)
+                        last_end = max(last_end, line_ends[found])
+                eof = line_ends[-1]
+                if not outstanding:
+                    # Position after the last line needed for a match
+                    eof = last_end
+                    break
+                if complete:
+                    # An incomplete line is read again once it grows
+                    position = eof
+            chunks.close()
+
+            if outstanding and not self._wait_for_change(size, end_time):
+                break
+
+        self.position = eof
+        if outstanding:
+            if raise_on_timeout:
+                raise timing.TimeoutException(
+                    "No matches found in {}s for: {}".format(
+                        timeout,
+                        ", ".join(regexes[idx].pattern for idx in outstanding),
+                    )
+                )
+        else:
+            self.logger.debug(
+                "Matches found in %.2fs", time.time() - start_time
+            )
+        return matches
+
     def match(self, regex, timeout=5):
         """
         Matches each line in the log file from the current line number to the
@@ -104,39 +417,61 @@ class LogMatcher(logger.Loggable):
         :param regex: regex string or compiled regular expression
             (``re.compile``)
         :type regex: ``Union[str, re.Pattern]``
+        :param timeout: Seconds to wait for a matching line to be written.
+        :type timeout: ``float``
 
         :return: The regex match or raise an Exception if no match is found.
         :rtype: ``re.Match``
         """
-        match = None
-        start_time = time.time()
-        end_time = start_time + timeout
+        try:
+            return self.match_each([regex], timeout=timeout)[0]
+        except timing.TimeoutException:
+            raise timing.TimeoutException(
+                "No matches found in {}s".format(timeout)
+            )
+
+    def iter_matches(self, regex, start=None, end=None):
+        """
+        Matches a regex against the lines of the log file between two marks,
+        without waiting for new lines or changing the current position.
+
+        :param regex: regex string or compiled regular expression
+            (``re.compile``)
+        :type regex: ``Union[str, re.Pattern]``
+        :param start: Mark to start from, defaults to the current position.
+        :type start: ``str`` or ``NoneType``
+        :param end: Mark to stop at, defaults to the end of file.
+        :type end: ``str`` or ``NoneType``
 
-        # As a convenience, we create the compiled regex if a string was
-        # passed.
-        if not hasattr(regex, "match"):
-            regex = re.compile(regex)
+        :return: Generator of ``(line_no, match)`` pairs.
+        :rtype: ``generator`` of ``tuple``
+        """
+        regex = compile_regex(regex)
+        start = self.position if start is None else self.marks[start]
+        end = None if end is None else self.marks[end]
 
-        with open(self.log_path, "r") as log:
-            log.seek(self.position)
+        for first_line_no, _, lines, _ in self._iter_chunks(start, end):
+            for idx in _matching_indexes(regex, lines):
+                yield first_line_no + idx, regex.match(lines[idx])
 
-            while match is None:
-                line = log.readline()
-                if line:
-                    match = regex.match(line)
-                    if match:
-                        break
-                else:
-                    time.sleep(LOG_MATCHER_INTERVAL)
-                    if time.time() > end_time:
-                        break
+    def match_all(self, regex, start=None, end=None):
+        """
+        Returns all matches of a regex against the lines of the log file
+        between two marks. See :py:meth:`iter_matches`.
 
-            self.position = log.tell()
+        :return: The matches, in file order.
+        :rtype: ``list`` of ``re.Match``
+        """
+        return [match for _, match in self.iter_matches(regex, start, end)]
 
-        if match is None:
-            raise timing.TimeoutException(
-                "No matches found in {}s".format(timeout)
-            )
-        else:
-            self.logger.debug("Match found in %.2fs", time.time() - start_time)
-        return match
+    def not_match(self, regex, start=None, end=None):
+        """
+        Checks that a regex matches none of the lines of the log file between
+        two marks. See :py:meth:`iter_matches`.
+
+        :return: ``True`` if no line matches.
+        :rtype: ``bool``
+        """
+        for _ in self.iter_matches(regex, start, end):
+            return False
+        return True
@@ -7,6 +7,7 @@ import getpass
 import contextlib
 import tempfile
 import hashlib
+import fnmatch
 
 from .strings import slugify
 
@@ -52,11 +53,8 @@ def workspace_root():
     return pwd()
 
 
-def default_runpath(entity):
-    """
-    Returns default runpath for an
-    :py:class:`Entity <testplan.common.entity.base.Entity>` object.
-    """
+def _runpath_prefix():
+    """Directory of the default runpaths."""
     # On POSIX systems, use /var/tmp in preference to /tmp for the runpath if it
     # exists.
     if os.name == "posix" and os.path.exists(VAR_TMP):
@@ -64,10 +62,23 @@ def default_runpath(entity):
     else:
         runpath_prefix = tempfile.gettempdir()
 
-    runpath = os.path.join(
-        runpath_prefix, getpass.getuser(), "testplan", slugify(entity.uid())
-    )
-    return runpath
+    return os.path.join(runpath_prefix, getpass.getuser(), "testplan")
+
+
+def default_runpath(entity):
+    """
+    Returns default runpath for an
+    :py:class:`Entity <testplan.common.entity.base.Entity>` object.
+    """
+    return os.path.join(_runpath_prefix(), slugify(entity.uid()))
+
+
+def default_pycache_dir():
+    """
+    Returns the default bytecode cache directory, next to the default
+    runpaths so that it is kept across runs.
+    """
+    return os.path.join(_runpath_prefix(), ".pycache")
 
 
 @contextlib.contextmanager
@@ -309,6 +320,57 @@ def hash_file(filepath):
     return hasher.hexdigest()
 
 
+def dir_manifest(root, exclude=None):
+    """
+    Describes the files under a directory by their content, so that directory
+    trees can be compared without comparing the files themselves. Symbolic
+    links are described by their target and not followed.
+
+    :param root: Directory to describe.
+    :type root: ``str``
+    :param exclude: Patterns of the file and directory names or relative paths
+      to skip, i.e ``*.pyc``.
+    :type exclude: ``list`` of ``str``
+    :return: Map of the POSIX relative paths of the files to a ``dict`` with
+      their SHA1 ``sha1`` hash and ``mode``, or their ``link`` target.
+    :rtype: ``dict``
+    """
+    exclude = exclude or []
+
+    def excluded(name, relpath):
+        return any(
+            fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relpath, pattern)
+            for pattern in exclude
+        )
+
+    manifest = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        reldir = os.path.relpath(dirpath, root)
+        reldir = "" if reldir == os.curdir else to_posix_path(reldir) + "/"
+
+        for name in list(dirnames):
+            path = os.path.join(dirpath, name)
+            if excluded(name, reldir + name):
+                dirnames.remove(name)
+            elif os.path.islink(path):
+                dirnames.remove(name)
+                manifest[reldir + name] = {"link": os.readlink(path)}
+
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            if excluded(name, reldir + name):
+                continue
+            if os.path.islink(path):
+                manifest[reldir + name] = {"link": os.readlink(path)}
+            else:
+                manifest[reldir + name] = {
+                    "sha1": hash_file(path),
+                    "mode": os.stat(path).st_mode & 0o7777,
+                }
+
+    return manifest
+
+
 def archive(path, timestamp):
     """
     Append a timestamp to an existing file's name.
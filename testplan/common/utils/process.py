@@ -1,6 +1,10 @@
 """System process utilities module."""
 
+import os
 import time
+import heapq
+import select
+import signal
 import psutil
 import warnings
 
@@ -8,8 +12,9 @@ import subprocess
 import platform
 import threading
 import functools
+import itertools
 
-from .timing import get_sleeper, exponential_interval
+from .timing import get_sleeper
 from testplan.common.utils.logger import TESTPLAN_LOGGER
 
 
@@ -23,6 +28,81 @@ def _log_proc(msg, warn=False, output=None):
         warnings.warn(msg)
 
 
+# Linux 5.3+ / Python 3.9+ only, used to wait on a process exit without
+# busy polling.
+_PIDFD_OPEN = getattr(os, "pidfd_open", None)
+
+
+def _wait_pidfd(proc, timeout):
+    try:
+        pidfd = _PIDFD_OPEN(proc.pid)
+    except OSError:
+        # Already reaped or pidfd not supported by the running kernel.
+        return None
+    try:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        poller.poll(timeout * 1000)
+    finally:
+        os.close(pidfd)
+    return proc.poll()
+
+
+def wait_process(proc, timeout):
+    """
+    Wait for a process to exit for up to ``timeout`` seconds. It returns as
+    soon as the process exits by blocking on a pidfd when the platform
+    supports it, or on ``Popen.wait`` otherwise, instead of sleeping on
+    fixed intervals.
+
+    :param proc: process to wait for
+    :type proc: ``subprocess.Popen``
+    :param timeout: timeout in seconds
+    :type timeout: ``int`` or ``float``
+    :return: Exit code of process or ``None`` if still alive.
+    :rtype: ``int`` or ``NoneType``
+    """
+    retcode = proc.poll()
+    if retcode is not None or timeout <= 0:
+        return retcode
+
+    if _PIDFD_OPEN is not None:
+        retcode = _wait_pidfd(proc, timeout)
+        if retcode is not None:
+            return retcode
+
+    if hasattr(subprocess, "TimeoutExpired"):
+        try:
+            return proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return None
+
+    sleeper = get_sleeper((0.01, 0.1), timeout=timeout)
+    while next(sleeper):
+        retcode = proc.poll()
+        if retcode is not None:
+            break
+    return retcode
+
+
+def is_process_group_leader(pid):
+    """
+    Check if a process is the leader of its own process group, in which case
+    the whole group can be signalled at once.
+
+    :param pid: process id
+    :type pid: ``int``
+    :return: ``True`` if the process leads a process group.
+    :rtype: ``bool``
+    """
+    if not hasattr(os, "getpgid"):
+        return False
+    try:
+        return os.getpgid(pid) == pid
+    except OSError:
+        return False
+
+
 def kill_process(proc, timeout=5, signal_=None, output=None):
     """
     If alive, kills the process.
@@ -30,6 +110,10 @@ def kill_process(proc, timeout=5, signal_=None, output=None):
     to terminate for up to time specified in timeout parameter.
     If process hangs then call ``kill()``.
 
+    If the process leads its own process group (e.g. it was started with
+    ``start_new_session=True``) the signals are sent to the whole group, so
+    that its children are stopped concurrently and share the same timeout.
+
     :param proc: process to kill
     :type proc: ``subprocess.Popen``
     :param timeout: timeout in seconds, defaults to 5 seconds
@@ -45,29 +129,38 @@ def kill_process(proc, timeout=5, signal_=None, output=None):
     if retcode is not None:
         return retcode
 
+    deadline = time.time() + timeout
     child_procs = psutil.Process(proc.pid).children(recursive=True)
+    group = is_process_group_leader(proc.pid)
 
-    if signal_ is not None:
+    if group:
+        try:
+            os.killpg(proc.pid, signal_ or signal.SIGTERM)
+        except OSError as error:
+            _log(msg="Could not signal process group - {}".format(error))
+            group = False
+            proc.send_signal(signal_ or signal.SIGTERM)
+    elif signal_ is not None:
         proc.send_signal(signal_)
     else:
         proc.terminate()
 
-    sleeper = get_sleeper((0.05, 1), timeout=timeout)
-    while next(sleeper):
-        if retcode is None:
-            retcode = proc.poll()
-        else:
-            break
+    retcode = wait_process(proc, timeout)
 
     if retcode is None:
         try:
             _log(msg="Binary still alive, killing it")
-            proc.kill()
+            if group:
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
             proc.wait()
         except (RuntimeError, OSError) as error:
             _log(msg="Could not kill process - {}".format(error), warn=True)
 
-    _, alive = psutil.wait_procs(child_procs, timeout=timeout)
+    # Children signalled along with the group already had their grace period.
+    child_timeout = max(deadline - time.time(), 0) if group else timeout
+    _, alive = psutil.wait_procs(child_procs, timeout=child_timeout)
     for p in alive:
         try:
             p.kill()
@@ -245,36 +338,163 @@ def execute_cmd(
     return handler.returncode
 
 
-def enforce_timeout(process, timeout=1, callback=None, output=None):
-    _log = functools.partial(_log_proc, output=output)
+class TimeoutSupervisor(object):
+    """
+    Enforces timeouts of many processes from a single daemon thread.
+
+    Deadlines are kept in a heap and the thread sleeps on a condition
+    variable until the earliest one is due, or until it is woken up by a
+    new registration or a process exit reported through
+    :py:meth:`discard`. Only the rare expired processes get a short lived
+    thread for running their callback and killing them, so that a slow kill
+    does not delay other deadlines.
+    """
 
-    def _inner():
-        begin = time.time()
-        intervals = exponential_interval(maximum=10)
+    def __init__(self):
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def add(self, process, timeout, callback=None, output=None):
+        """
+        Supervise a process, killing it if it is still alive after
+        ``timeout`` seconds.
+
+        :param process: process to supervise
+        :type process: ``subprocess.Popen``
+        :param timeout: timeout in seconds
+        :type timeout: ``int`` or ``float``
+        :param callback: Optional callable to invoke before killing the
+            process on timeout.
+        :type callback: ``callable``
+        :param output: Optional file like object for writing logs.
+        :type output: ``file``
+        """
+        entry = [
+            time.time() + timeout,
+            next(self._counter),
+            process,
+            timeout,
+            callback,
+            output,
+        ]
+        with self._cond:
+            heapq.heappush(self._heap, entry)
+            self._entries[id(process)] = entry
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._loop, name="TimeoutSupervisor"
+                )
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify()
+
+    def discard(self, process):
+        """
+        Stop supervising a process, e.g. once it has been waited for.
+
+        :param process: process to stop supervising
+        :type process: ``subprocess.Popen``
+        """
+        with self._cond:
+            entry = self._entries.pop(id(process), None)
+            if entry is None:
+                return
+            # Lazy deletion, the entry will be dropped from the heap once
+            # it reaches the top.
+            entry[2] = None
+            _log_proc(
+                msg="Process returncode: {}".format(process.returncode),
+                output=entry[5],
+            )
+            self._cond.notify()
+
+    def _pop_expired(self):
+        """
+        Drop discarded or finished processes from the top of the heap and
+        return the first expired entry, or ``None`` after waiting for the
+        next deadline.
+        """
+        while self._heap:
+            entry = self._heap[0]
+            process = entry[2]
+            if process is None:
+                heapq.heappop(self._heap)
+            elif process.poll() is not None:
+                heapq.heappop(self._heap)
+                self._entries.pop(id(process), None)
+                _log_proc(
+                    msg="Process returncode: {}".format(process.returncode),
+                    output=entry[5],
+                )
+            elif entry[0] <= time.time():
+                heapq.heappop(self._heap)
+                self._entries.pop(id(process), None)
+                return entry
+            else:
+                self._cond.wait(entry[0] - time.time())
+                return None
 
+        self._cond.wait()
+        return None
+
+    def _loop(self):
         while True:
-            if process.returncode is not None:
-                _log(msg="Process returncode: {}".format(process.returncode))
-                break
-            elif time.time() - begin >= timeout:
-                _log(
-                    msg="Killing binary after"
-                    " reaching timeout value {}s".format(timeout)
-                )
+            with self._cond:
+                entry = self._pop_expired()
+            if entry is not None:
+                expire = threading.Thread(target=self._expire, args=(entry,))
+                expire.daemon = True
+                expire.start()
+
+    @staticmethod
+    def _expire(entry):
+        _, _, process, timeout, callback, output = entry
+        _log_proc(
+            msg="Killing binary after reaching timeout value {}s".format(
+                timeout
+            ),
+            output=output,
+        )
+        try:
+            if callback:
+                callback()
+        finally:
+            kill_process(process, output=output)
 
-                try:
-                    if callback:
-                        callback()
 
-                finally:
-                    kill_process(process, output=output)
-                break
-            else:
-                delay = next(intervals)
-                _log(msg="Sleeping for {}".format(delay))
-                time.sleep(delay)
-        _log("Exiting loop")
-
-    timeout_checker = threading.Thread(target=_inner)
-    timeout_checker.daemon = True
-    timeout_checker.start()
+TIMEOUT_SUPERVISOR = TimeoutSupervisor()
+
+
+def enforce_timeout(process, timeout=1, callback=None, output=None):
+    """
+    Kill a process if it runs longer than ``timeout`` seconds. The deadline
+    is enforced by the process wide
+    :py:class:`TimeoutSupervisor`, call :py:func:`cancel_timeout` once the
+    process has been waited for.
+
+    :param process: process to supervise
+    :type process: ``subprocess.Popen``
+    :param timeout: timeout in seconds, defaults to 1 second
+    :type timeout: ``int`` or ``float``
+    :param callback: Optional callable to invoke before killing the process.
+    :type callback: ``callable``
+    :param output: Optional file like object for writing logs.
+    :type output: ``file``
+    """
+    TIMEOUT_SUPERVISOR.add(
+        process, timeout=timeout, callback=callback, output=output
+    )
+
+
+def cancel_timeout(process):
+    """
+    Stop enforcing the timeout of a process previously passed to
+    :py:func:`enforce_timeout`.
+
+    :param process: supervised process
+    :type process: ``subprocess.Popen``
+    """
+    TIMEOUT_SUPERVISOR.discard(process)
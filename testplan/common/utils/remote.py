@@ -6,33 +6,99 @@ import getpass
 import subprocess
 
 
+SSH_CONTROL_PERSIST = 60
+
+_BINARIES = {}
+
+
+def _binary(env_var, name):
+    """
+    Path of a binary, given by an environment variable or found on the PATH.
+    The lookup on the PATH is done once and cached.
+    """
+    if os.environ.get(env_var):
+        return os.environ[env_var]
+    if name not in _BINARIES:
+        if os.name == "nt":
+            raise Exception("{} binary not provided.".format(name.upper()))
+        _BINARIES[name] = (
+            subprocess.check_output("which {}".format(name), shell=True)
+            .decode(sys.stdout.encoding or "utf-8")
+            .strip()
+        )
+    return _BINARIES[name]
+
+
+def ssh_binary():
+    """Returns the ssh binary, from ``SSH_BINARY`` env var or the PATH."""
+    return _binary("SSH_BINARY", "ssh")
+
+
+def ssh_options(ssh_cfg):
+    """
+    Returns the ssh options to reuse the master connection of a host, if
+    ``control_path`` is set in the ssh configuration.
+    """
+    if not ssh_cfg.get("control_path"):
+        return []
+    return ["-o", "ControlPath={}".format(ssh_cfg["control_path"])]
+
+
 def ssh_cmd(ssh_cfg, command):
-    """Returns ssh command."""
-    try:
-        binary = os.environ["SSH_BINARY"]
-    except KeyError:
-        if os.name != "nt":
-            binary = (
-                subprocess.check_output("which ssh", shell=True)
-                .decode(sys.stdout.encoding)
-                .strip()
-            )
-        else:
-            raise Exception("SSH binary not provided.")
-
-    cmd = [binary]
+    """
+    Returns ssh command.
+
+    If ``control_path`` is set in the ssh configuration, the command is
+    multiplexed over the master connection listening on that socket. The
+    ``control`` entry turns the command into a master connection operation:
+    ``start`` runs a master connection in the background and ``exit`` stops
+    it.
+    """
+    cmd = [ssh_binary()]
 
     if ssh_cfg.get("port"):
         cmd.extend(["-p", ssh_cfg["port"]])
 
+    cmd.extend(ssh_options(ssh_cfg))
+    control = ssh_cfg.get("control")
+    if control == "start":
+        cmd.extend(
+            [
+                "-o",
+                "ControlMaster=yes",
+                "-o",
+                "ControlPersist={}".format(
+                    ssh_cfg.get("control_persist", SSH_CONTROL_PERSIST)
+                ),
+                "-f",
+                "-N",
+            ]
+        )
+    elif control == "exit":
+        cmd.extend(["-O", "exit"])
+
     cmd.append("{}@{}".format(getpass.getuser(), ssh_cfg["host"]))
-    cmd.append(command)
+    if command:
+        cmd.append(command)
 
     return cmd
 
 
-def copy_cmd(source, target, exclude=None, port=None, deref_links=False):
-    """Returns remote copy command."""
+def copy_cmd(
+    source,
+    target,
+    exclude=None,
+    port=None,
+    deref_links=False,
+    extra_ssh_options=None,
+):
+    """
+    Returns remote copy command.
+
+    :param extra_ssh_options: Extra options of the underlying ssh
+      connection, i.e to reuse a master connection.
+    :type extra_ssh_options: ``list`` of ``str``
+    """
     if os.environ.get("RSYNC_BINARY"):
         cmd = [os.environ["RSYNC_BINARY"], "-r"]
         cmd.append("-L" if deref_links else "-l")
@@ -41,27 +107,22 @@ def copy_cmd(source, target, exclude=None, port=None, deref_links=False):
             for item in exclude:
                 cmd.extend(["--exclude", item])
 
-        if port is not None:
-            # Add '-e "ssh -p "' option to rsync command
-            ssh = "{} -p {}".format(os.environ["SSH_BINARY"], port)
-            cmd.extend(["-e", ssh])
+        if port is not None or extra_ssh_options:
+            # Add '-e "ssh -p <port> <options>"' option to rsync command
+            ssh = [ssh_binary()]
+            if port is not None:
+                ssh.extend(["-p", str(port)])
+            ssh.extend(extra_ssh_options or [])
+            cmd.extend(["-e", " ".join(ssh)])
 
         cmd.extend([source, target])
         return cmd
 
     # Proceed with SCP.
-    try:
-        binary = os.environ["SCP_BINARY"]
-    except:
-        if os.name != "nt":
-            binary = bytes(
-                subprocess.check_output("which scp", shell=True).strip()
-            ).decode("UTF-8")
-        else:
-            raise Exception("SCP binary not provided.")
-    cmd = [binary, "-r"]
+    cmd = [_binary("SCP_BINARY", "scp"), "-r"]
     if port is not None:
         cmd.extend(["-P", port])
+    cmd.extend(extra_ssh_options or [])
     cmd.extend([source, target])
     return cmd
 
@@ -2,10 +2,11 @@
 
 import time
 import socket
+import collections
 
 from testplan.common.utils.sockets.fix.utils import utc_timestamp
 
-from .parser import tagsoverride
+from .parser import Framer, tagsoverride
 
 
 class Client(object):
@@ -78,6 +79,8 @@ class Client(object):
         self.msgclass = msgclass
         self.log_callback = logger.debug if logger else lambda msg: None
         self.codec = codec
+        self._framer = Framer()
+        self._received = collections.deque()
         self.connection_name = "{}:{}:{}_{}{}".format(
             self.sender, self.target, self.sendersub, self.host, self.port
         )
@@ -151,10 +154,21 @@ class Client(object):
     def receive(self, timeout=30):
         """
         Receive a FIX message.
-        """
-        self.socket.settimeout(float(timeout))
-        data = self.socket.recv(4096)
-        return self.msgclass.from_buffer(data, self.codec)
+
+        Messages received together are framed in a batch and returned by
+        the following calls without reading from the socket again.
+        """
+        end_time = time.time() + float(timeout)
+        while not self._received:
+            remaining = end_time - time.time()
+            if remaining <= 0:
+                raise socket.timeout("timed out")
+            self.socket.settimeout(remaining)
+            if not self._framer.recv_from(self.socket):
+                # Connection closed by the server
+                return self.msgclass.from_buffer(b"", self.codec)
+            self._received.extend(self._framer.messages())
+        return self.msgclass.from_buffer(self._received.popleft(), self.codec)
 
     def sendlogoff(self, custom_tags=None):
         """
@@ -2,6 +2,12 @@
 FIX messages parser.
 """
 
+SOH = b"\x01"
+BEGIN_STRING = b"8="
+BODY_LENGTH = b"9="
+CHECKSUM = b"10="
+FRAMER_BUFFER_SIZE = 64 * 1024
+
 
 def tagsoverride(msg, override):
     """
@@ -14,3 +20,154 @@ def tagsoverride(msg, override):
         else:
             msg[tag] = value
     return msg
+
+
+class Framer(object):
+    """
+    Splits the byte stream of a FIX connection into messages.
+
+    Data is received directly into a reusable buffer, which is only grown
+    when a single message does not fit in it. Messages are delimited using
+    the BeginString (8), BodyLength (9) and CheckSum (10) fields, so any
+    number of messages, or part of a message, can be received at once.
+    """
+
+    def __init__(self, buffer_size=FRAMER_BUFFER_SIZE):
+        """
+        :param buffer_size: Initial size of the receive buffer, in bytes.
+        :type buffer_size: ``int``
+        """
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # Start of the data not framed yet
+        self._end = 0  # End of the data received
+
+    @property
+    def pending(self):
+        """Number of bytes received that are not part of a message yet."""
+        return self._end - self._start
+
+    def recv_from(self, sock):
+        """
+        Receive data from a socket with a single ``recv_into`` call.
+
+        :param sock: Socket to receive from.
+        :type sock: ``socket.socket``
+
+        :return: Number of bytes received, ``0`` if the peer has closed the
+          connection.
+        :rtype: ``int``
+        """
+        self._reserve()
+        nbytes = sock.recv_into(self._view[self._end :])
+        self._end += nbytes
+        return nbytes
+
+    def feed(self, data):
+        """
+        Add data received by other means.
+
+        :param data: Received data.
+        :type data: ``bytes``
+        """
+        while data:
+            self._reserve()
+            nbytes = min(len(data), len(self._buffer) - self._end)
+            self._view[self._end : self._end + nbytes] = data[:nbytes]
+            self._end += nbytes
+            data = data[nbytes:]
+
+    def messages(self):
+        """
+        Frame the complete messages received so far.
+
+        :return: Raw messages, in the order they were received.
+        :rtype: ``list`` of ``bytes``
+        """
+        messages = []
+        while True:
+            end = self._message_end()
+            if end is None:
+                break
+            messages.append(self._view[self._start : end].tobytes())
+            self._start = end
+
+        if self._start == self._end:
+            self._start = self._end = 0
+        return messages
+
+    def _message_end(self):
+        """
+        End offset of the message at the start of the pending data, or
+        ``None`` if it has not been fully received yet. Bytes before the
+        BeginString field are discarded.
+        """
+        buf, start, end = self._buffer, self._start, self._end
+
+        if not buf.startswith(BEGIN_STRING, start, end):
+            begin = buf.find(SOH + BEGIN_STRING, start, end)
+            if begin == -1:
+                # Keep a trailing SOH that may precede a BeginString
+                self._start = max(start, end - 1)
+                return None
+            self._start = start = begin + 1
+
+        # BodyLength is the second field, it counts the bytes from the
+        # field following it up to the SOH preceding the CheckSum field
+        length_start = buf.find(SOH, start, end) + 1
+        if length_start == 0:
+            return None
+        body_start = buf.find(SOH, length_start, end) + 1
+        if body_start == 0:
+            return None
+
+        checksum_start = None
+        if buf.startswith(BODY_LENGTH, length_start, body_start):
+            try:
+                checksum_start = body_start + int(
+                    bytes(
+                        buf[length_start + len(BODY_LENGTH) : body_start - 1]
+                    )
+                )
+            except ValueError:
+                pass
+
+        if (
+            checksum_start is not None
+            and checksum_start + len(CHECKSUM) <= end
+        ):
+            if buf.startswith(CHECKSUM, checksum_start, end):
+                return buf.find(SOH, checksum_start, end) + 1 or None
+            # Wrong BodyLength
+            checksum_start = None
+
+        # Missing or wrong BodyLength, look for the CheckSum field instead
+        found = buf.find(SOH + CHECKSUM, body_start - 1, end) + 1
+        if found == 0:
+            return None
+        message_end = buf.find(SOH, found, end) + 1
+        if message_end == 0:
+            return None
+        if checksum_start is None or buf.startswith(
+            BEGIN_STRING, message_end, end
+        ):
+            return message_end
+        # BodyLength points past the data received, only trust the CheckSum
+        # field found if it is followed by another message
+        return None
+
+    def _reserve(self):
+        """Make room at the end of the buffer for more data."""
+        size = len(self._buffer)
+        if self._end < size:
+            return
+        pending = self._end - self._start
+        if pending * 2 > size:
+            # A single message fills most of the buffer, grow it
+            buffer = bytearray(size * 2)
+            buffer[:pending] = self._view[self._start : self._end]
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+        else:
+            self._buffer[:pending] = self._buffer[self._start : self._end]
+        self._start, self._end = 0, pending
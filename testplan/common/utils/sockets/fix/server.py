@@ -13,6 +13,8 @@ from testplan.common.utils.timing import (
 )
 from testplan.common.utils.sockets.fix.utils import utc_timestamp
 
+from .parser import Framer
+
 
 class ConnectionDetails(object):
     """
@@ -42,6 +44,7 @@ class ConnectionDetails(object):
         self.queue = queue
         self.in_seqno = in_seqno
         self.out_seqno = out_seqno
+        self.framer = Framer()
 
 
 def _has_logon_tag(msg):
@@ -301,20 +304,25 @@ class Server(object):
         :param event: Event received from connection.
         :type event: ``.int``
         """
-        connection = self._conndetails_by_fd[fdesc].connection
+        conndetails = self._conndetails_by_fd[fdesc]
+        connection = conndetails.connection
         if event == select.POLLIN:
             with self._lock:
-                data = connection.recv(4096)
-                if not data:
+                if not conndetails.framer.recv_from(connection):
                     self.log_callback(
                         "Closing connection {} since no data available".format(
-                            self._conndetails_by_fd[fdesc].name
+                            conndetails.name
                         )
                     )
                     self._remove_connection(fdesc)
-                else:
+                    return
+                # All the messages received at once are processed together
+                for data in conndetails.framer.messages():
                     msg = self.msgclass.from_buffer(data, self.codec)
                     self._process_message(fdesc, msg)
+                    if fdesc not in self._conndetails_by_fd:
+                        # Connection closed after a logout
+                        break
         elif event in [select.POLLNVAL, select.POLLHUP]:
             self.log_callback(
                 "Closing connection {} event received".format(connection.name)
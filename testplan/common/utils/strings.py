@@ -13,8 +13,6 @@ import colorama
 colorama.init()
 from termcolor import colored
 
-from reportlab.pdfbase.pdfmetrics import stringWidth
-
 
 _DESCRIPTION_CUTOFF_REGEX = re.compile(r"^(\s|\t)+")
 
@@ -132,6 +130,13 @@ def wrap(text, width=150):
     return os.linesep.join(result)
 
 
+def _string_width(text, font_name, font_size):
+    """Width of text in a font, reportlab is only imported when needed."""
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    return stringWidth(text, font_name, font_size)
+
+
 def split_line(line, max_width, get_width_func=None):
     """
     Split `line` into multi-lines if width exceeds `max_width`.
@@ -148,7 +153,7 @@ def split_line(line, max_width, get_width_func=None):
     get_text_width = (
         get_width_func
         if get_width_func
-        else lambda text: stringWidth(text, "Helvetica", 9)
+        else lambda text: _string_width(text, "Helvetica", 9)
     )
 
     for ch in line:
@@ -185,7 +190,7 @@ def split_text(
     """
 
     def get_text_width(text, name=font_name, size=font_size):
-        return stringWidth(text, name, size)
+        return _string_width(text, name, size)
 
     result = []
     lines = [line for line in re.split(r"[\r\n]+", text) if line]
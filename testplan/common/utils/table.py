@@ -1,8 +1,98 @@
 """Utilities for working with tables."""
+import io
+import sys
+import gzip
+import json
 import six
 import collections
 
 
+def is_dataframe(obj):
+    """
+    Check if ``obj`` is a ``pandas.DataFrame``. Pandas is an optional
+    dependency, so we use duck typing instead of importing it.
+    """
+    return type(obj).__name__ == "DataFrame" and hasattr(obj, "iloc")
+
+
+def native(value):
+    """Convert NumPy scalars to the equivalent native python object."""
+    # NumPy scalars only exist once NumPy is imported, which is not worth
+    # doing here just for this check
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(value, numpy.generic):
+        return value.item()
+    return value
+
+
+def table_columns(table):
+    """
+    Return the column names of a ``list`` of ``dict`` table or a
+    ``pandas.DataFrame``.
+
+    :param table: Tabular data.
+    :type table: ``list`` of ``dict`` or ``pandas.DataFrame``
+    :return: Column names.
+    :rtype: ``list`` of ``str``
+    """
+    if is_dataframe(table):
+        return list(table.columns)
+    return list(table[0].keys()) if table else []
+
+
+def column_values(table, column):
+    """
+    Return all values of a single column. ``pandas.DataFrame`` columns are
+    returned as NumPy arrays without copying the underlying data.
+
+    :param table: Tabular data.
+    :type table: ``list`` of ``dict`` or ``pandas.DataFrame``
+    :param column: Column name.
+    :type column: ``str``
+    :return: Column values.
+    :rtype: ``list`` or ``numpy.ndarray``
+    """
+    if is_dataframe(table):
+        return table[column].values
+    return [row[column] for row in table]
+
+
+def get_row(table, idx):
+    """
+    Return a single row of the table as a ``dict``.
+
+    :param table: Tabular data.
+    :type table: ``list`` of ``dict`` or ``pandas.DataFrame``
+    :param idx: Row index.
+    :type idx: ``int``
+    :return: Row of the table.
+    :rtype: ``dict``
+    """
+    if is_dataframe(table):
+        return collections.OrderedDict(
+            (column, native(table[column].values[idx]))
+            for column in table.columns
+        )
+    return table[idx]
+
+
+def iter_rows(table):
+    """
+    Iterate over the rows of the table as ``dict`` objects.
+
+    :param table: Tabular data.
+    :type table: ``list`` of ``dict`` or ``pandas.DataFrame``
+    :return: Iterator of rows.
+    :rtype: ``iterator`` of ``dict``
+    """
+    if not is_dataframe(table):
+        return iter(table)
+
+    columns = list(table.columns)
+    values = [table[column].tolist() for column in columns]
+    return (collections.OrderedDict(zip(columns, row)) for row in zip(*values))
+
+
 class TableEntry(object):
     """
     Represents a table. Internally represented either
@@ -138,3 +228,91 @@ class TableEntry(object):
             formatted_table = table
 
         return formatted_table
+
+
+class ColumnarWriter(object):
+    """
+    Write table rows to a gzip compressed, column oriented JSON lines file.
+
+    The first line is a header with the column names and chunk size, every
+    following line holds up to ``chunk_size`` rows as a mapping of column
+    name to the list of values of that column. Readers can page through
+    the file one chunk at a time without loading the whole table.
+
+    Values that are not JSON serializable are stored as their ``repr``.
+    """
+
+    def __init__(self, path, columns, chunk_size=1000):
+        self.path = path
+        self.columns = list(columns)
+        self.chunk_size = chunk_size
+        self.num_rows = 0
+        self._chunk = [[] for _ in self.columns]
+        self._file = None
+
+    def open(self):
+        """Open the file and write the header."""
+        self._file = io.TextIOWrapper(
+            gzip.open(self.path, "wb"), encoding="utf-8"
+        )
+        self._write_line(
+            {"columns": self.columns, "chunk_size": self.chunk_size}
+        )
+
+    def write(self, values):
+        """
+        Append a single row.
+
+        :param values: Row values, in the same order as ``columns``.
+        :type values: ``list``
+        """
+        for column, value in zip(self._chunk, values):
+            column.append(value)
+        self.num_rows += 1
+
+        if len(self._chunk[0]) >= self.chunk_size:
+            self._flush()
+
+    def close(self):
+        """Write any pending rows and close the file."""
+        if self._file is not None:
+            if self._chunk and self._chunk[0]:
+                self._flush()
+            self._file.close()
+            self._file = None
+
+    def _flush(self):
+        self._write_line(dict(zip(self.columns, self._chunk)))
+        self._chunk = [[] for _ in self.columns]
+
+    def _write_line(self, obj):
+        self._file.write(six.text_type(json.dumps(obj, default=repr)))
+        self._file.write(u"\n")
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_columnar(path):
+    """
+    Read a file written by ``ColumnarWriter``.
+
+    :param path: Path of the compressed table file.
+    :type path: ``str``
+    :return: Column names and an iterator of chunks, each chunk being
+             a ``dict`` of column name to ``list`` of values.
+    :rtype: ``tuple`` of ``list`` and ``iterator`` of ``dict``
+    """
+    source = io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8")
+    header = json.loads(source.readline())
+
+    def chunks():
+        with source:
+            for line in source:
+                yield json.loads(line)
+
+    return header["columns"], chunks()
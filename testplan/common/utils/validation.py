@@ -2,7 +2,6 @@
 This module contains helper validation functions
 to be used with configuration schemas.
 """
-import validators
 
 
 def is_subclass(parent_kls):
@@ -35,8 +34,12 @@ def has_method(method_name):
 
 def is_valid_url(url):
     """Validator that checks if a url is valid"""
+    import validators
+
     return bool(validators.url(url))
 
 
 def is_valid_email(email):
+    import validators
+
     return bool(validators.email(email))
@@ -7,6 +7,11 @@ SUMMARY_NUM_PASSING = 5
 SUMMARY_NUM_FAILING = 5
 SUMMARY_KEY_COMB_LIMIT = 10  # Number of failed key combinations to summary.
 
+# Tables with more rows than this are written to a compressed attachment,
+# only failing rows and a sample of the first rows are kept in the report.
+TABLE_SPILL_THRESHOLD = 10000
+TABLE_SPILL_SAMPLE = 100
+
 # Make sure these values match the defaults in the parser.py,
 # otherwise we may end up with inconsistent behaviour re. defaults
 # between cmdline and programmatic calls.
@@ -1,6 +1,59 @@
+"""
+Test report exporters.
+
+Exporters pull in heavy dependencies (reportlab, matplotlib, lxml, flask),
+so on Python 3.7+ each of them is only imported when first accessed.
+"""
+
+import importlib
+import sys
+
 from .base import Exporter, save_attachments
-from .pdf import PDFExporter, TagFilteredPDFExporter
-from .xml import XMLExporter
-from .json import JSONExporter
-from .http import HTTPExporter
-from .webserver import WebServerExporter
+
+# Exporter name -> module defining it
+EXPORTERS = {
+    "PDFExporter": ".pdf",
+    "TagFilteredPDFExporter": ".pdf",
+    "XMLExporter": ".xml",
+    "JSONExporter": ".json",
+    "HTTPExporter": ".http",
+    "WebServerExporter": ".webserver",
+}
+
+__all__ = ["Exporter", "save_attachments", "get_exporter"] + sorted(EXPORTERS)
+
+
+def get_exporter(name):
+    """
+    Import an exporter class by name.
+
+    :param name: Name of the exporter class, e.g. ``PDFExporter``.
+    :type name: ``str``
+    :return: Exporter class.
+    :rtype: ``type``
+    """
+    module = importlib.import_module(EXPORTERS[name], __name__)
+    return getattr(module, name)
+
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name in EXPORTERS:
+            exporter = get_exporter(name)
+            globals()[name] = exporter
+            return exporter
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+
+    def __dir__():
+        return sorted(set(globals()) | set(EXPORTERS))
+
+
+else:
+    from .pdf import PDFExporter, TagFilteredPDFExporter
+    from .xml import XMLExporter
+    from .json import JSONExporter
+    from .http import HTTPExporter
+    from .webserver import WebServerExporter
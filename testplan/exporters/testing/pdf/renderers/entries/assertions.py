@@ -716,7 +716,8 @@ class TableMatchRenderer(AssertionRenderer):
                 table=raw_table,
                 columns=source["columns"],
                 row_indices=row_indices,
-                display_index=source["report_fails_only"],
+                display_index=source["report_fails_only"]
+                or bool(source.get("spill")),
                 max_width=max_width,
                 style=table_style,
                 colour_matrix=colour_matrix,
@@ -256,12 +256,14 @@ class XMLExporter(Exporter):
             files.add(filename)
             file_path = os.path.join(xml_dir, filename)
 
-            # If a report has XML string attribute it was mostly
+            # If a report has XML path or string attribute it was mostly
             # generated via parsing a JUnit compatible XML file
             # already, meaning we don't need to re-generate the XML
             # contents, but can directly write the contents to a file
             # instead.
-            if hasattr(child_report, "xml_string"):
+            if hasattr(child_report, "xml_path"):
+                shutil.copyfile(child_report.xml_path, file_path)
+            elif hasattr(child_report, "xml_string"):
                 with open(file_path, "w") as xml_target:
                     xml_target.write(child_report.xml_string)
             else:
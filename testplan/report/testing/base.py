@@ -64,6 +64,8 @@ from testplan.common.report import (
 from testplan.common.utils import timing
 from testplan.testing import tagging
 
+from .spill import SpilledEntries
+
 
 class RuntimeStatus(object):
     """
@@ -869,11 +871,27 @@ class TestCaseReport(Report):
             self._status = Status.PASSED
 
     def _assertions_status(self):
+        if isinstance(self.entries, SpilledEntries):
+            # Failing entries of a spill file are kept in memory
+            return Status.FAILED if self.entries.num_failing else Status.PASSED
         for entry in self:
             if entry.get("passed") is False:
                 return Status.FAILED
         return Status.PASSED
 
+    def extend(self, items):
+        """
+        Extend ``self.entries`` with ``items``. Spilled entries are kept
+        as they are if the report has no entries yet, so that they are
+        not loaded in memory.
+        """
+        if isinstance(items, SpilledEntries) and not self.entries:
+            self.entries = items
+            return
+        if isinstance(self.entries, SpilledEntries):
+            self.entries = list(self.entries)
+        super(TestCaseReport, self).extend(items)
+
     def merge(self, report, strict=True):
         """
         TestCaseReport merge overwrites everything in place, as assertions of
@@ -939,14 +957,12 @@ class TestCaseReport(Report):
         :return: a hash of all entries in this report group.
         :rtype: ``int``
         """
-        return hash(
-            (
-                self.uid,
-                self.status,
-                self.runtime_status,
-                tuple(id(entry) for entry in self.entries),
-            )
-        )
+        if isinstance(self.entries, SpilledEntries):
+            # Spilled entries are read again on each iteration
+            entries = (self.entries.path, len(self.entries))
+        else:
+            entries = tuple(id(entry) for entry in self.entries)
+        return hash((self.uid, self.status, self.runtime_status, entries))
 
     def xfail(self, strict):
         """
@@ -0,0 +1,188 @@
+"""
+Spilling of serialized testcase entries to JSON lines files, so that
+testcases logging a large number of entries run in bounded memory.
+
+:py:class:`EntrySpill` is used by the ``Result`` object of a testcase, it
+serializes entries as they are added and appends them to the spill file.
+Once the testcase has finished, it is converted to a
+:py:class:`SpilledEntries` sequence which becomes the ``entries`` of the
+``TestCaseReport``, and reads the spill file lazily on iteration.
+
+Only the number of entries and the failing entries are kept in memory.
+Note that the JSON exporter still reads all the spilled entries into memory,
+as the report schema serializes ``entries`` with a ``fields.List``.
+
+Spill files are local to the process running the testcases, MultiTest does
+not spill entries on the workers of a remote pool.
+"""
+
+import io
+import itertools
+import json
+
+import six
+
+
+def _entries_field():
+    # Imported here as the report schemas depend on the report classes.
+    from .schemas import EntriesField
+
+    return EntriesField()
+
+
+def _dumps(data):
+    """Entry data to JSON, bytes are encoded like the JSON exporter does."""
+    try:
+        return json.dumps(data, ensure_ascii=True)
+    except (UnicodeDecodeError, TypeError):
+        return json.dumps(
+            _entries_field()._serialize(data, None, None), ensure_ascii=True
+        )
+
+
+def _loads(line):
+    """Entry data from JSON, decoding any bytes encoded by ``_dumps``."""
+    data = json.loads(line)
+    if u'"_BYTES_KEY"' in line:
+        data = _entries_field()._deserialize(data, None, None)
+    return data
+
+
+class SpilledEntries(object):
+    """
+    Read-only sequence of serialized entries stored in a spill file,
+    entries are read from the file each time the sequence is iterated.
+
+    :param path: Path of the JSON lines spill file.
+    :type path: ``str``
+    :param num_entries: Number of entries in the file.
+    :type num_entries: ``int``
+    :param failing: Serialized entries that did not pass.
+    :type failing: ``list`` of ``dict``
+    """
+
+    def __init__(self, path, num_entries, failing):
+        self.path = path
+        self.num_entries = num_entries
+        self.failing = failing
+
+    @property
+    def num_failing(self):
+        """Number of entries that did not pass."""
+        return len(self.failing)
+
+    def __iter__(self):
+        with io.open(self.path, "r", encoding="utf-8") as spill_file:
+            for line in spill_file:
+                yield _loads(line)
+
+    def __len__(self):
+        return self.num_entries
+
+    def __bool__(self):
+        return self.num_entries > 0
+
+    __nonzero__ = __bool__
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return list(self)[key]
+        if key < 0:
+            key += self.num_entries
+        if not 0 <= key < self.num_entries:
+            raise IndexError("Spilled entry index out of range")
+        return next(itertools.islice(self, key, None))
+
+    def __eq__(self, other):
+        if isinstance(other, SpilledEntries) and other.path == self.path:
+            return True
+        try:
+            return len(self) == len(other) and all(
+                entry == other_entry
+                for entry, other_entry in six.moves.zip(self, other)
+            )
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{}(path={!r}, num_entries={}, num_failing={})".format(
+            self.__class__.__name__,
+            self.path,
+            self.num_entries,
+            self.num_failing,
+        )
+
+
+class EntrySpill(object):
+    """
+    Serializes entries as they are appended and writes them to a JSON
+    lines spill file, one entry per line.
+
+    :param path: Path of the spill file, created on the first append.
+    :type path: ``str``
+    :param serialize: Callable converting an entry object into a ``dict``.
+    :type serialize: ``callable``
+    """
+
+    def __init__(self, path, serialize):
+        self.path = path
+        self.serialize = serialize
+        self.num_entries = 0
+        self.failing = []
+        self._file = None
+
+    def append(self, entry):
+        """Serialize an entry and append it to the spill file."""
+        data = self.serialize(entry)
+        if self._file is None:
+            self._file = io.open(self.path, "w", encoding="utf-8")
+        self._file.write(six.text_type(_dumps(data)))
+        self._file.write(u"\n")
+
+        self.num_entries += 1
+        if data.get("passed") is False:
+            self.failing.append(data)
+
+    def extend(self, entries):
+        """Serialize and append several entries."""
+        for entry in entries:
+            self.append(entry)
+
+    @property
+    def passed(self):
+        """``False`` if any of the appended entries did not pass."""
+        return not self.failing
+
+    def close(self):
+        """
+        Close the spill file.
+
+        :return: The spilled entries.
+        :rtype: :py:class:`SpilledEntries`
+        """
+        if self._file is None:
+            # Create an empty file so that readers can always open it
+            self._file = io.open(self.path, "w", encoding="utf-8")
+        self._file.close()
+        return SpilledEntries(self.path, self.num_entries, self.failing)
+
+    def __iter__(self):
+        """Serialized entries written so far."""
+        if self._file is None:
+            return iter([])
+        if not self._file.closed:
+            self._file.flush()
+        return iter(SpilledEntries(self.path, self.num_entries, self.failing))
+
+    def __len__(self):
+        return self.num_entries
+
+    def __repr__(self):
+        return "{}(path={!r}, num_entries={})".format(
+            self.__class__.__name__, self.path, self.num_entries
+        )
@@ -1,6 +1,7 @@
 """Tests runner module."""
 
 import os
+import sys
 import random
 import time
 import uuid
@@ -9,6 +10,7 @@ from collections import OrderedDict
 
 from schema import Or, And, Use
 
+import testplan
 from testplan import defaults
 from testplan.common.utils import logger
 from testplan.common.config import ConfigOption
@@ -21,8 +23,8 @@ from testplan.common.entity import (
 )
 from testplan.common.exporters import BaseExporter, ExporterResult
 from testplan.common.report import MergeError
-from testplan.common.utils.path import default_runpath
-from testplan.exporters import testing as test_exporters
+from testplan.common.utils.path import default_runpath, default_pycache_dir
+from testplan.exporters.testing import Exporter, get_exporter
 from testplan.report import (
     TestReport,
     TestGroupReport,
@@ -30,10 +32,11 @@ from testplan.report import (
     ReportCategories,
 )
 from testplan.report.testing.styles import Style
-from testplan.runnable.interactive import TestRunnerIHandler
+
+# Imports multitest before testing.base, that multitest depends on
+from testplan.testing import listing, filtering, ordering, tagging
 from testplan.runners.base import Executor
 from testplan.runners.pools.tasks import Task, TaskResult
-from testplan.testing import listing, filtering, ordering, tagging
 from testplan.testing.base import TestResult
 
 
@@ -44,17 +47,19 @@ def get_default_exporters(config):
     """
     result = []
     if config.pdf_path:
-        result.append(test_exporters.PDFExporter())
+        result.append(get_exporter("PDFExporter")())
     if config.report_tags or config.report_tags_all:
-        result.append(test_exporters.TagFilteredPDFExporter())
+        result.append(get_exporter("TagFilteredPDFExporter")())
     if config.json_path:
-        result.append(test_exporters.JSONExporter())
+        result.append(get_exporter("JSONExporter")())
     if config.xml_dir:
-        result.append(test_exporters.XMLExporter())
+        result.append(get_exporter("XMLExporter")())
     if config.http_url:
-        result.append(test_exporters.HTTPExporter())
+        result.append(get_exporter("HTTPExporter")())
     if config.ui_port is not None:
-        result.append(test_exporters.WebServerExporter(ui_port=config.ui_port))
+        result.append(
+            get_exporter("WebServerExporter")(ui_port=config.ui_port)
+        )
     return result
 
 
@@ -171,10 +176,9 @@ class TestRunnerConfig(RunnableConfig):
             ConfigOption("timeout", default=None): Or(
                 None, And(Or(int, float), lambda t: t >= 0)
             ),
-            ConfigOption(
-                "interactive_handler", default=TestRunnerIHandler
-            ): object,
+            ConfigOption("interactive_handler", default=None): object,
             ConfigOption("extra_deps", default=[]): list,
+            ConfigOption("bytecode_cache", default=False): Or(bool, str),
         }
 
 
@@ -284,11 +288,18 @@ class TestRunner(Runnable):
     :type debug: ``bool``
     :param timeout: Timeout value for test execution.
     :type timeout: ``NoneType`` or ``int`` or ``float`` greater than 0.
-    :param interactive_handler: Handler for interactive mode execution.
+    :param interactive_handler: Handler for interactive mode execution,
+        defaults to :py:class:`TestRunnerIHandler
+        <testplan.runnable.interactive.TestRunnerIHandler>`.
     :type interactive_handler: Subclass of :py:class:
         `TestRunnerIHandler <testplan.runnable.interactive.TestRunnerIHandler>`
     :param extra_deps: Extra module dependencies for interactive reload.
     :type extra_deps: ``list`` of ``module``
+    :param bytecode_cache: Cache the bytecode of the modules imported by
+        testplan and its worker processes, in the given directory or in a
+        directory next to the default runpaths if ``True``, instead of
+        compiling them in every process. Requires Python 3.8+.
+    :type bytecode_cache: ``bool`` or ``str``
 
     Also inherits all
     :py:class:`~testplan.common.entity.base.Runnable` options.
@@ -309,6 +320,7 @@ class TestRunner(Runnable):
         self._web_server_thread = None
         self._file_log_handler = None
         self._configure_stdout_logger()
+        self._configure_bytecode_cache()
 
     @property
     def report(self):
@@ -331,6 +343,17 @@ class TestRunner(Runnable):
                 exporter.parent = self
         return self._exporters
 
+    def _interactive_handler_class(self):
+        """
+        Class of the handler for interactive mode execution, the default
+        one is only imported when needed as it pulls in the web server.
+        """
+        if self.cfg.interactive_handler is None:
+            from testplan.runnable.interactive import TestRunnerIHandler
+
+            return TestRunnerIHandler
+        return self.cfg.interactive_handler
+
     def add_environment(self, env, resource=None):
         """
         Adds an environment to the target resource holder.
@@ -713,7 +736,7 @@ class TestRunner(Runnable):
             self._result.test_report.bubble_up_attachments()
 
         for exporter in self.exporters:
-            if isinstance(exporter, test_exporters.Exporter):
+            if isinstance(exporter, Exporter):
                 exp_result = ExporterResult.run_exporter(
                     exporter=exporter,
                     source=self._result.test_report,
@@ -758,6 +781,27 @@ class TestRunner(Runnable):
         """Configure the stdout logger by setting the required level."""
         logger.STDOUT_HANDLER.setLevel(self.cfg.logger_level)
 
+    def _configure_bytecode_cache(self):
+        """
+        Cache the bytecode of the modules imported from now on, by this
+        process and by the worker processes it starts, in a shared directory.
+        """
+        if not self.cfg.bytecode_cache:
+            return
+        if not hasattr(sys, "pycache_prefix"):
+            self.logger.warning("Bytecode cache requires Python 3.8 or later")
+            return
+
+        if self.cfg.bytecode_cache is True:
+            pycache_dir = default_pycache_dir()
+        else:
+            pycache_dir = os.path.abspath(self.cfg.bytecode_cache)
+        self.logger.debug("Bytecode cache: %s", pycache_dir)
+
+        sys.pycache_prefix = pycache_dir
+        sys.dont_write_bytecode = False
+        os.environ[testplan.TESTPLAN_PYCACHE_PREFIX] = pycache_dir
+
     def _configure_file_logger(self):
         """
         Configure the file logger to the specified log levels. A log file
@@ -1,4 +1,6 @@
 """Worker pool executor base classes."""
+import collections
+import csv
 import numbers
 import os
 import threading
@@ -7,6 +9,7 @@ import datetime
 import pprint
 import traceback
 
+import psutil
 from schema import Or, And
 
 from testplan.common.config import ConfigOption, validate_func
@@ -200,6 +203,117 @@ def default_check_reschedule(pool, task_result):
     return False
 
 
+class _TaskQueue(object):
+    """
+    Queue of unassigned task uids, also indexed by task affinity so that the
+    first task of an affinity is found without scanning the whole queue.
+
+    Entries are ``(position, uid, affinity)`` tuples, an entry taken from
+    the head of its affinity is left in the queue and skipped once it
+    reaches the head, and vice versa.
+
+    Tasks are appended from the main, loop and monitor threads, so every
+    operation holds the queue lock. Entries are only taken by the pool loop,
+    an entry returned by :py:meth:`first` or :py:meth:`first_of` is still
+    queued when it is passed to :py:meth:`pop`.
+
+    :param get_affinity: Returns the affinity of a task uid.
+    :type get_affinity: ``callable``
+    """
+
+    def __init__(self, get_affinity):
+        self._get_affinity = get_affinity
+        self._lock = threading.Lock()
+        self._entries = collections.deque()
+        self._affinities = collections.OrderedDict()  # affinity: entries
+        self._taken = set()  # positions of entries taken out of order
+        self._position = 0
+        self._size = 0
+
+    def append(self, uid):
+        """Add a task uid at the end of the queue."""
+        affinity = self._get_affinity(uid)
+        with self._lock:
+            entry = (self._position, uid, affinity)
+            self._position += 1
+            self._size += 1
+            self._entries.append(entry)
+            self._affinities.setdefault(affinity, collections.deque()).append(
+                entry
+            )
+
+    def _head(self, entries):
+        while entries and entries[0][0] in self._taken:
+            self._taken.remove(entries.popleft()[0])
+        return entries[0] if entries else None
+
+    def first(self):
+        """
+        First entry of the queue.
+
+        :return: Queue entry, ``None`` if the queue is empty.
+        :rtype: ``tuple`` or ``NoneType``
+        """
+        with self._lock:
+            return self._head(self._entries)
+
+    def first_of(self, affinity):
+        """
+        First entry of the queue with the given affinity.
+
+        :return: Queue entry, ``None`` if there is no such task.
+        :rtype: ``tuple`` or ``NoneType``
+        """
+        with self._lock:
+            entries = self._affinities.get(affinity)
+            if entries is None:
+                return None
+            entry = self._head(entries)
+            if entry is None:
+                del self._affinities[affinity]
+            return entry
+
+    def affinities(self):
+        """Affinities of the queued tasks."""
+        with self._lock:
+            return list(self._affinities)
+
+    def pop(self, entry):
+        """
+        Take an entry returned by :py:meth:`first` or :py:meth:`first_of`
+        out of the queue.
+
+        :return: Task uid.
+        :rtype: ``str``
+        """
+        position, uid, affinity = entry
+        with self._lock:
+            entries = self._affinities[affinity]
+            for queue in (self._entries, entries):
+                if queue[0] is entry:
+                    queue.popleft()
+                else:
+                    self._taken.add(position)
+            if not entries:
+                del self._affinities[affinity]
+            self._size -= 1
+        return uid
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    __nonzero__ = __bool__
+
+    def __iter__(self):
+        with self._lock:
+            entries = list(self._entries)
+            taken = set(self._taken)
+        return (uid for position, uid, _ in entries if position not in taken)
+
+
 class PoolConfig(ExecutorConfig):
     """
     Configuration object for
@@ -222,6 +336,14 @@ class PoolConfig(ExecutorConfig):
             ConfigOption("task_retries_limit", default=3): int,
             ConfigOption("max_active_loop_sleep", default=5): numbers.Number,
             ConfigOption("restart_count", default=3): int,
+            ConfigOption("autoscale", default=False): bool,
+            ConfigOption("min_size", default=1): And(int, lambda x: x > 0),
+            ConfigOption("max_size", default=None): Or(
+                None, And(int, lambda x: x > 0)
+            ),
+            ConfigOption("autoscale_interval", default=2): numbers.Number,
+            ConfigOption("max_cpu_load", default=90): numbers.Number,
+            ConfigOption("max_memory_load", default=90): numbers.Number,
         }
 
 
@@ -245,12 +367,42 @@ class Pool(Executor):
     :type max_active_loop_sleep: ``int`` or ``float``
     :param restart_count: How many times the pool had restarted.
     :type restart_count: ``int``
+    :param autoscale: Start as many workers as there are tasks, within
+        ``min_size`` and ``size``, then add and remove workers during the
+        run depending on the queue of unassigned tasks, their latency and
+        the host load. Scaling decisions are logged and written to
+        ``autoscale.csv`` in the pool runpath.
+    :type autoscale: ``bool``
+    :param min_size: Minimum number of workers when autoscaling.
+    :type min_size: ``int``
+    :param max_size: Maximum number of workers when autoscaling, defaults to
+        ``size``.
+    :type max_size: ``int`` or ``NoneType``
+    :param autoscale_interval: Period of the scaling decisions in seconds.
+    :type autoscale_interval: ``int`` or ``float``
+    :param max_cpu_load: Host CPU usage percentage above which no worker is
+        added and idle workers are removed.
+    :type max_cpu_load: ``int`` or ``float``
+    :param max_memory_load: Host memory usage percentage above which no worker
+        is added and idle workers are removed.
+    :type max_memory_load: ``int`` or ``float``
 
     Also inherits all :py:class:`~testplan.runners.base.Executor` options.
     """
 
     CONFIG = PoolConfig
     CONN_MANAGER = QueueServer
+    AUTOSCALE_FIELDS = (
+        "time",
+        "workers",
+        "target",
+        "queued",
+        "busy",
+        "latency",
+        "cpu",
+        "memory",
+        "reason",
+    )
 
     def __init__(
         self,
@@ -262,12 +414,26 @@ class Pool(Executor):
         task_retries_limit=3,
         max_active_loop_sleep=5,
         restart_count=3,
+        autoscale=False,
+        min_size=1,
+        max_size=None,
+        autoscale_interval=2,
+        max_cpu_load=90,
+        max_memory_load=90,
         **options
     ):
         options.update(self.filter_locals(locals()))
         super(Pool, self).__init__(**options)
-        self.unassigned = []  # unassigned tasks
+        self.unassigned = _TaskQueue(lambda uid: self._input[uid].affinity)
         self.task_assign_cnt = {}  # uid: times_assigned
+        self.autoscale_history = []  # scaling decisions, see AUTOSCALE_FIELDS
+        self._num_added_workers = 0
+        self._retiring = set()  # uids of workers being removed
+        self._retired = set()  # uids of workers told to stop
+        self._assign_times = {}  # uid: time assigned to a worker
+        self._affinity_workers = {}  # affinity: uid of last worker assigned
+        self._worker_affinities = {}  # worker uid: affinities assigned last
+        self._task_latencies = collections.deque(maxlen=20)
         self.should_reschedule = default_check_reschedule
         self._workers = entity.Environment(parent=self)
         self._workers_last_result = {}
@@ -339,6 +505,14 @@ class Pool(Executor):
             self._worker_monitor.daemon = True
             self._worker_monitor.start()
 
+        if self.cfg.autoscale:
+            self.logger.debug("Starting worker autoscaling thread.")
+            self._worker_autoscaler = threading.Thread(
+                target=self._workers_autoscaling
+            )
+            self._worker_autoscaler.daemon = True
+            self._worker_autoscaler.start()
+
         while self.active and not self._exit_loop:
             msg = self._conn.accept()
             if msg:
@@ -398,16 +572,27 @@ class Pool(Executor):
             cfg = cfg.parent
 
         worker.respond(response.make(Message.ConfigSending, data=options))
+        # Child process workers request their config once they are connected
+        if worker.status.tag == worker.STATUS.STARTING:
+            worker.last_heartbeat = time.time()
+            worker.status.change(worker.STATUS.STARTED)
 
     def _handle_taskpull_request(self, worker, request, response):
         """Handle a TaskPullRequest from a worker."""
         tasks = []
 
+        if worker.uid() in self._retiring:
+            if worker.assigned:
+                worker.respond(response.make(Message.Ack))
+            else:
+                self._retired.add(worker.uid())
+                worker.respond(response.make(Message.Stop))
+            return
+
         if self.status.tag == self.status.STARTED:
             for _ in range(request.data):
-                try:
-                    uid = self.unassigned.pop(0)
-                except IndexError:
+                uid = self._next_task(worker)
+                if uid is None:
                     break
                 if uid not in self.task_assign_cnt:
                     self.task_assign_cnt[uid] = 0
@@ -426,6 +611,9 @@ class Pool(Executor):
                         "Scheduling {} to {}".format(task, worker)
                     )
                     worker.assigned.add(uid)
+                    self._assign_times[uid] = time.time()
+                    if task.affinity is not None:
+                        self._assign_affinity(task.affinity, worker)
                     tasks.append(task)
             if tasks:
                 worker.respond(response.make(Message.TaskSending, data=tasks))
@@ -435,12 +623,73 @@ class Pool(Executor):
         worker.requesting = request.data
         worker.respond(response.make(Message.Ack))
 
+    def _next_task(self, worker):
+        """
+        Pop the unassigned task to schedule to a worker. The first task with
+        the affinity of a task last scheduled to the worker is preferred, so
+        that it runs where its modules are already imported. Otherwise, the
+        first task that no other idle worker has the affinity of, as busy
+        workers cannot take their tasks. The tasks left for idle workers are
+        stolen when there is no other one.
+
+        :param worker: Worker requesting tasks.
+        :type worker: :py:class:`~testplan.runners.pools.base.Worker`
+        :return: Task uid, ``None`` if there is no unassigned task.
+        :rtype: ``str`` or ``NoneType``
+        """
+        if not self.unassigned:
+            return None
+
+        entry = None
+        for affinity in self._worker_affinities.get(worker.uid(), ()):
+            first = self.unassigned.first_of(affinity)
+            if first is not None and (entry is None or first < entry):
+                entry = first
+        if entry is not None:
+            return self.unassigned.pop(entry)
+
+        idle = set(
+            other.uid()
+            for other in list(self._workers)
+            if other is not worker
+            and not other.assigned
+            and other.status.tag == other.STATUS.STARTED
+            and other.uid() not in self._retiring
+        )
+        entry = self.unassigned.first()
+        if self._affinity_workers.get(entry[2]) in idle:
+            # Only look at the first task of each affinity, the others are
+            # owned by the same worker
+            firsts = [
+                self.unassigned.first_of(affinity)
+                for affinity in self.unassigned.affinities()
+                if self._affinity_workers.get(affinity) not in idle
+            ]
+            entry = min(
+                [first for first in firsts if first is not None] or [entry]
+            )
+        return self.unassigned.pop(entry)
+
+    def _assign_affinity(self, affinity, worker):
+        """Record the worker that a task of an affinity was assigned to."""
+        previous = self._affinity_workers.get(affinity)
+        if previous == worker.uid():
+            return
+        if previous is not None:
+            self._worker_affinities[previous].discard(affinity)
+        self._affinity_workers[affinity] = worker.uid()
+        self._worker_affinities.setdefault(worker.uid(), set()).add(affinity)
+
     def _handle_taskresults(self, worker, request, response):
         """Handle a TaskResults message from a worker."""
         worker.respond(response.make(Message.Ack))
         for task_result in request.data:
             uid = task_result.task.uid()
             worker.assigned.remove(uid)
+            if uid in self._assign_times:
+                self._task_latencies.append(
+                    time.time() - self._assign_times.pop(uid)
+                )
             if worker not in self._workers_last_result:
                 self._workers_last_result[worker] = time.time()
             self.logger.test_info(
@@ -524,7 +773,9 @@ class Pool(Executor):
 
             hosts_status = {"active": [], "inactive": [], "initializing": []}
 
-            for worker in self._workers:
+            for worker in list(self._workers):
+                if worker.uid() in self._retiring:
+                    continue
                 status, reason = self._query_worker_status(worker)
                 if status == "inactive":
                     with self._pool_lock:
@@ -684,20 +935,221 @@ class Pool(Executor):
         else:
             self.logger.test_info("{} -> {}".format(name, Color.red("Fail")))
 
+    def _size_limits(self):
+        """Minimum and maximum number of workers when autoscaling."""
+        max_size = self.cfg.max_size or self.cfg.size
+        return min(self.cfg.min_size, max_size), max_size
+
+    def _add_worker(self):
+        """Initialise a worker instance, indexed after the previous ones."""
+        idx = str(self._num_added_workers)
+        self._num_added_workers += 1
+        worker = self.cfg.worker_type(
+            index=idx, restart_count=self.cfg.restart_count
+        )
+        worker.parent = self
+        worker.cfg.parent = self.cfg
+        self._workers.add(worker, uid=idx)
+
+        self.logger.debug(
+            "Added worker %(index)s (outfile = %(outfile)s)",
+            {"index": idx, "outfile": worker.outfile},
+        )
+        return worker
+
     def _add_workers(self):
         """Initialise worker instances."""
-        for idx in (str(i) for i in range(self.cfg.size)):
-            worker = self.cfg.worker_type(
-                index=idx, restart_count=self.cfg.restart_count
-            )
-            worker.parent = self
-            worker.cfg.parent = self.cfg
-            self._workers.add(worker, uid=idx)
+        size = self.cfg.size
+        if self.cfg.autoscale:
+            min_size, max_size = self._size_limits()
+            size = max(min_size, min(size, max_size, len(self.unassigned)))
+        for _ in range(size):
+            self._add_worker()
+
+    def _workers_autoscaling(self):
+        """
+        Periodically add or remove workers, see
+        :py:meth:`~testplan.runners.pools.base.Pool._scaling_decision`.
+        """
+        # The first call only starts measuring the CPU usage
+        psutil.cpu_percent(interval=None)
+        while self.active:
+            try:
+                wait_until_predicate(
+                    lambda: not self.is_alive,
+                    timeout=self.cfg.autoscale_interval,
+                    interval=0.05,
+                )
+            except RuntimeError:
+                break
+
+            if self.status.tag != self.status.STARTED:
+                continue
+            try:
+                self._autoscale()
+            except Exception:
+                self.logger.error(traceback.format_exc())
+
+    def _scaling_stats(self):
+        """Current load of the pool and of the host."""
+        workers = [
+            worker
+            for worker in self._workers
+            if worker.uid() not in self._retiring
+        ]
+        latencies = list(self._task_latencies)
+        return {
+            "time": time.time(),
+            "workers": len(workers),
+            "queued": len(self.unassigned),
+            "busy": len([worker for worker in workers if worker.assigned]),
+            "latency": sum(latencies) / len(latencies) if latencies else None,
+            "cpu": psutil.cpu_percent(interval=None),
+            "memory": psutil.virtual_memory().percent,
+        }
 
+    def _scaling_decision(self, stats):
+        """
+        Number of workers the pool should have. It grows when there are more
+        unassigned tasks than idle workers, unless the current workers are
+        expected to drain the queue before the next decision given the average
+        task latency. It shrinks by one idle worker at a time when there is no
+        unassigned task. It never grows while the host CPU or memory usage
+        exceeds its limit, and shrinks then if a worker is idle.
+
+        :param stats: Pool and host load, as returned by
+            :py:meth:`~testplan.runners.pools.base.Pool._scaling_stats`.
+        :type stats: ``dict``
+        :return: Target number of workers and the reason of the decision.
+        :rtype: ``tuple`` of ``int`` and ``str``
+        """
+        min_size, max_size = self._size_limits()
+        workers = stats["workers"]
+        idle = workers - stats["busy"]
+        queued = stats["queued"]
+
+        if workers < min_size:
+            return min_size, "below min_size"
+        if (
+            stats["cpu"] > self.cfg.max_cpu_load
+            or stats["memory"] > self.cfg.max_memory_load
+        ):
+            reason = "host load cpu={:.0f}% memory={:.0f}%".format(
+                stats["cpu"], stats["memory"]
+            )
+            if idle and workers > min_size:
+                return workers - 1, reason
+            return workers, reason
+        if queued > idle:
+            if (
+                stats["latency"] is not None
+                and queued * stats["latency"]
+                <= workers * self.cfg.autoscale_interval
+            ):
+                return workers, "queue drains within interval"
+            # At most double the workers at once, the decisions that follow
+            # take the load of the new ones into account
+            grow = min(queued - idle, max(workers, 1))
+            return min(max_size, workers + grow), "queue depth"
+        if not queued and idle and workers > min_size:
+            return workers - 1, "idle workers"
+        return workers, "steady"
+
+    def _autoscale(self):
+        """Record a scaling decision and add or remove workers for it."""
+        self._remove_retired_workers()
+        stats = self._scaling_stats()
+        target, reason = self._scaling_decision(stats)
+        stats.update(target=target, reason=reason)
+        self.autoscale_history.append(stats)
+
+        if target == stats["workers"]:
             self.logger.debug(
-                "Added worker %(index)s (outfile = %(outfile)s)",
-                {"index": idx, "outfile": worker.outfile},
+                "Autoscaling %s: keep %d workers (%s)", self, target, reason,
             )
+            return
+
+        self.logger.info(
+            "Autoscaling %s from %d to %d workers (%s), %d tasks queued",
+            self,
+            stats["workers"],
+            target,
+            reason,
+            stats["queued"],
+        )
+        if target > stats["workers"]:
+            self._scale_up(target - stats["workers"])
+        else:
+            self._scale_down(stats["workers"] - target)
+
+    def _scale_up(self, count):
+        """Add and start workers."""
+        started = []
+        with self._pool_lock:
+            if self.status.tag != self.status.STARTED:
+                return
+            for _ in range(count):
+                worker = self._add_worker()
+                self._conn.register(worker)
+                worker.start()
+                started.append(worker)
+
+        for worker in started:
+            try:
+                worker.wait(worker.STATUS.STARTED)
+            except Exception:
+                self.logger.error(
+                    "Worker %s failed to start:%s%s",
+                    worker,
+                    os.linesep,
+                    traceback.format_exc(),
+                )
+                with self._pool_lock:
+                    self._retiring.add(worker.uid())
+                    self._retired.add(worker.uid())
+                    worker.abort()
+
+    def _scale_down(self, count):
+        """
+        Mark idle workers to be removed, they are told to stop on their next
+        task pull request and removed once they did.
+        """
+        with self._pool_lock:
+            idle = [
+                worker
+                for worker in self._workers
+                if worker.uid() not in self._retiring
+                and worker.status.tag == worker.STATUS.STARTED
+                and not worker.assigned
+            ]
+            for worker in idle[::-1][:count]:
+                self._retiring.add(worker.uid())
+
+    def _remove_retired_workers(self):
+        """Stop and remove the workers that were told to stop."""
+        for uid in list(self._retired):
+            with self._pool_lock:
+                if self.status.tag != self.status.STARTED:
+                    return
+                worker = self._workers[uid]
+                self._workers.remove(uid)
+                self._retired.discard(uid)
+                self._retiring.discard(uid)
+            if worker.status.tag != worker.STATUS.STOPPED:
+                worker.stop()
+            self.logger.debug("Removed worker %s", worker)
+
+    def _export_autoscale_history(self):
+        """Write the scaling decisions to a CSV file in the pool runpath."""
+        if not self.autoscale_history or self.runpath is None:
+            return
+        path = os.path.join(self.runpath, "autoscale.csv")
+        with open(path, "w") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=self.AUTOSCALE_FIELDS)
+            writer.writeheader()
+            for stats in list(self.autoscale_history):
+                writer.writerow(stats)
+        self.logger.debug("Written autoscaling decisions to %s", path)
 
     def _start_workers(self):
         """Start all workers of the pool"""
@@ -756,6 +1208,7 @@ class Pool(Executor):
         super(Pool, self).stopping()  # stop the loop and the monitor
 
         self._conn.stop()
+        self._export_autoscale_history()
 
         self.status.change(self.status.STOPPED)
         self.logger.debug("Stopped %s", self.__class__.__name__)
@@ -776,5 +1229,6 @@ class Pool(Executor):
 
         self._conn.abort()
         self._discard_pending_tasks()
+        self._export_autoscale_history()
 
         self.logger.debug("Aborted pool {}".format(self))
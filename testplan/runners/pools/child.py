@@ -2,7 +2,9 @@
 
 import os
 import sys
+import json
 import time
+import select
 import signal
 import socket
 import shutil
@@ -324,8 +326,129 @@ class RemoteChildLoop(ChildLoop):
         super(RemoteChildLoop, self).exit_loop()
 
 
+def _fork_worker(args, request):
+    """
+    Run a child process worker in a process forked by the fork server, it
+    never returns.
+    """
+    code = 1
+    try:
+        outfile = os.open(
+            request["outfile"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+        )
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.dup2(outfile, 1)
+        os.dup2(outfile, 2)
+        os.close(devnull)
+        os.close(outfile)
+
+        args.index = request["index"]
+        args.address = request["address"]
+        args.log_level = request["log_level"]
+        args.type = "process_worker"
+        child_logic(args)
+        code = 0
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def _reap_workers(reply):
+    """Reap the exited workers and report their exit codes."""
+    while True:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except OSError:
+            # No child process
+            return
+        if pid == 0:
+            return
+        if os.WIFSIGNALED(status):
+            returncode = -os.WTERMSIG(status)
+        else:
+            returncode = os.WEXITSTATUS(status)
+        reply({"exited": pid, "returncode": returncode})
+
+
+def fork_server(args):
+    """
+    Fork server, that imports testplan and the modules of the tasks once
+    and forks child process workers on demand, so that workers are started
+    without importing them again.
+
+    Requests and replies are JSON lines read from stdin and written to
+    stdout. The first request gives the modules to import, as ``module``,
+    ``path`` pairs, then each request gives the ``index``, ``address``,
+    ``log_level`` and ``outfile`` of a worker to fork and is replied with
+    its ``pid``. Exit codes of the workers are reported as they exit. The
+    fork server exits when its stdin is closed.
+    """
+    import importlib
+
+    # Anything printed goes to stderr, stdout is kept for replies.
+    replies = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+
+    def reply(data):
+        replies.write(json.dumps(data) + "\n")
+        replies.flush()
+
+    # Import what child process workers use
+    from testplan.runners.pools import base, connection, process  # noqa
+
+    stdin = sys.stdin.fileno()
+    buffer = b""
+    preloaded = False
+    while True:
+        readable, _, _ = select.select([stdin], [], [], 0.1)
+        _reap_workers(reply)
+        if not readable:
+            continue
+
+        data = os.read(stdin, 65536)
+        if not data:
+            break
+        buffer += data
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            request = json.loads(line.decode("utf-8"))
+
+            if not preloaded:
+                for module, path in request["preload"]:
+                    if path:
+                        sys.path.insert(0, path)
+                    try:
+                        importlib.import_module(module)
+                    except Exception:
+                        traceback.print_exc()
+                    finally:
+                        if path:
+                            sys.path.remove(path)
+                preloaded = True
+                reply({"ready": True})
+                continue
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                replies.close()
+                _fork_worker(args, request)
+            reply({"pid": pid})
+
+
 def child_logic(args):
     """Able to be imported child logic."""
+    if args.type == "fork_server":
+        fork_server(args)
+        return
+
     if args.log_level:
         from testplan.common.utils.logger import TESTPLAN_LOGGER
 
@@ -1,20 +1,21 @@
 """Process worker pool module."""
 
 import os
-import re
 import sys
+import json
 import time
 import signal
+import threading
 import subprocess
 from schema import Or
 import psutil
 import tempfile
+from six.moves import queue
 
 import testplan
 from testplan.common.utils.logger import TESTPLAN_LOGGER
 from testplan.common.config import ConfigOption
 from testplan.common.utils.process import kill_process
-from testplan.common.utils.match import match_regexps_in_file
 from testplan.common.utils.timing import get_sleeper
 from testplan.runners.pools import tasks
 
@@ -22,6 +23,176 @@ from .base import Pool, PoolConfig, Worker, WorkerConfig
 from .connection import ZMQClientProxy, ZMQServer
 
 
+class ForkedProcess(object):
+    """
+    Handle of a worker process forked by a
+    :py:class:`ForkServer`, with the ``subprocess.Popen`` methods used to
+    manage workers. The process is not a child of the current process, its
+    exit code is reported by the fork server.
+
+    :param pid: Process id.
+    :type pid: ``int``
+    :param fork_server: Fork server that forked the process.
+    :type fork_server: :py:class:`ForkServer`
+    """
+
+    def __init__(self, pid, fork_server):
+        self.pid = pid
+        self.returncode = None
+        self._fork_server = fork_server
+
+    def poll(self):
+        """Exit code of the process, ``None`` if it is still running."""
+        if self.returncode is None:
+            self.returncode = self._fork_server.returncode(self.pid)
+        return self.returncode
+
+    def wait(self, timeout=None):
+        """Wait for the process to exit and return its exit code."""
+        sleeper = get_sleeper(
+            (0.01, 0.1), timeout=float("inf") if timeout is None else timeout
+        )
+        while next(sleeper):
+            if self.poll() is not None:
+                return self.returncode
+        if hasattr(subprocess, "TimeoutExpired"):
+            raise subprocess.TimeoutExpired(str(self.pid), timeout)
+        return None
+
+    def send_signal(self, sig):
+        """Send a signal to the process if it is still running."""
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, sig)
+            except OSError:
+                pass
+
+    def terminate(self):
+        """Terminate the process."""
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        """Kill the process."""
+        self.send_signal(signal.SIGKILL)
+
+
+class ForkServer(object):
+    """
+    Manages a fork server process, that imports testplan and the modules of
+    the tasks once and forks warm child process workers on demand.
+
+    :param cmd: Command to start the fork server.
+    :type cmd: ``list``
+    :param logfile: File to write the output of the fork server to.
+    :type logfile: ``str``
+    """
+
+    def __init__(self, cmd, logfile):
+        self.cmd = cmd
+        self.logfile = logfile
+        self._handler = None
+        self._reader = None
+        self._replies = queue.Queue()
+        self._returncodes = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_alive(self):
+        """Whether the fork server is running."""
+        return self._handler is not None and self._handler.poll() is None
+
+    def start(self, preload, timeout=60):
+        """
+        Start the fork server and wait for it to import the modules.
+
+        :param preload: Modules to import, as ``(module, path)`` pairs.
+        :type preload: ``list`` of ``tuple``
+        :param timeout: Timeout in seconds for the imports.
+        :type timeout: ``int`` or ``float``
+        """
+        with open(self.logfile, "wb") as out:
+            self._handler = subprocess.Popen(
+                [str(arg) for arg in self.cmd],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=out,
+            )
+        self._reader = threading.Thread(target=self._read_replies)
+        self._reader.daemon = True
+        self._reader.start()
+        self._request({"preload": [list(item) for item in preload]})
+        self._reply(timeout)
+
+    def _read_replies(self):
+        for line in iter(self._handler.stdout.readline, b""):
+            reply = json.loads(line.decode("utf-8"))
+            if "exited" in reply:
+                self._returncodes[reply["exited"]] = reply["returncode"]
+            else:
+                self._replies.put(reply)
+        self._replies.put(None)
+
+    def _request(self, data):
+        self._handler.stdin.write((json.dumps(data) + "\n").encode("utf-8"))
+        self._handler.stdin.flush()
+
+    def _reply(self, timeout):
+        try:
+            reply = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            reply = None
+        if reply is None:
+            raise RuntimeError(
+                "Fork server not responding (logfile = {})".format(
+                    self.logfile
+                )
+            )
+        return reply
+
+    def fork(self, index, address, log_level, outfile, timeout=30):
+        """
+        Fork a child process worker.
+
+        :return: Handle of the worker process.
+        :rtype: :py:class:`ForkedProcess`
+        """
+        with self._lock:
+            self._request(
+                {
+                    "index": index,
+                    "address": address,
+                    "log_level": log_level,
+                    "outfile": outfile,
+                }
+            )
+            return ForkedProcess(self._reply(timeout)["pid"], self)
+
+    def returncode(self, pid):
+        """
+        Exit code of a forked process, ``None`` if it is still running.
+        """
+        if pid in self._returncodes:
+            return self._returncodes[pid]
+        if not self.is_alive and not psutil.pid_exists(pid):
+            # Reaped by another process once the fork server exited
+            return self._returncodes.get(pid, -1)
+        return None
+
+    def stop(self):
+        """Stop the fork server, workers already forked keep running."""
+        if self._handler is None:
+            return
+        try:
+            self._handler.stdin.close()
+        except (IOError, OSError):
+            pass
+        if self._handler.poll() is None:
+            kill_process(self._handler)
+        self._handler.wait()
+        self._reader.join()
+        self._handler = None
+
+
 class ProcessWorkerConfig(WorkerConfig):
     """
     Configuration object for
@@ -97,6 +268,21 @@ class ProcessWorker(Worker):
     def starting(self):
         """Start a child process worker."""
         # NOTE: Worker resource has no runpath.
+        fork_server = getattr(self.parent, "fork_server", None)
+        if fork_server is not None:
+            self._handler = fork_server.fork(
+                index=self.cfg.index,
+                address=self.transport.address,
+                log_level=TESTPLAN_LOGGER.getEffectiveLevel(),
+                outfile=self.outfile,
+            )
+            self.logger.debug(
+                "Forked child process %d - output at %s",
+                self._handler.pid,
+                self.outfile,
+            )
+            return
+
         cmd = self._proc_cmd()
         self.logger.debug("{} executes cmd: {}".format(self, cmd))
 
@@ -111,20 +297,19 @@ class ProcessWorker(Worker):
         self._handler.stdin.write(bytes("y\n".encode("utf-8")))
 
     def _wait_started(self, timeout=None):
-        """TODO."""
+        """
+        Wait for the child process to request its configuration from the
+        pool, which then marks the worker as started.
+        """
         sleeper = get_sleeper(
-            interval=(0.04, 0.5),
+            interval=(0.01, 0.1),
             timeout=timeout,
             raise_timeout_with_msg="Worker start timeout, logfile = {}".format(
                 self.outfile
             ),
         )
         while next(sleeper):
-            if match_regexps_in_file(
-                self.outfile, [re.compile("Starting child process worker on")]
-            )[0]:
-                self.last_heartbeat = time.time()
-                self.status.change(self.STATUS.STARTED)
+            if self.status.tag == self.STATUS.STARTED:
                 return
 
             if self._handler and self._handler.poll() is not None:
@@ -188,6 +373,9 @@ class ProcessPoolConfig(PoolConfig):
             ): [int],
             ConfigOption("worker_type", default=ProcessWorker): object,
             ConfigOption("worker_heartbeat", default=5): Or(int, float, None),
+            ConfigOption("worker_start_method", default="spawn"): Or(
+                "spawn", "forkserver"
+            ),
         }
 
 
@@ -210,6 +398,11 @@ class ProcessPool(Pool):
     :type worker_type: :py:class:`~testplan.runners.pools.process.ProcessWorker`
     :param worker_heartbeat: Worker heartbeat period.
     :type worker_heartbeat: ``int`` or ``float`` or ``NoneType``
+    :param worker_start_method: How child processes of workers are started,
+        ``spawn`` starts a new interpreter for each of them, ``forkserver``
+        starts a fork server that imports testplan and the modules of the
+        tasks once and forks them, POSIX only.
+    :type worker_start_method: ``str``
 
     Also inherits all :py:class:`~testplan.runners.pools.base.Pool` options.
     """
@@ -226,10 +419,95 @@ class ProcessPool(Pool):
         abort_signals=None,
         worker_type=ProcessWorker,
         worker_heartbeat=5,
+        worker_start_method="spawn",
         **options
     ):
         options.update(self.filter_locals(locals()))
         super(ProcessPool, self).__init__(**options)
+        self.fork_server = None
+
+    def _fork_server_cmd(self):
+        """Command to start the fork server."""
+        from testplan.common.utils.path import fix_home_prefix
+
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
+            f.write("\n".join(sys.path))
+            sys_path_file = f.name
+
+        cmd = [
+            sys.executable,
+            fix_home_prefix(
+                os.path.join(os.path.dirname(__file__), "child.py")
+            ),
+            "--testplan",
+            os.path.join(os.path.dirname(testplan.__file__), ".."),
+            "--type",
+            "fork_server",
+            "--log-level",
+            TESTPLAN_LOGGER.getEffectiveLevel(),
+            "--sys-path-file",
+            sys_path_file,
+        ]
+        if os.environ.get(testplan.TESTPLAN_DEPENDENCIES_PATH):
+            cmd.extend(
+                [
+                    "--testplan-deps",
+                    fix_home_prefix(
+                        os.environ[testplan.TESTPLAN_DEPENDENCIES_PATH]
+                    ),
+                ]
+            )
+        return cmd
+
+    def _start_fork_server(self):
+        """Start the fork server, importing the modules of the tasks."""
+        if self.cfg.worker_start_method != "forkserver":
+            return
+        if not hasattr(os, "fork"):
+            self.logger.warning(
+                "Fork server not supported on this platform,"
+                " spawning worker processes instead"
+            )
+            return
+
+        preload = []
+        for task in self._input.values():
+            if isinstance(task, tasks.Task) and task.module:
+                item = (task.module, task.path)
+                if item not in preload:
+                    preload.append(item)
+
+        self.fork_server = ForkServer(
+            self._fork_server_cmd(),
+            os.path.join(self.runpath, "fork_server.log"),
+        )
+        start_time = time.time()
+        self.fork_server.start(preload)
+        self.logger.debug(
+            "Started fork server, %d modules imported in %.2f sec",
+            len(preload),
+            time.time() - start_time,
+        )
+
+    def _stop_fork_server(self):
+        if self.fork_server is not None:
+            self.fork_server.stop()
+            self.fork_server = None
+
+    def _start_workers(self):
+        """Start the fork server if enabled, then all workers of the pool."""
+        self._start_fork_server()
+        super(ProcessPool, self)._start_workers()
+
+    def stopping(self):
+        """Stop the workers, then the fork server."""
+        super(ProcessPool, self).stopping()
+        self._stop_fork_server()
+
+    def aborting(self):
+        """Abort the workers, then the fork server."""
+        super(ProcessPool, self).aborting()
+        self._stop_fork_server()
 
     def add(self, task, uid):
         """
@@ -2,12 +2,18 @@
 
 import os
 import sys
+import json
+import time
 import signal
 import socket
 import getpass
 import platform
 import six
+import shutil
 import itertools
+import tempfile
+import threading
+import subprocess
 from multiprocessing.pool import ThreadPool
 
 from schema import Or
@@ -28,11 +34,14 @@ from testplan.common.utils.remote import (
     copy_cmd,
     link_cmd,
     remote_filepath_exists,
+    ssh_options,
 )
 from testplan.common.utils import path as pathutils
+from testplan.common.utils.callable import getargspec
 from testplan.common.utils.process import execute_cmd
 from testplan.common.utils.timing import get_sleeper
 
+from testplan.runners.pools import workspace_sync
 from testplan.runners.pools.base import Pool, PoolConfig
 from testplan.runners.pools.process import ProcessWorker, ProcessWorkerConfig
 from testplan.runners.pools.connection import ZMQServer
@@ -80,6 +89,58 @@ class _LocationPaths(object):
         return iter((self.local, self.remote))
 
 
+def _accepts_extra_ssh_options(copy_command):
+    """
+    Check if a copy command callable takes the ``extra_ssh_options`` argument,
+    user defined ones may only take the arguments of the original
+    ``copy_cmd`` signature.
+    """
+    try:
+        argspec = getargspec(copy_command)
+    except ValueError:
+        return False
+    return "extra_ssh_options" in argspec.args or argspec.keywords is not None
+
+
+class _WorkspaceSeeds(object):
+    """
+    Hosts holding a copy of the workspace, that can seed it to other hosts
+    one at a time. The local host is the initial seed, every host that
+    receives the workspace becomes a seed as well, so the number of seeds
+    doubles with each round of copies.
+
+    Seeds are identified by their ssh config, ``None`` for the local host.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._idle = [None]
+
+    def acquire(self):
+        """
+        Wait for an idle seed and take it.
+
+        :return: ssh config of the seed, ``None`` for the local host.
+        :rtype: ``dict`` or ``NoneType``
+        """
+        with self._cond:
+            while not self._idle:
+                self._cond.wait()
+            return self._idle.pop(0)
+
+    def release(self, *seeds):
+        """
+        Make seeds available to copy the workspace from.
+
+        :param seeds: The seed taken with :py:meth:`acquire` and any host
+          that received the workspace from it.
+        :type seeds: ``dict`` or ``NoneType``
+        """
+        with self._cond:
+            self._idle.extend(seeds)
+            self._cond.notify_all()
+
+
 class RemoteWorker(ProcessWorker):
     """
     Remote worker resource that pulls tasks from the transport provided,
@@ -111,7 +172,71 @@ class RemoteWorker(ProcessWorker):
         self.setup_metadata = WorkerSetupMetadata()
         self.remote_push_dir = None
         self.ssh_cfg = {"host": self.cfg.remote_host}
+        self._ssh_control_dir = None
         self._testplan_import_path = _LocationPaths()
+        self._sync_script = None
+        self._fetched = {}
+        self._fetch_lock = threading.Lock()
+        self._fetch_thread = None
+        self._fetch_requested = threading.Event()
+        self._fetch_stopped = threading.Event()
+
+    def _start_ssh_master(self):
+        """
+        Start a master ssh connection to the remote host, that the ssh and
+        copy commands of the worker are multiplexed over to avoid a new
+        handshake for each of them. Only the default ``ssh_cmd`` handles the
+        master connection control, a user defined one would run a login
+        shell instead.
+        """
+        if (
+            not self.cfg.ssh_multiplex
+            or self.cfg.ssh_cmd is not ssh_cmd
+            or self._ssh_control_dir
+        ):
+            return
+
+        self._ssh_control_dir = tempfile.mkdtemp(prefix="testplan-ssh-")
+        self.ssh_cfg["control_path"] = os.path.join(
+            self._ssh_control_dir, "master"
+        )
+        # The master runs in background, its output must not be piped or
+        # reading it would block until it exits.
+        with open(os.devnull, "w") as devnull:
+            retcode = execute_cmd(
+                self.cfg.ssh_cmd(dict(self.ssh_cfg, control="start"), ""),
+                label="start ssh master connection",
+                check=False,
+                stdout=devnull,
+                stderr=devnull,
+                logger=self.logger,
+            )
+        if retcode != 0:
+            self.logger.warning(
+                "Could not start ssh master connection to %s,"
+                " commands will not be multiplexed",
+                self.cfg.remote_host,
+            )
+            self._stop_ssh_master()
+
+    def _stop_ssh_master(self):
+        """Stop the master ssh connection to the remote host."""
+        if not self._ssh_control_dir:
+            return
+
+        if os.path.exists(self.ssh_cfg["control_path"]):
+            with open(os.devnull, "w") as devnull:
+                execute_cmd(
+                    self.cfg.ssh_cmd(dict(self.ssh_cfg, control="exit"), ""),
+                    label="stop ssh master connection",
+                    check=False,
+                    stdout=devnull,
+                    stderr=devnull,
+                    logger=self.logger,
+                )
+        del self.ssh_cfg["control_path"]
+        shutil.rmtree(self._ssh_control_dir, ignore_errors=True)
+        self._ssh_control_dir = None
 
     def _execute_cmd_remote(self, cmd, label=None, check=True):
         """
@@ -156,6 +281,10 @@ class RemoteWorker(ProcessWorker):
         self._remote_testplan_runpath = "/".join(
             [self._remote_testplan_path, "runpath", str(self.cfg.remote_host)]
         )
+        self._remote_cache_path = "/".join(
+            testplan_path_dirs + ["workspace_cache"]
+        )
+        self._remote_pycache_path = "/".join(testplan_path_dirs + [".pycache"])
 
     def _create_remote_dirs(self):
         """Create mandatory directories in remote host."""
@@ -420,12 +549,10 @@ class RemoteWorker(ProcessWorker):
             )
         if copy:
             # Workspace should be copied to remote.
-            self._transfer_data(
-                source=self._workspace_paths.local,
-                target=self._remote_testplan_path,
-                remote_target=True,
-                exclude=self.cfg.workspace_exclude,
-            )
+            if self.parent.workspace_seeds is not None:
+                self._seed_workspace(self.parent.workspace_seeds)
+            else:
+                self._copy_local_workspace()
             # Mark that workspace pushed is safe to delete. Not some NFS.
             self.setup_metadata.workspace_pushed = True
 
@@ -445,6 +572,184 @@ class RemoteWorker(ProcessWorker):
                 logger=self.logger,
             )
 
+    def _copy_local_workspace(self):
+        """Copy the local workspace to the remote host."""
+        if self.cfg.workspace_sync:
+            self._sync_workspace()
+        else:
+            self._transfer_data(
+                source=self._workspace_paths.local,
+                target=self._remote_testplan_path,
+                remote_target=True,
+                exclude=self.cfg.workspace_exclude,
+            )
+
+    def _copy_sync_script(self):
+        """
+        Copy the sync script to the remote host, once.
+
+        :return: Remote path of the script.
+        :rtype: ``str``
+        """
+        if self._sync_script is None:
+            script = "/".join(
+                (self._remote_testplan_path, "workspace_sync.py")
+            )
+            self._transfer_data(
+                source=os.path.join(
+                    os.path.dirname(os.path.abspath(__file__)),
+                    "workspace_sync.py",
+                ),
+                target=script,
+                remote_target=True,
+            )
+            self._sync_script = script
+        return self._sync_script
+
+    def _sync_workspace(self):
+        """
+        Copy the local workspace files that are not in the cache of the
+        remote host, as a single compressed stream, and update the remote
+        workspace from the cache.
+        """
+        manifest = pathutils.dir_manifest(
+            self._workspace_paths.local, exclude=self.cfg.workspace_exclude
+        )
+        digests = sorted(
+            {entry["sha1"] for entry in manifest.values() if "sha1" in entry}
+        )
+
+        sync_cmd = [
+            self._remote_python,
+            self._copy_sync_script(),
+            "--cache",
+            self._remote_cache_path,
+        ]
+
+        missing = self._execute_cmd_remote_input(
+            sync_cmd + ["missing"],
+            lambda stdin: stdin.write("\n".join(digests).encode("ascii")),
+            label="workspace sync missing files",
+        ).split()
+        self.logger.debug(
+            "Syncing workspace to %s: %d of %d files not cached",
+            self.cfg.remote_host,
+            len(missing),
+            len(digests),
+        )
+
+        self._execute_cmd_remote_input(
+            sync_cmd + ["receive", "--dest", self._workspace_paths.remote],
+            lambda stdin: workspace_sync.send(
+                stdin,
+                self._workspace_paths.local,
+                manifest,
+                set(d.decode("ascii") for d in missing),
+            ),
+            label="workspace sync",
+        )
+
+    def _execute_cmd_remote_input(self, cmd, write_input, label=None):
+        """
+        Execute a command on the remote host, writing to its stdin.
+
+        :param cmd: Remote command to execute - list of parameters.
+        :param write_input: Callable writing the input to the stdin stream.
+        :param label: Optional label for debugging.
+        :return: Output of the command.
+        :rtype: ``bytes``
+        """
+        cmd = self.cfg.ssh_cmd(self.ssh_cfg, " ".join(cmd))
+        self.logger.debug("Executing command [%s]: '%s'", label, " ".join(cmd))
+        with tempfile.TemporaryFile() as stdout:
+            with tempfile.TemporaryFile() as stderr:
+                handler = subprocess.Popen(
+                    cmd, stdin=subprocess.PIPE, stdout=stdout, stderr=stderr
+                )
+                try:
+                    write_input(handler.stdin)
+                except (IOError, OSError) as exc:
+                    # The command failed before reading all its input
+                    self.logger.debug("Writing input failed: %s", exc)
+                finally:
+                    try:
+                        handler.stdin.close()
+                    except (IOError, OSError):
+                        pass
+                handler.wait()
+
+                if handler.returncode != 0:
+                    stderr.seek(0)
+                    raise RuntimeError(
+                        "Command '{}' returned with non-zero exit code {}:"
+                        " {}".format(
+                            " ".join(cmd),
+                            handler.returncode,
+                            stderr.read().decode("utf-8", "replace"),
+                        )
+                    )
+            stdout.seek(0)
+            return stdout.read()
+
+    def _seed_workspace(self, seeds):
+        """
+        Copy the workspace from the local host or from a remote host that
+        already received it, whichever becomes available first.
+
+        Copies between remote hosts run the copy command on the seed host,
+        falling back to a copy from the local host if it fails. The copy
+        binary is run by name there, as its local path may not exist on the
+        seed host.
+
+        :param seeds: Hosts holding a copy of the workspace.
+        :type seeds: :py:class:`_WorkspaceSeeds`
+        """
+        seed = seeds.acquire()
+        copied = False
+        try:
+            if seed is not None:
+                cmd = self.cfg.copy_cmd(
+                    self._workspace_paths.remote,
+                    self._remote_copy_path(self._remote_testplan_path),
+                    exclude=self.cfg.workspace_exclude,
+                )
+                cmd = [os.path.basename(cmd[0])] + list(cmd[1:])
+                copied = (
+                    execute_cmd(
+                        self.cfg.ssh_cmd(
+                            seed,
+                            " ".join(six.moves.shlex_quote(a) for a in cmd),
+                        ),
+                        label="copy workspace from {}".format(seed["host"]),
+                        check=False,
+                        logger=self.logger,
+                    )
+                    == 0
+                )
+                if not copied:
+                    self.logger.warning(
+                        "Could not copy workspace from %s, copying it from"
+                        " the local host",
+                        seed["host"],
+                    )
+            if not copied:
+                self._copy_local_workspace()
+                copied = True
+        finally:
+            if copied:
+                # The ssh config of the worker holds its master connection,
+                # which is stopped with the worker
+                seeds.release(
+                    seed,
+                    {
+                        key: self.ssh_cfg[key]
+                        for key in ("host", "port")
+                        if key in self.ssh_cfg
+                    },
+                )
+            else:
+                seeds.release(seed)
+
     def _remote_copy_path(self, path):
         """
         Return a path on the remote host in the format user@host:path,
@@ -466,6 +771,10 @@ class RemoteWorker(ProcessWorker):
             source = self._remote_copy_path(source)
         if remote_target:
             target = self._remote_copy_path(target)
+        if ssh_options(self.ssh_cfg) and _accepts_extra_ssh_options(
+            self.cfg.copy_cmd
+        ):
+            copy_args["extra_ssh_options"] = ssh_options(self.ssh_cfg)
         self.logger.debug("Copying %(source)s to %(target)s", locals())
         cmd = self.cfg.copy_cmd(source, target, **copy_args)
         with open(os.devnull, "w") as devnull:
@@ -542,15 +851,140 @@ class RemoteWorker(ProcessWorker):
                     exclude=self.cfg.pull_exclude,
                 )
 
+    def request_fetch(self):
+        """
+        Notify the worker that tests completed, their results are fetched in
+        background if results are streamed.
+        """
+        self._fetch_requested.set()
+
+    def _start_fetching(self):
+        """Start fetching the results in background."""
+        if not self.cfg.stream_results or self._fetch_thread:
+            return
+        self._fetch_stopped.clear()
+        self._fetch_thread = threading.Thread(target=self._fetch_loop)
+        self._fetch_thread.daemon = True
+        self._fetch_thread.start()
+
+    def _stop_fetching(self):
+        """Stop fetching the results in background."""
+        if not self._fetch_thread:
+            return
+        self._fetch_stopped.set()
+        self._fetch_requested.set()
+        self._fetch_thread.join()
+        self._fetch_thread = None
+
+    def _fetch_loop(self):
+        """
+        Fetch the results of the completed tests, at most once every
+        ``stream_interval`` seconds.
+        """
+        while True:
+            self._fetch_requested.wait()
+            if self._fetch_stopped.is_set():
+                break
+            self._fetch_requested.clear()
+            try:
+                self._fetch_delta()
+            except Exception as exc:
+                self.logger.warning(
+                    "Could not fetch results from %s: %s",
+                    self.cfg.remote_host,
+                    exc,
+                )
+            if self._fetch_stopped.wait(self.cfg.stream_interval):
+                break
+
+    def _fetch_delta(self):
+        """
+        Fetch the remote runpath files created or changed since the last
+        fetch, as a single compressed stream.
+        """
+        cmd = self.cfg.ssh_cmd(
+            self.ssh_cfg,
+            " ".join(
+                [
+                    self._remote_python,
+                    self._copy_sync_script(),
+                    "changed",
+                    "--root",
+                    self._remote_testplan_runpath,
+                ]
+            ),
+        )
+        dest = os.path.join(
+            self.parent.runpath,
+            os.path.basename(self._remote_testplan_runpath),
+        )
+
+        with self._fetch_lock:
+            start_time = time.time()
+            with tempfile.TemporaryFile() as stderr:
+                handler = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                )
+                handler.stdin.write(json.dumps(self._fetched).encode("utf-8"))
+                handler.stdin.close()
+
+                stdout = handler.stdout
+                if self.cfg.stream_rate_limit:
+                    stdout = workspace_sync.RateLimitedReader(
+                        stdout, self.cfg.stream_rate_limit
+                    )
+                try:
+                    count = workspace_sync.extract(stdout, dest, self._fetched)
+                finally:
+                    handler.stdout.close()
+                    handler.wait()
+
+                if handler.returncode != 0:
+                    stderr.seek(0)
+                    raise RuntimeError(
+                        "Command '{}' returned with non-zero exit code {}:"
+                        " {}".format(
+                            " ".join(cmd),
+                            handler.returncode,
+                            stderr.read().decode("utf-8", "replace"),
+                        )
+                    )
+        self.logger.debug(
+            "Fetched %d result files from %s in %.2f sec",
+            count,
+            self.cfg.remote_host,
+            time.time() - start_time,
+        )
+
     def _fetch_results(self):
         """Fetch back to local host the results generated remotely."""
         self.logger.debug("Fetch results stage - %s", self.cfg.remote_host)
         try:
-            self._transfer_data(
-                source=self._remote_testplan_runpath,
-                remote_source=True,
-                target=self.parent.runpath,
-            )
+            if self.cfg.stream_results:
+                try:
+                    # Only the files written since the last fetch are left
+                    self._fetch_delta()
+                except Exception as exc:
+                    self.logger.warning(
+                        "Could not fetch last results from %s, copying the"
+                        " whole runpath: %s",
+                        self.cfg.remote_host,
+                        exc,
+                    )
+                    self._transfer_data(
+                        source=self._remote_testplan_runpath,
+                        remote_source=True,
+                        target=self.parent.runpath,
+                    )
+            else:
+                self._transfer_data(
+                    source=self._remote_testplan_runpath,
+                    remote_source=True,
+                    target=self.parent.runpath,
+                )
             if self.cfg.pull:
                 self._pull_files()
         except Exception as exc:
@@ -558,19 +992,22 @@ class RemoteWorker(ProcessWorker):
                 "While fetching result from worker [%s]: %s", self, exc
             )
 
-    def _proc_cmd(self):
-        """Command to start child process."""
+    @property
+    def _remote_python(self):
+        """Python interpreter to use on the remote host."""
         if platform.system() == "Windows":
             if platform.python_version().startswith("3"):
-                python_binary = os.environ["PYTHON3_REMOTE_BINARY"]
-            else:
-                python_binary = os.environ["PYTHON2_REMOTE_BINARY"]
-        else:
-            python_binary = sys.executable
+                return os.environ["PYTHON3_REMOTE_BINARY"]
+            return os.environ["PYTHON2_REMOTE_BINARY"]
+        return sys.executable
 
+    def _proc_cmd(self):
+        """Command to start child process."""
+        # Bytecode is cached on the remote host too if cached locally
+        pycache = bool(os.environ.get(testplan.TESTPLAN_PYCACHE_PREFIX))
         cmd = [
-            python_binary,
-            "-uB",
+            self._remote_python,
+            "-u" if pycache else "-uB",
             self._child_paths.remote,
             "--index",
             str(self.cfg.index),
@@ -597,6 +1034,14 @@ class RemoteWorker(ProcessWorker):
         if os.environ.get(testplan.TESTPLAN_DEPENDENCIES_PATH):
             cmd.extend(["--testplan-deps", self._remote_testplan_path])
 
+        if pycache:
+            cmd.insert(
+                0,
+                "{}={}".format(
+                    testplan.TESTPLAN_PYCACHE_PREFIX, self._remote_pycache_path
+                ),
+            )
+
         return self.cfg.ssh_cmd(self.ssh_cfg, " ".join(cmd))
 
     def _write_syspath(self):
@@ -623,13 +1068,17 @@ class RemoteWorker(ProcessWorker):
 
     def starting(self):
         """Start a child remote worker."""
+        self._start_ssh_master()
         self._prepare_remote()
         super(RemoteWorker, self).starting()
+        self._start_fetching()
 
     def stopping(self):
         """Stop child process worker."""
+        self._stop_fetching()
         self._fetch_results()
         super(RemoteWorker, self).stopping()
+        self._stop_ssh_master()
 
     def _wait_stopped(self, timeout=None):
         sleeper = get_sleeper(1, timeout)
@@ -645,11 +1094,13 @@ class RemoteWorker(ProcessWorker):
 
     def aborting(self):
         """Abort child process worker."""
+        self._stop_fetching()
         try:
             self._fetch_results()
         except Exception as exc:
             self.logger.error("Could not fetch results, {}".format(exc))
         super(RemoteWorker, self).aborting()
+        self._stop_ssh_master()
 
 
 class RemotePoolConfig(PoolConfig):
@@ -661,6 +1112,7 @@ class RemotePoolConfig(PoolConfig):
 
     default_hostname = socket.gethostbyname(socket.gethostname())
     default_workspace_root = workspace_root()
+    default_ssh_multiplex = platform.system() != "Windows"
 
     @classmethod
     def get_options(cls):
@@ -679,8 +1131,15 @@ class RemotePoolConfig(PoolConfig):
             ConfigOption("copy_cmd", default=copy_cmd): lambda x: callable(x),
             ConfigOption("link_cmd", default=link_cmd): lambda x: callable(x),
             ConfigOption("ssh_cmd", default=ssh_cmd): lambda x: callable(x),
+            ConfigOption(
+                "ssh_multiplex", default=cls.default_ssh_multiplex
+            ): bool,
             ConfigOption("workspace", default=cls.default_workspace_root): str,
             ConfigOption("workspace_exclude", default=[]): Or(list, None),
+            ConfigOption("workspace_sync", default=False): bool,
+            ConfigOption("workspace_distribution", default="direct"): Or(
+                "direct", "tree"
+            ),
             ConfigOption("remote_workspace", default=None): Or(str, None),
             ConfigOption(
                 "copy_workspace_check", default=remote_filepath_exists
@@ -696,6 +1155,10 @@ class RemotePoolConfig(PoolConfig):
             ConfigOption("remote_mkdir", default=["/bin/mkdir", "-p"]): list,
             ConfigOption("testplan_path", default=None): Or(str, None),
             ConfigOption("worker_heartbeat", default=30): Or(int, float, None),
+            ConfigOption("concurrent_hosts", default=5): Or(int, None),
+            ConfigOption("stream_results", default=False): bool,
+            ConfigOption("stream_interval", default=10): Or(int, float),
+            ConfigOption("stream_rate_limit", default=None): Or(int, None),
         }
 
 
@@ -729,10 +1192,28 @@ class RemotePool(Pool):
     :type link_cmd: ``callable``
     :param ssh_cmd: Creates the ssh command.
     :type ssh_cmd: ``callable``
+    :param ssh_multiplex: Multiplex the ssh and copy commands of each worker
+        over a single master ssh connection to its host, only done with the
+        default ``ssh_cmd``. The ``copy_cmd`` callable receives the master
+        connection details in the ``extra_ssh_options`` argument, a
+        ``copy_cmd`` that does not take it is not multiplexed.
+    :type ssh_multiplex: ``bool``
     :param workspace: Current project workspace to be transferred.
     :type workspace: ``str``
     :param workspace_exclude: Patterns to exclude files when pushing workspace.
     :type workspace_exclude: ``list`` of ``str``
+    :param workspace_sync: Copy only the workspace files that changed, based
+        on their content hash. The files are cached on each host and shared
+        by the successive runs and the different workspaces synced there.
+    :type workspace_sync: ``bool``
+    :param workspace_distribution: How the workspace is copied to the hosts,
+        ``direct`` copies it from the local host to each of them, ``tree``
+        lets the hosts that received it copy it to the others so the copies
+        are not all bound by the local host bandwidth. The ``copy_cmd``
+        command is run on the hosts in ``tree`` mode, with its binary looked
+        up on their ``PATH``, and they should be able to connect to each
+        other.
+    :type workspace_distribution: ``str``
     :param remote_workspace: Use a workspace that already exists in remote host.
     :type remote_workspace: ``str``
     :param copy_workspace_check: Check to indicate whether to copy workspace.
@@ -757,6 +1238,19 @@ class RemotePool(Pool):
     :type testplan_path: ``str``
     :param worker_heartbeat: Worker heartbeat period.
     :type worker_heartbeat: ``int`` or ``float`` or ``NoneType``
+    :param concurrent_hosts: Maximum number of hosts whose workers are
+        started or stopped concurrently, ``None`` for all of them.
+    :type concurrent_hosts: ``int`` or ``NoneType``
+    :param stream_results: Fetch the files written by the completed tests in
+        background while the run goes on, so that only the last changes are
+        fetched when the workers stop.
+    :type stream_results: ``bool``
+    :param stream_interval: Minimum number of seconds between two fetches of
+        streamed results.
+    :type stream_interval: ``int`` or ``float``
+    :param stream_rate_limit: Maximum number of bytes per second to fetch
+        streamed results at, unlimited by default.
+    :type stream_rate_limit: ``int`` or ``NoneType``
 
     Also inherits all :py:class:`~testplan.runners.pools.base.Pool` options.
     """
@@ -777,8 +1271,11 @@ class RemotePool(Pool):
         copy_cmd=copy_cmd,
         link_cmd=link_cmd,
         ssh_cmd=ssh_cmd,
+        ssh_multiplex=CONFIG.default_ssh_multiplex,
         workspace=CONFIG.default_workspace_root,
         workspace_exclude=None,
+        workspace_sync=False,
+        workspace_distribution="direct",
         remote_workspace=None,
         copy_workspace_check=remote_filepath_exists,
         env=None,
@@ -792,11 +1289,19 @@ class RemotePool(Pool):
         remote_mkdir=None,
         testplan_path=None,
         worker_heartbeat=30,
+        concurrent_hosts=5,
+        stream_results=False,
+        stream_interval=10,
+        stream_rate_limit=None,
         **options
     ):
         self.pool = None
+        self.workspace_seeds = None
         options.update(self.filter_locals(locals()))
         super(RemotePool, self).__init__(**options)
+        if self.cfg.autoscale:
+            # Workers are added for each host, not by the pool
+            raise ValueError("RemotePool does not support autoscale")
 
         self._request_handlers[
             Message.MetadataPull
@@ -846,11 +1351,18 @@ class RemotePool(Pool):
         else:
             self._workers.stop()
 
+    def _handle_taskresults(self, worker, request, response):
+        """Handle a TaskResults message, fetching their files if streamed."""
+        super(RemotePool, self)._handle_taskresults(worker, request, response)
+        worker.request_fetch()
+
     def _start_thread_pool(self):
-        size = len(self._instances)
+        size = min(
+            len(self._instances), self.cfg.concurrent_hosts or float("inf")
+        )
         try:
-            if size > 2:
-                self.pool = ThreadPool(5 if size > 5 else size)
+            if size > 1:
+                self.pool = ThreadPool(size)
         except Exception as exc:
             if isinstance(exc, AttributeError):
                 self.logger.warning(
@@ -858,6 +1370,8 @@ class RemotePool(Pool):
                 )
 
     def starting(self):
+        if self.cfg.workspace_distribution == "tree":
+            self.workspace_seeds = _WorkspaceSeeds()
         self._start_thread_pool()
         super(RemotePool, self).starting()
 
@@ -8,6 +8,11 @@ import importlib
 from six.moves import cPickle
 
 
+# Task targets resolved from strings in this process, by (module, path,
+# target), so that a worker imports them once for all the tasks it runs.
+_TARGETS = {}
+
+
 class TaskMaterializationError(Exception):
     """Error materializing task target to be executed."""
 
@@ -57,6 +62,11 @@ class Task(object):
     :type kwargs: ``kwargs``
     :param uid: Task uid.
     :type uid: ``str``
+    :param affinity: Key shared by the tasks that benefit from running on the
+                     same worker, i.e that import the same modules. Pools
+                     prefer to schedule a task to a worker that ran a task
+                     with the same key. Defaults to the target module.
+    :type affinity: ``str``
 
     """
 
@@ -68,6 +78,7 @@ class Task(object):
         args=None,
         kwargs=None,
         uid=None,
+        affinity=None,
     ):
         self._target = target
         self._path = path
@@ -75,13 +86,22 @@ class Task(object):
         self._kwargs = kwargs or dict()
         self._module = module
         self._uid = uid or str(uuid.uuid4())
+        self._affinity = affinity
 
     def __str__(self):
         return "{}[{}]".format(self.__class__.__name__, self._uid)
 
     @property
     def all_attrs(self):
-        return ("_target", "_path", "_args", "_kwargs", "_module", "_uid")
+        return (
+            "_target",
+            "_path",
+            "_args",
+            "_kwargs",
+            "_module",
+            "_uid",
+            "_affinity",
+        )
 
     def uid(self):
         """Task string uid."""
@@ -117,6 +137,20 @@ class Task(object):
         else:
             return self._module
 
+    @property
+    def path(self):
+        """Path to import the task target module from."""
+        return self._path
+
+    @property
+    def affinity(self):
+        """Task affinity key, the target module if not set."""
+        if self._affinity is not None:
+            return self._affinity
+        if isinstance(self._target, six.string_types) and not self._module:
+            return self._target.rpartition(".")[0] or None
+        return self.module
+
     def materialize(self, target=None):
         """
         Create the actual task target executable/runnable/callable object.
@@ -146,6 +180,12 @@ class Task(object):
             return self.materialize(target(*self._args, **self._kwargs))
 
     def _string_to_target(self):
+        key = (self._module, self._path, self._target)
+        try:
+            return _TARGETS[key]
+        except KeyError:
+            pass
+
         path_inserted = False
         if isinstance(self._path, six.string_types):
             sys.path.insert(0, self._path)
@@ -169,6 +209,7 @@ class Task(object):
         finally:
             if path_inserted is True:
                 sys.path.remove(self._path)
+        _TARGETS[key] = target
         return target
 
     def dumps(self, check_loadable=False):
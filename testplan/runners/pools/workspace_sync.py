@@ -0,0 +1,333 @@
+"""
+Delta sync of files between the local host and a remote host.
+
+The files synced on a host are stored in a content-addressed cache, named
+by their SHA1 hash and shared by all the workspaces synced on the host. A
+sync is done in two steps, this module being run as a script on the remote
+host for each of them:
+
+* ``missing``: reads the hashes of the workspace files from stdin and
+  writes back the ones that are not in the cache.
+* ``receive``: reads the gzipped tar stream written by :py:func:`send`, made
+  of the workspace manifest and the files that were missing, adds the files
+  to the cache and updates the workspace files that changed since the last
+  sync.
+
+The files written on a remote host, i.e. its runpath, are fetched the other
+way around by the ``changed`` step. It reads the state of the files already
+fetched from stdin and writes the files that were created or changed since
+as a gzipped tar stream, extracted locally by :py:func:`extract`.
+
+This module is copied to remote hosts before the testplan package is, so it
+must only depend on the standard library.
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import errno
+import shutil
+import tarfile
+import argparse
+
+MANIFEST = "manifest.json"
+CACHE_EXPIRY = 30 * 24 * 60 * 60
+
+
+def _makedirs(path):
+    try:
+        os.makedirs(path)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            raise
+
+
+def _remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def _cache_path(cache_dir, digest):
+    return os.path.join(cache_dir, digest[:2], digest)
+
+
+def _manifest_path(dest):
+    """Manifest of the last sync, stored next to the workspace."""
+    return "{}.manifest.json".format(dest.rstrip("/"))
+
+
+def send(fileobj, root, manifest, digests):
+    """
+    Write the sync stream of a workspace.
+
+    :param fileobj: Stream to write to, i.e the stdin of the ``receive``
+      step.
+    :type fileobj: ``file``
+    :param root: Local workspace directory.
+    :type root: ``str``
+    :param manifest: Workspace manifest, as returned by
+      :py:func:`~testplan.common.utils.path.dir_manifest`.
+    :type manifest: ``dict``
+    :param digests: Hashes of the files to send.
+    :type digests: ``set`` of ``str``
+    """
+    with tarfile.open(fileobj=fileobj, mode="w|gz") as archive:
+        data = json.dumps(manifest).encode("utf-8")
+        info = tarfile.TarInfo(MANIFEST)
+        info.size = len(data)
+        archive.addfile(info, io.BytesIO(data))
+
+        sent = set()
+        for relpath, entry in sorted(manifest.items()):
+            digest = entry.get("sha1")
+            if digest in digests and digest not in sent:
+                archive.add(
+                    os.path.join(root, *relpath.split("/")),
+                    arcname=digest,
+                    recursive=False,
+                )
+                sent.add(digest)
+
+
+def _file_state(path):
+    """Size and modification time of a file, or only its time for links."""
+    stat = os.lstat(path)
+    return [0 if os.path.islink(path) else stat.st_size, stat.st_mtime]
+
+
+class _SizedReader(object):
+    """
+    Reads exactly ``size`` bytes from a file that may shrink while it is
+    read, e.g. a log file being rotated, missing bytes are read as zeros.
+    The file is fetched again once its size or modification time changed.
+
+    :param fileobj: File object to read from.
+    :type fileobj: ``file``
+    :param size: Size of the file when it was added to the archive.
+    :type size: ``int``
+    """
+
+    def __init__(self, fileobj, size):
+        self._fileobj = fileobj
+        self._left = size
+
+    def read(self, size=-1):
+        if size < 0 or size > self._left:
+            size = self._left
+        data = self._fileobj.read(size)
+        data += b"\0" * (size - len(data))
+        self._left -= size
+        return data
+
+
+def changed(root, state, fileobj):
+    """
+    Write the files created or changed since the last fetch.
+
+    :param root: Directory to fetch the files of.
+    :type root: ``str``
+    :param state: State of the files already fetched, as updated by
+      :py:func:`extract`.
+    :type state: ``dict``
+    :param fileobj: Stream to write to.
+    :type fileobj: ``file``
+    """
+    # PAX headers keep the exact modification times used in the state
+    with tarfile.open(
+        fileobj=fileobj, mode="w|gz", format=tarfile.PAX_FORMAT
+    ) as archive:
+        for dirpath, _, filenames in os.walk(root):
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                relpath = "/".join(os.path.relpath(path, root).split(os.sep))
+                # Errors are only skipped before anything is written for the
+                # file, the stream would be corrupt otherwise
+                try:
+                    if state.get(relpath) == _file_state(path):
+                        continue
+                    info = archive.gettarinfo(path, arcname=relpath)
+                    if info is None:
+                        # Sockets cannot be archived
+                        continue
+                    source = open(path, "rb") if info.isreg() else None
+                except (IOError, OSError):
+                    # Removed while walking the directory
+                    continue
+                if source is None:
+                    archive.addfile(info)
+                    continue
+                with source:
+                    archive.addfile(info, _SizedReader(source, info.size))
+
+
+def extract(fileobj, dest, state):
+    """
+    Extract the files written by the ``changed`` step.
+
+    :param fileobj: Stream written by the ``changed`` step.
+    :type fileobj: ``file``
+    :param dest: Local directory to extract the files to.
+    :type dest: ``str``
+    :param state: State of the files already fetched, updated with the
+      extracted files.
+    :type state: ``dict``
+    :return: Number of files extracted.
+    :rtype: ``int``
+    """
+    count = 0
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as archive:
+        for member in archive:
+            archive.extract(member, path=dest)
+            state[member.name] = [member.size, member.mtime]
+            count += 1
+    return count
+
+
+class RateLimitedReader(object):
+    """
+    Wraps a file object to read from it at most ``rate`` bytes per second
+    on average, the writer being blocked once the pipe buffer is full.
+
+    :param fileobj: File object to read from.
+    :type fileobj: ``file``
+    :param rate: Maximum number of bytes read per second.
+    :type rate: ``int``
+    """
+
+    def __init__(self, fileobj, rate):
+        self._fileobj = fileobj
+        self._rate = float(rate)
+        self._start = time.time()
+        self._read = 0
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self._read += len(data)
+        delay = self._read / self._rate - (time.time() - self._start)
+        if delay > 0:
+            time.sleep(delay)
+        return data
+
+
+def missing(cache_dir, digests):
+    """
+    :param cache_dir: Cache directory.
+    :type cache_dir: ``str``
+    :param digests: Hashes of the workspace files.
+    :type digests: ``list`` of ``str``
+    :return: Hashes of the files that are not in the cache.
+    :rtype: ``list`` of ``str``
+    """
+    return [
+        digest
+        for digest in digests
+        if not os.path.exists(_cache_path(cache_dir, digest))
+    ]
+
+
+def receive(cache_dir, dest, fileobj):
+    """
+    Read a sync stream and update the workspace.
+
+    :param cache_dir: Cache directory.
+    :type cache_dir: ``str``
+    :param dest: Remote workspace directory.
+    :type dest: ``str``
+    :param fileobj: Stream written by :py:func:`send`.
+    :type fileobj: ``file``
+    """
+    manifest = None
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as archive:
+        for member in archive:
+            data = archive.extractfile(member)
+            if member.name == MANIFEST:
+                manifest = json.loads(data.read().decode("utf-8"))
+                continue
+
+            path = _cache_path(cache_dir, member.name)
+            _makedirs(os.path.dirname(path))
+            # Concurrent syncs may add the same file, rename is atomic
+            tmp_path = "{}.{}.tmp".format(path, os.getpid())
+            with open(tmp_path, "wb") as cache_file:
+                shutil.copyfileobj(data, cache_file)
+            os.rename(tmp_path, path)
+
+    if manifest is None:
+        raise RuntimeError("No manifest in workspace sync stream")
+    _update_workspace(cache_dir, dest, manifest)
+    _expire_cache(cache_dir)
+
+
+def _update_workspace(cache_dir, dest, manifest):
+    """Update the workspace files that changed since the last sync."""
+    try:
+        with open(_manifest_path(dest)) as manifest_file:
+            previous = json.load(manifest_file)
+    except (IOError, OSError, ValueError):
+        previous = {}
+
+    for relpath in set(previous) - set(manifest):
+        _remove(os.path.join(dest, *relpath.split("/")))
+
+    for relpath, entry in manifest.items():
+        path = os.path.join(dest, *relpath.split("/"))
+        if "sha1" in entry:
+            # Keep the cached file in use, see _expire_cache
+            os.utime(_cache_path(cache_dir, entry["sha1"]), None)
+        if previous.get(relpath) == entry and os.path.lexists(path):
+            continue
+
+        _remove(path)
+        _makedirs(os.path.dirname(path))
+        if "link" in entry:
+            os.symlink(entry["link"], path)
+        else:
+            shutil.copyfile(_cache_path(cache_dir, entry["sha1"]), path)
+            os.chmod(path, entry["mode"])
+
+    with open(_manifest_path(dest), "w") as manifest_file:
+        json.dump(manifest, manifest_file)
+
+
+def _expire_cache(cache_dir):
+    """Remove the cached files that no workspace used for a while."""
+    expiry = time.time() - CACHE_EXPIRY
+    for dirpath, _, filenames in os.walk(cache_dir):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                if os.path.getmtime(path) < expiry:
+                    os.remove(path)
+            except OSError:
+                pass
+
+
+def main(argv=None):
+    """Workspace sync steps run on the remote host."""
+    parser = argparse.ArgumentParser(description="Workspace sync")
+    parser.add_argument("step", choices=("missing", "receive", "changed"))
+    parser.add_argument("--cache", action="store")
+    parser.add_argument("--dest", action="store")
+    parser.add_argument("--root", action="store")
+    args = parser.parse_args(argv)
+
+    stdin = getattr(sys.stdin, "buffer", sys.stdin)
+    stdout = getattr(sys.stdout, "buffer", sys.stdout)
+    if args.step == "missing":
+        digests = stdin.read().decode("ascii").split()
+        sys.stdout.write("\n".join(missing(args.cache, digests)))
+    elif args.step == "receive":
+        _makedirs(args.dest)
+        receive(args.cache, args.dest, stdin)
+    else:
+        state = json.loads(stdin.read().decode("utf-8") or "{}")
+        changed(args.root, state, stdout)
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,11 @@ from testplan.common.entity import (
 )
 from testplan.common.utils.process import subprocess_popen
 from testplan.common.utils.timing import parse_duration, format_duration
-from testplan.common.utils.process import enforce_timeout, kill_process
+from testplan.common.utils.process import (
+    enforce_timeout,
+    cancel_timeout,
+    kill_process,
+)
 from testplan.common.utils.strings import slugify
 
 from testplan.report import (
@@ -537,7 +541,7 @@ class ProcessRunnerTest(Test):
 
     def timeout_callback(self):
         """
-        Callback function that will be called by the daemon thread if
+        Callback function that will be called by the timeout supervisor if
         a timeout occurs (e.g. process runs longer
         than specified timeout value).
         """
@@ -624,6 +628,7 @@ class ProcessRunnerTest(Test):
                         callback=self.timeout_callback,
                     )
                     self._test_process_retcode = self._test_process.wait()
+                    cancel_timeout(self._test_process)
             else:
                 self._test_process_retcode = self._test_process.wait()
             self._test_has_run = True
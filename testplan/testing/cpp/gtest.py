@@ -1,6 +1,16 @@
-from schema import Or
+import os
+from collections import OrderedDict
+
+from lxml import etree
+from schema import Or, And
 
 from testplan.common.config import ConfigOption
+from testplan.common.utils.process import (
+    subprocess_popen,
+    enforce_timeout,
+    cancel_timeout,
+    kill_process,
+)
 
 from testplan.report import (
     TestGroupReport,
@@ -14,6 +24,18 @@ from testplan.testing.multitest.entries.schemas.base import registry
 from ..base import ProcessRunnerTest, ProcessRunnerTestConfig
 
 
+def _release(element):
+    """
+    Free a fully processed element along with its preceding siblings, which
+    are kept by the tree built while parsing incrementally.
+    """
+    element.clear()
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
 class GTestConfig(ProcessRunnerTestConfig):
     """
     Configuration object for
@@ -46,6 +68,7 @@ class GTestConfig(ProcessRunnerTestConfig):
             ConfigOption("gtest_death_test_style", default="fast"): Or(
                 "fast", "threadsafe"
             ),
+            ConfigOption("shards", default=1): And(int, lambda n: n > 0),
         }
 
 
@@ -89,6 +112,11 @@ class GTest(ProcessRunnerTest):
     :param gtest_death_test_style: Test style flag, can either be
                         ``threadsafe`` or ``fast``. (Default value is ``fast``)
     :type gtest_death_test_style: ``str``
+    :param shards: Number of concurrent test processes, each one running a
+                    shard of the tests via ``GTEST_TOTAL_SHARDS`` and
+                    ``GTEST_SHARD_INDEX``. Their XML results are merged
+                    into a single report.
+    :type shards: ``int``
 
     Also inherits all
     :py:class:`~testplan.testing.base.ProcessTest` options.
@@ -108,10 +136,16 @@ class GTest(ProcessRunnerTest):
         gtest_random_seed=0,
         gtest_stream_result_to="",
         gtest_death_test_style="fast",
+        shards=1,
         **options
     ):
         options.update(self.filter_locals(locals()))
         super(GTest, self).__init__(**options)
+        self._shard_processes = []
+
+    def shard_path(self, index, name):
+        """Path of a per shard output file on runpath."""
+        return os.path.join(self._runpath, "{}.shard{}".format(name, index))
 
     def base_command(self):
         cmd = [self.cfg.driver]
@@ -119,9 +153,9 @@ class GTest(ProcessRunnerTest):
             cmd.append("--gtest_filter={}".format(self.cfg.gtest_filter))
         return cmd
 
-    def test_command(self):
+    def test_command(self, report_path=None):
         cmd = self.base_command() + [
-            "--gtest_output=xml:{}".format(self.report_path),
+            "--gtest_output=xml:{}".format(report_path or self.report_path),
             "--gtest_death_test_style={}".format(
                 self.cfg.gtest_death_test_style
             ),
@@ -152,53 +186,221 @@ class GTest(ProcessRunnerTest):
     def list_command(self):
         return self.base_command() + ["--gtest_list_tests"]
 
-    def process_test_data(self, test_data):
+    def run_tests(self):
         """
-        XML output contains entries for skipped testcases
-        as well, which are not included in the report.
+        Run the tests in a single subprocess, or in ``shards`` concurrent
+        subprocesses whose outputs are merged once they have all finished.
         """
-        result = []
-        for suite in test_data.getchildren():
-            suite_name = suite.attrib["name"]
-            suite_report = TestGroupReport(
-                name=suite_name, uid=suite_name, category="testsuite"
+        if self.cfg.shards == 1:
+            super(GTest, self).run_tests()
+            return
+
+        with self.result.report.logged_exceptions():
+            if not os.path.exists(self.cfg.driver):
+                raise IOError(
+                    "No runnable found at {} for {}".format(
+                        self.cfg.driver, self
+                    )
+                )
+
+            if self.cfg.proc_cwd:
+                self.cfg.driver = os.path.abspath(self.cfg.driver)
+
+            self._shard_processes = []
+            timeout_log = (
+                open(self.timeout_log, "w") if self.cfg.timeout else None
             )
-            suite_has_run = False
+            try:
+                for index in range(self.cfg.shards):
+                    self._shard_processes.append(
+                        self._start_shard(index, timeout_log)
+                    )
 
-            for testcase in suite.getchildren():
+                retcodes = []
+                for proc in self._shard_processes:
+                    retcodes.append(proc.wait())
+                    if timeout_log:
+                        cancel_timeout(proc)
+            finally:
+                if timeout_log:
+                    timeout_log.close()
+                self._merge_shard_streams()
+
+            self._test_process_retcode = next(
+                (code for code in retcodes if code != 0), 0
+            )
+            if not self._test_process_killed:
+                self._merge_shard_reports()
+            self._test_has_run = True
+
+    def _start_shard(self, index, timeout_log):
+        """Start the test process for a single shard."""
+        test_cmd = self.test_command(
+            report_path=self.shard_path(index, "report.xml")
+        )
+        self.result.report.logger.debug(
+            "Running {} shard {}/{} - Command: {}".format(
+                self, index, self.cfg.shards, test_cmd
+            )
+        )
+
+        env = self.get_proc_env()
+        env["GTEST_TOTAL_SHARDS"] = str(self.cfg.shards)
+        env["GTEST_SHARD_INDEX"] = str(index)
+
+        with open(self.shard_path(index, "stdout"), "w") as stdout, open(
+            self.shard_path(index, "stderr"), "w"
+        ) as stderr:
+            proc = subprocess_popen(
+                test_cmd,
+                stdout=stdout,
+                stderr=stderr,
+                cwd=self.cfg.proc_cwd,
+                env=env,
+            )
 
-                testcase_name = testcase.attrib["name"]
-                testcase_report = TestCaseReport(
-                    name=testcase_name, uid=testcase_name
+        if timeout_log:
+            enforce_timeout(
+                process=proc,
+                timeout=self.cfg.timeout,
+                output=timeout_log,
+                callback=self._shard_timeout_callback,
+            )
+        return proc
+
+    def _shard_timeout_callback(self):
+        """Report the timeout once, even if several shards time out."""
+        if not self._test_process_killed:
+            self.timeout_callback()
+
+    def _merge_shard_streams(self):
+        """Concatenate the stdout/stderr of all started shards."""
+        for name, path in (("stdout", self.stdout), ("stderr", self.stderr)):
+            with open(path, "w") as target:
+                for index in range(len(self._shard_processes)):
+                    with open(self.shard_path(index, name)) as source:
+                        target.write(source.read())
+
+    def _merge_shard_reports(self):
+        """
+        Stream the XML results of all shards into ``report_path``, one
+        testsuite element at a time. Testsuites split across shards appear
+        once per shard and are combined by ``process_test_data``.
+        """
+        paths = [
+            self.shard_path(index, "report.xml")
+            for index in range(self.cfg.shards)
+        ]
+        counters = ("tests", "failures", "disabled", "errors")
+        attrib = {attr: 0 for attr in counters}
+        attrib["time"] = 0.0
+        for path in paths:
+            # Only the attributes of the root element are needed here.
+            for _, root in etree.iterparse(path, events=("start",)):
+                for attr in counters:
+                    attrib[attr] += int(root.get(attr, 0))
+                attrib["time"] = max(
+                    attrib["time"], float(root.get("time", 0))
                 )
+                break
+        attrib = {key: str(value) for key, value in attrib.items()}
+        attrib["name"] = "AllTests"
+
+        with etree.xmlfile(self.report_path, encoding="UTF-8") as xml_file:
+            xml_file.write_declaration()
+            with xml_file.element("testsuites", attrib):
+                for path in paths:
+                    for _, suite in etree.iterparse(
+                        path, events=("end",), tag="testsuite"
+                    ):
+                        xml_file.write(suite)
+                        _release(suite)
+
+    def aborting(self):
+        super(GTest, self).aborting()
+        for proc in self._shard_processes:
+            kill_process(proc)
+            self._test_process_killed = True
+
+    def read_test_data(self):
+        """
+        Incrementally parse the XML result file generated by GTest.
+
+        :return: Iterator of ``(event, element)`` pairs of the ``start`` and
+            ``end`` events of testsuite and testcase elements.
+        :rtype: ``lxml.etree.iterparse``
+        """
+        with self.result.report.logged_exceptions():
+            return etree.iterparse(
+                self.report_path,
+                events=("start", "end"),
+                tag=("testsuite", "testcase"),
+            )
+
+    def process_test_data(self, test_data):
+        """
+        Build testsuite and testcase reports as the elements are parsed,
+        releasing processed elements so that memory usage does not grow with
+        the size of the XML file. Testsuites with the same name (e.g. from
+        different shards) are merged into a single report.
 
-                if not testcase.getchildren():
-                    assertion_obj = RawAssertion(
-                        description="Passed",
-                        content="Testcase {} passed".format(testcase_name),
-                        passed=True,
+        XML output contains entries for skipped testcases
+        as well, which are not included in the report.
+        """
+        suite_reports = OrderedDict()
+        has_run = set()
+        suite_report = None
+
+        for event, element in test_data:
+            if element.tag == "testsuite":
+                if event == "start":
+                    suite_name = element.attrib["name"]
+                    suite_report = suite_reports.setdefault(
+                        suite_name,
+                        TestGroupReport(
+                            name=suite_name,
+                            uid=suite_name,
+                            category="testsuite",
+                        ),
                     )
-                    testcase_report.append(registry.serialize(assertion_obj))
                 else:
-                    for entry in testcase.getchildren():
-                        assertion_obj = RawAssertion(
-                            description=entry.tag,
-                            content=entry.text,
-                            passed=entry.tag != "failure",
-                        )
-                        testcase_report.append(
-                            registry.serialize(assertion_obj)
-                        )
-
-                testcase_report.runtime_status = RuntimeStatus.FINISHED
-
-                if testcase.attrib["status"] != "notrun":
+                    _release(element)
+            elif event == "end":
+                testcase_report = self._testcase_report(element)
+                if element.attrib["status"] != "notrun":
                     suite_report.append(testcase_report)
-                    suite_has_run = True
+                    has_run.add(suite_report.name)
+                _release(element)
 
-            if suite_has_run:
-                result.append(suite_report)
-        return result
+        return [
+            report for name, report in suite_reports.items() if name in has_run
+        ]
+
+    @staticmethod
+    def _testcase_report(testcase):
+        """Create a testcase report from a parsed testcase element."""
+        testcase_name = testcase.attrib["name"]
+        testcase_report = TestCaseReport(name=testcase_name, uid=testcase_name)
+
+        entries = list(testcase)
+        if not entries:
+            assertion_obj = RawAssertion(
+                description="Passed",
+                content="Testcase {} passed".format(testcase_name),
+                passed=True,
+            )
+            testcase_report.append(registry.serialize(assertion_obj))
+        else:
+            for entry in entries:
+                assertion_obj = RawAssertion(
+                    description=entry.tag,
+                    content=entry.text,
+                    passed=entry.tag != "failure",
+                )
+                testcase_report.append(registry.serialize(assertion_obj))
+
+        testcase_report.runtime_status = RuntimeStatus.FINISHED
+        return testcase_report
 
     def parse_test_context(self, test_list_output):
         """Parse GTest test listing from stdout"""
@@ -246,13 +448,11 @@ class GTest(ProcessRunnerTest):
 
     def update_test_report(self):
         """
-        Attach XML report contents to the report, which can be
+        Attach XML report path to the report, which can be
         used by XML exporters, but will be discarded by serializers.
         """
         super(GTest, self).update_test_report()
-
-        with open(self.report_path) as report_xml:
-            self.result.report.xml_string = report_xml.read()
+        self.result.report.xml_path = self.report_path
 
     def test_command_filter(self, testsuite_pattern, testcase_pattern):
         """
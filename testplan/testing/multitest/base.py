@@ -14,6 +14,7 @@ import collections
 import functools
 from concurrent import futures
 import itertools
+import uuid
 
 import schema
 
@@ -70,6 +71,8 @@ class MultiTestConfig(testing_base.TestConfig):
             config.ConfigOption("fix_spec_path", default=None): schema.Or(
                 None, schema.And(str, os.path.exists)
             ),
+            config.ConfigOption("spill_entries", default=False): bool,
+            config.ConfigOption("spill_tables", default=False): bool,
         }
 
 
@@ -119,6 +122,16 @@ class MultiTest(testing_base.Test):
     :type result: :py:class:`~testplan.testing.multitest.result.result.Result`
     :param fix_spec_path: Path of fix specification file.
     :type fix_spec_path: ``NoneType`` or ``str``.
+    :param spill_entries: Write the entries of each testcase to a file in
+        the scratch directory as they are added, keeping only the failing
+        ones in memory. Useful for testcases logging a very large number
+        of entries. Not applied to summarized testcases, nor on the workers of
+        a remote pool as the files would not be available on the local host.
+    :type spill_entries: ``bool``
+    :param spill_tables: Write the tables of the testcases larger than
+        ``TABLE_SPILL_THRESHOLD`` rows to compressed attachments, keeping
+        only their failing rows and a sample of the first rows in the report.
+    :type spill_tables: ``bool``
 
     Also inherits all
     :py:class:`~testplan.testing.base.Test` options.
@@ -151,6 +164,8 @@ class MultiTest(testing_base.Test):
         tags=None,
         result=result.Result,
         fix_spec_path=None,
+        spill_entries=False,
+        spill_tables=False,
         **options
     ):
         self._tags_index = None
@@ -365,6 +380,9 @@ class MultiTest(testing_base.Test):
             self.result.report.status_override = testplan.report.Status.ERROR
 
         if step == self.resources.stop:
+            for uid, interval in self.resources.stop_timer.items():
+                self.result.report.timer["stop:{}".format(uid)] = interval
+
             drivers = set(self.resources.start_exceptions.keys())
             drivers.update(self.resources.stop_exceptions.keys())
             for driver in drivers:
@@ -811,8 +829,16 @@ class MultiTest(testing_base.Test):
         """Runs a testcase method and returns its report."""
         testcase_report = self._new_testcase_report(testcase)
         testcase_report.runtime_status = testplan.report.RuntimeStatus.RUNNING
+        result_options = {}
+        spill_path = self._entries_spill_path(testcase)
+        if spill_path:
+            result_options["_spill_path"] = spill_path
+        if self.cfg.spill_tables:
+            result_options["_spill_tables"] = True
         case_result = self.cfg.result(
-            stdout_style=self.stdout_style, _scratch=self.scratch
+            stdout_style=self.stdout_style,
+            _scratch=self.scratch,
+            **result_options
         )
 
         with testcase_report.timer.record("run"):
@@ -866,6 +892,23 @@ class MultiTest(testing_base.Test):
 
         return testcase_report
 
+    def _entries_spill_path(self, testcase):
+        """
+        Path of the file the entries of a testcase are spilled to, or
+        ``None`` if entries are kept in memory. Entries are kept in memory on
+        remote workers, their reports are read on the local host.
+        """
+        if (
+            not self.cfg.spill_entries
+            or self.scratch is None
+            or getattr(testcase, "summarize", False)
+            or os.environ.get("TESTPLAN_REMOTE_WORKSPACE")
+        ):
+            return None
+        return os.path.join(
+            self.scratch, "entries-{}.jsonl".format(uuid.uuid4())
+        )
+
     def _wrap_run_step(self, func, label):
         """
         Utility wrapper for special step related functions
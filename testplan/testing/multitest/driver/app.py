@@ -1,6 +1,7 @@
 """Generic application driver."""
 
 import os
+import six
 import uuid
 import shutil
 import warnings
@@ -39,6 +40,7 @@ class AppConfig(DriverConfig):
             ConfigOption("binary_copy", default=False): bool,
             ConfigOption("app_dir_name", default=None): Or(None, str),
             ConfigOption("working_dir", default=None): Or(None, str),
+            ConfigOption("process_group", default=True): bool,
         }
 
 
@@ -68,6 +70,10 @@ class App(Driver):
     :type app_dir_name: ``str``
     :param working_dir: Application working directory. Default: runpath
     :type working_dir: ``str``
+    :param process_group: Start the application as the leader of a new
+        process group (POSIX only), so that on stop the whole process tree
+        is signalled at once.
+    :type process_group: ``bool``
 
     Also inherits all
     :py:class:`~testplan.testing.multitest.driver.base.DriverConfig` options.
@@ -86,6 +92,7 @@ class App(Driver):
         binary_copy=False,
         app_dir_name=None,
         working_dir=None,
+        process_group=True,
         **options
     ):
         options.update(self.filter_locals(locals()))
@@ -236,6 +243,7 @@ class App(Driver):
                 stderr=self.std.err,
                 cwd=cwd,
                 env=self.env,
+                **self._popen_group_options()
             )
         except Exception:
             self.logger.error(
@@ -245,6 +253,14 @@ class App(Driver):
             )
             raise
 
+    def _popen_group_options(self):
+        """Extra ``subprocess.Popen`` arguments for process group support."""
+        if not self.cfg.process_group or os.name != "posix":
+            return {}
+        if six.PY2:
+            return {"preexec_fn": os.setsid}
+        return {"start_new_session": True}
+
     def stopping(self):
         """Stops the application binary process."""
         super(App, self).stopping()
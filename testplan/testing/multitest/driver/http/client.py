@@ -2,10 +2,12 @@
 
 import time
 import os
-from threading import Thread, Event
+from threading import Event
+from concurrent import futures
 
 import requests
-from schema import Use, Or
+from requests.adapters import HTTPAdapter
+from schema import Use, Or, And
 from six.moves import queue
 
 from testplan.common.config import ConfigOption as Optional
@@ -35,6 +37,7 @@ class HTTPClientConfig(DriverConfig):
             Optional("protocol", default="http"): str,
             Optional("timeout", default=5): Use(int),
             Optional("interval", default=0.01): Use(float),
+            Optional("pool_size", default=10): And(Use(int), lambda n: n > 0),
         }
 
 
@@ -55,6 +58,10 @@ class HTTPClient(Driver):
     :param interval: Number of seconds to sleep whilst trying to receive a
       message.
     :type interval: ``int``
+    :param pool_size: Maximum number of requests in flight, which is both the
+      number of worker threads sending requests and the number of keep-alive
+      connections kept open per host.
+    :type pool_size: ``int``
     """
 
     CONFIG = HTTPClientConfig
@@ -67,6 +74,7 @@ class HTTPClient(Driver):
         protocol="http",
         timeout=5,
         interval=0.01,
+        pool_size=10,
         **options
     ):
         options.update(self.filter_locals(locals()))
@@ -77,7 +85,9 @@ class HTTPClient(Driver):
         self.timeout = None
         self.interval = None
         self.responses = None
-        self.request_threads = []
+        self._session = None
+        self._executor = None
+        self._pending_requests = []
         self._logname = "{0}.log".format(slugify(self.cfg.name))
 
     @property
@@ -108,6 +118,15 @@ class HTTPClient(Driver):
         self.timeout = self.cfg.timeout
         self.interval = self.cfg.interval
         self.responses = queue.Queue()
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.cfg.pool_size
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=self.cfg.pool_size
+        )
         self.file_logger.debug(
             "Started HTTPClient sending requests to {}://{}{}".format(
                 self.protocol,
@@ -121,16 +140,32 @@ class HTTPClient(Driver):
         Stop the HTTPClient.
         """
         super(HTTPClient, self).stopping()
+        self._close_session()
         self.file_logger.debug("Stopped HTTPClient.")
         self._close_file_logger()
 
     def aborting(self):
         """Abort logic that stops the client."""
+        self._close_session()
         self.file_logger.debug("Aborting HTTPClient.")
 
+    def _close_session(self):
+        """Stop the worker threads and close the pooled connections."""
+        for future, drop_response in self._pending_requests:
+            drop_response.set()
+            # Requests not sent yet must not reach the server once stopped
+            future.cancel()
+        self._pending_requests = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
     def _send_request(self, method, api, drop_response, timeout, **kwargs):
         """
-        Send a request using the requests module.
+        Send a request using the pooled ``requests.Session``.
 
         :param method: HTTP method to be used in request (e.g. GET, POST etc.).
         :type method: ``str``
@@ -145,7 +180,11 @@ class HTTPClient(Driver):
           modules docs for these arguments.
         :type kwargs: Depends on the argument.
         """
-        http_method = getattr(requests, method, requests.get)
+        session = self._session
+        if session is None:
+            # The client was stopped while the request was queued
+            return
+        http_method = getattr(session, method, session.get)
         api = api[1:] if api.startswith("/") else api
         url = "{protocol}://{host}{port}/{api}".format(
             protocol=self.protocol,
@@ -157,13 +196,19 @@ class HTTPClient(Driver):
         self.file_logger.debug(
             "Sending {} request: {}".format(http_method.__name__.upper(), url)
         )
-        response = http_method(url=url, timeout=timeout, **kwargs)
+        try:
+            response = http_method(url=url, timeout=timeout, **kwargs)
+        except Exception as exc:
+            self.file_logger.error("Request to {} failed: {}".format(url, exc))
+            raise
         if not drop_response.is_set():
             self.responses.put(response)
 
     def send(self, method, api, **kwargs):
         """
-        Send a non blocking HTTP request.
+        Send a non blocking HTTP request. Requests are sent by a bounded
+        pool of worker threads reusing keep-alive connections, so at most
+        ``pool_size`` of them are in flight at any time.
 
         :param method: HTTP method to be used in request (e.g. GET, POST etc.).
         :type method: ``str``
@@ -174,14 +219,20 @@ class HTTPClient(Driver):
         :type kwargs: Depends on the argument.
         """
         drop_response = Event()
-        request_thread = Thread(
-            target=self._send_request,
-            args=(method, api, drop_response, self.timeout),
-            kwargs=kwargs,
+        future = self._executor.submit(
+            self._send_request,
+            method,
+            api,
+            drop_response,
+            self.timeout,
+            **kwargs
         )
-        request_thread.setDaemon(True)
-        request_thread.start()
-        self.request_threads.append((request_thread, drop_response))
+        self._pending_requests = [
+            (pending, drop)
+            for pending, drop in self._pending_requests
+            if not pending.done()
+        ]
+        self._pending_requests.append((future, drop_response))
 
     def head(self, api, **kwargs):
         """
@@ -310,9 +361,10 @@ class HTTPClient(Driver):
         Drop any currently incoming messages and flush the received messages
         queue.
         """
-        for _, drop_message in self.request_threads:
+        for _, drop_message in self._pending_requests:
             drop_message.set()
-            self.file_logger.debug("Request thread set to drop response.")
+            self.file_logger.debug("Pending request set to drop response.")
+        self._pending_requests = []
 
         timeout = time.time() + (5 * self.timeout)
         while not self.responses.empty() and time.time() < timeout:
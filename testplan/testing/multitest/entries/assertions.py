@@ -19,8 +19,15 @@ import copy
 
 from testplan.common.utils.convert import make_tuple, flatten_dict_comparison
 from testplan.common.utils import comparison, difflib
+from testplan.common.utils.match import compile_regex
+from testplan.common.utils import table as table_utils
+from testplan.common.serialization.fields import (
+    native_or_pformat_dict,
+    native_or_pformat_list,
+)
+from testplan import defaults
 
-from .base import BaseEntry, get_table
+from .base import Attachment, BaseEntry, get_table
 
 
 __all__ = [
@@ -50,6 +57,8 @@ __all__ = [
     "EqualSlices",
     "EqualExcludeSlices",
     "LineDiff",
+    "LogfileMatch",
+    "LogfileNotMatch",
     "ColumnContain",
     "TableMatch",
     "TableDiff",
@@ -239,7 +248,7 @@ class RegexAssertion(Assertion):
     ):
         if isinstance(regexp, six.string_types):
             self.pattern = regexp
-            self.regexp = re.compile(regexp, flags=flags)
+            self.regexp = compile_regex(regexp, flags=flags)
         else:
             if flags != 0:
                 raise ValueError(
@@ -319,16 +328,45 @@ class RegexMatchLine(RegexAssertion):
     """
     Match indexes are a little bit different than other
     assertions for this one: (line_no, begin, end)
+
+    ``string`` can also be an iterable of lines (e.g. an open file), which
+    is consumed line by line without loading the whole text. Only matching
+    lines are kept in that case: ``string`` is replaced by the matching
+    lines and ``line_no`` of the match indexes refers to them, while
+    ``line_numbers`` holds the original line numbers.
     """
 
+    def __init__(
+        self, regexp, string, flags=0, description=None, category=None
+    ):
+        self.line_numbers = []
+        super(RegexMatchLine, self).__init__(
+            regexp, string, flags, description=description, category=category
+        )
+
     def evaluate(self):
-        lines = self.string.split(os.linesep)
-        for line_num, line in enumerate(lines):
+        if isinstance(self.string, six.string_types):
+            lines = self.string.split(os.linesep)
+            for line_num, line in enumerate(lines):
+                match = self.regexp.match(line)
+                if match:
+                    self.match_indexes.append(
+                        (line_num, match.start(), match.end())
+                    )
+                    self.line_numbers.append(line_num)
+            return self.match_indexes
+
+        matched_lines = []
+        for line_num, line in enumerate(self.string):
+            line = line.rstrip("\r\n")
             match = self.regexp.match(line)
             if match:
                 self.match_indexes.append(
-                    (line_num, match.start(), match.end())
+                    (len(matched_lines), match.start(), match.end())
                 )
+                self.line_numbers.append(line_num)
+                matched_lines.append(line)
+        self.string = os.linesep.join(matched_lines)
         return self.match_indexes
 
 
@@ -617,6 +655,88 @@ class LineDiff(Assertion):
         return self.delta == []
 
 
+class LogfileMatch(Assertion):
+    """
+    Assertion that checks if each of the patterns matches a line of a log
+    file, scanning from the current position of a ``LogMatcher`` and
+    waiting up to ``timeout`` seconds for matching lines to be written.
+
+    ``matched_lines`` holds the line matched by each pattern, ``None`` for
+    the patterns that did not match.
+    """
+
+    def __init__(
+        self, log_matcher, regexps, timeout=5, description=None, category=None,
+    ):
+        if isinstance(regexps, six.string_types) or hasattr(
+            regexps, "pattern"
+        ):
+            regexps = [regexps]
+
+        self._log_matcher = log_matcher
+        self._regexps = regexps
+        self.log_path = log_matcher.log_path
+        self.patterns = [
+            getattr(regexp, "pattern", regexp) for regexp in regexps
+        ]
+        self.timeout = timeout
+        self.matched_lines = []  # will be populated via self.evaluate
+
+        super(LogfileMatch, self).__init__(
+            description=description, category=category
+        )
+
+    def evaluate(self):
+        matches = self._log_matcher.match_each(
+            self._regexps, timeout=self.timeout, raise_on_timeout=False
+        )
+        self.matched_lines = [
+            None if match is None else match.string.rstrip("\r\n")
+            for match in matches
+        ]
+        return all(match is not None for match in matches)
+
+
+class LogfileNotMatch(Assertion):
+    """
+    Assertion that checks if a pattern matches none of the lines of a log
+    file between two marks of a ``LogMatcher``, without waiting for new
+    lines.
+
+    ``matches`` holds the ``(line_no, line)`` pairs of the matching lines.
+    """
+
+    def __init__(
+        self,
+        log_matcher,
+        regexp,
+        start=None,
+        end=None,
+        description=None,
+        category=None,
+    ):
+        self._log_matcher = log_matcher
+        self._regexp = regexp
+        self.log_path = log_matcher.log_path
+        self.pattern = getattr(regexp, "pattern", regexp)
+        self.start = start
+        self.end = end
+        self.matches = []  # will be populated via self.evaluate
+
+        super(LogfileNotMatch, self).__init__(
+            description=description, category=category
+        )
+
+    def evaluate(self):
+        self.matches = [
+            (line_no, match.string.rstrip("\r\n"))
+            for line_no, match in self._log_matcher.iter_matches(
+                self._regexp, start=self.start, end=self.end
+            )
+        ]
+        return not self.matches
+
+
 ColumnContainComparison = collections.namedtuple(
     "ColumnContainComparison", "idx value passed"
 )
@@ -626,6 +746,9 @@ class ColumnContain(Assertion):
     """
     Checks if the any of the ``value`` in ``values``
     exists in the ``column`` of ``table``.
+
+    ``table`` can also be a ``pandas.DataFrame``, in which case the column
+    is checked without converting the frame into rows.
     """
 
     def __init__(
@@ -638,7 +761,9 @@ class ColumnContain(Assertion):
         description=None,
         category=None,
     ):
-        self.table = get_table(table)
+        self.table = (
+            table if table_utils.is_dataframe(table) else get_table(table)
+        )
         self.values = values
         self.column = column
         self.limit = limit
@@ -649,27 +774,62 @@ class ColumnContain(Assertion):
             description=description, category=category
         )
 
+    def _contain_mask(self, cells):
+        """Return a boolean array, ``True`` for cells found in values."""
+        import numpy as np
+
+        if isinstance(cells, np.ndarray) and cells.dtype.kind in "biuf":
+            values = _numeric_array(list(self.values))
+            if values is not None:
+                return np.isin(cells, values)
+
+        lookup = self.values
+        if isinstance(lookup, (list, tuple, set)):
+            try:
+                lookup = frozenset(lookup)
+            except TypeError:  # unhashable values
+                pass
+
+        def contains(cell):
+            try:
+                return cell in lookup
+            except TypeError:  # unhashable cell
+                return cell in self.values
+
+        return np.fromiter(
+            (contains(cell) for cell in cells), dtype=bool, count=len(cells)
+        )
+
     def evaluate(self):
-        passed = True
+        import numpy as np
 
-        for idx, row in enumerate(self.table):
+        if not len(self.table):
+            return True
 
-            comp_obj = ColumnContainComparison(
-                idx=idx,
-                value=row[self.column],
-                passed=row[self.column] in self.values,
-            )
+        cells = table_utils.column_values(self.table, self.column)
+        mask = self._contain_mask(cells)
 
-            if not comp_obj.passed:
-                passed = False
+        # Only the reported rows get a comparison object. ``limit`` caps
+        # the number of reported rows, which are also the only rows
+        # processed unless we are reporting failures only.
+        if self.report_fails_only:
+            indices = np.flatnonzero(~mask)
+            passed = not len(indices)
+        else:
+            indices = np.arange(len(mask))
+            passed = bool(mask[: self.limit or None].all())
 
-            if not self.report_fails_only or (
-                self.report_fails_only and not comp_obj.passed
-            ):
-                self.data.append(comp_obj)
+        if self.limit:
+            indices = indices[: self.limit]
 
-            if self.limit and len(self.data) >= self.limit:
-                break
+        self.data = [
+            ColumnContainComparison(
+                idx=int(idx),
+                value=table_utils.native(cells[idx]),
+                passed=bool(mask[idx]),
+            )
+            for idx in indices
+        ]
         return passed
 
 
@@ -730,9 +890,9 @@ def get_comparison_columns(table_1, table_2, include_columns, exclude_columns):
     must have matching columns.
 
     :param table_1: First table
-    :type table_1: ``list`` of ``dict``
+    :type table_1: ``list`` of ``dict`` or ``pandas.DataFrame``
     :param table_2: Second table
-    :type table_2: ``list`` of ``dict``
+    :type table_2: ``list`` of ``dict`` or ``pandas.DataFrame``
     :param include_columns: Inclusion rules for columns.
     :type include_columns: ``list`` of ``str``
     :param exclude_columns: Exclusion rules for columns.
@@ -753,8 +913,8 @@ def get_comparison_columns(table_1, table_2, include_columns, exclude_columns):
             )
         )
 
-    columns_1 = table_1[0].keys() if table_1 else []
-    columns_2 = table_2[0].keys() if table_2 else []
+    columns_1 = table_utils.table_columns(table_1)
+    columns_2 = table_utils.table_columns(table_2)
 
     comparison_columns = columns_1
 
@@ -793,6 +953,147 @@ def get_comparison_columns(table_1, table_2, include_columns, exclude_columns):
     return comparison_columns
 
 
+def _numeric_array(values):
+    """
+    Return ``values`` as a numeric NumPy array, or ``None`` if they are
+    not all numbers of the same type (e.g. strings, mixed int & float or
+    objects that need python equality semantics).
+    """
+    import numpy as np
+
+    if isinstance(values, np.ndarray):
+        return values if values.dtype.kind in "biuf" else None
+
+    types = set(map(type, values))
+    if len(types) != 1 or not types <= {int, float, bool}:
+        return None
+
+    try:
+        array = np.asarray(values)
+    except OverflowError:
+        return None
+    return array if array.dtype.kind in "biuf" else None
+
+
+def _cell_match(first, second, strict):
+    """Match a single cell pair via ``comparison.basic_compare``."""
+    passed, error = comparison.basic_compare(
+        first=first, second=second, strict=strict
+    )
+    return not error and bool(passed)
+
+
+def _column_mask(first, second, strict):
+    """
+    Compare two columns at once, returning a boolean array that is ``True``
+    for matching cells.
+
+    Plain values are compared with vectorised equality, columns that
+    contain custom comparators are evaluated cell by cell.
+    """
+    import numpy as np
+
+    count = len(first)
+
+    if not isinstance(second, np.ndarray) or second.dtype.kind == "O":
+        samples = {type(value): value for value in second}.values()
+        if any(comparison.is_comparator(value) for value in samples):
+            return np.fromiter(
+                (
+                    _cell_match(cell_1, cell_2, strict)
+                    for cell_1, cell_2 in zip(first, second)
+                ),
+                dtype=bool,
+                count=count,
+            )
+
+    array_1, array_2 = _numeric_array(first), _numeric_array(second)
+    if (
+        array_1 is not None
+        and array_2 is not None
+        and array_1.dtype.kind == array_2.dtype.kind
+    ):
+        return array_1 == array_2
+
+    try:
+        return np.fromiter(
+            map(operator.eq, first, second), dtype=bool, count=count
+        )
+    except Exception:
+        # Equality may raise or return non-boolean values,
+        # ``basic_compare`` knows how to deal with those.
+        return np.fromiter(
+            (
+                _cell_match(cell_1, cell_2, strict)
+                for cell_1, cell_2 in zip(first, second)
+            ),
+            dtype=bool,
+            count=count,
+        )
+
+
+def _row_mask(table, expected_table, comparison_columns, strict):
+    """
+    Return a boolean array that is ``True`` for rows where
+    all ``comparison_columns`` match.
+    """
+    import numpy as np
+
+    num_rows = min(len(table), len(expected_table))
+    mask = np.ones(num_rows, dtype=bool)
+
+    for column_name in comparison_columns:
+        first = table_utils.column_values(table, column_name)[:num_rows]
+        second = table_utils.column_values(expected_table, column_name)[
+            :num_rows
+        ]
+        mask &= _column_mask(first, second, strict)
+
+    return mask
+
+
+def _compare_row(
+    idx, row_1, row_2, comparison_columns, display_columns, strict
+):
+    """Compare a single row couple, returning a ``RowComparison``."""
+    diff, errors, extra = {}, {}, {}
+
+    for column_name in comparison_columns:
+        first, second = row_1[column_name], row_2[column_name]
+
+        passed, error = comparison.basic_compare(
+            first=first, second=second, strict=strict
+        )
+
+        if error:
+            errors[column_name] = error
+
+        elif not passed:
+            diff[column_name] = second
+
+        # Populate extra if values differ (we don't check for equality
+        # as that may have raised an error for incompatible types as well
+        if first is not second and (error or passed):
+            extra[column_name] = second
+
+    row_data = [row_1[col] for col in display_columns]
+
+    # Need to populate extra with values from the
+    # second table, if they are not being used
+    # for comparison but have different values.
+    extra.update(
+        {
+            col: row_2[col]
+            for col in display_columns
+            if col not in comparison_columns
+            and col in row_2
+            and row_2[col] != row_1[col]
+        }
+    )
+
+    return RowComparison(idx, row_data, diff, errors, extra)
+
+
 def compare_rows(
     table,
     expected_table,
@@ -806,11 +1107,15 @@ def compare_rows(
     Apply row by row comparison of two tables,
     creating a ``RowComparison`` for each row couple.
 
+    When only failures are reported, the tables are compared column by
+    column first and ``RowComparison`` objects are created for the
+    failing rows only.
+
     :param table: Original table.
-    :type table: ``list`` of ``dict``
+    :type table: ``list`` of ``dict`` or ``pandas.DataFrame``
     :param expected_table: Comparison table, it can contain
                            custom comparators as column values.
-    :type expected_table: ``list`` of ``dict``
+    :type expected_table: ``list`` of ``dict`` or ``pandas.DataFrame``
     :param comparison_columns: Columns to be used for comparison.
     :type comparison_columns: ``list`` of ``str``
     :param display_columns: Columns to be used
@@ -830,6 +1135,7 @@ def compare_rows(
     :type report_fails_only: ``bool``
     :returns: overall passed status and RowComparison data.
     """
+    import numpy as np
 
     # We always want to display a superset of comparison columns
     # otherwise we can have a failing comparison but the
@@ -843,50 +1149,33 @@ def compare_rows(
             )
         )
 
-    data = []
-    num_failures = 0
-    display_only = [
-        col for col in display_columns if col not in comparison_columns
-    ]
-
-    for idx, (row_1, row_2) in enumerate(zip(table, expected_table)):
-        diff, errors, extra = {}, {}, {}
-
-        for column_name in comparison_columns:
-            first, second = row_1[column_name], row_2[column_name]
-
-            passed, error = comparison.basic_compare(
-                first=first, second=second, strict=strict
-            )
-
-            if error:
-                errors[column_name] = error
-
-            elif not passed:
-                diff[column_name] = second
-
-            # Populate extra if values differ (we don't check for equality
-            # as that may have raised an error for incompatible types as well
-            if first is not second and (error or passed):
-                extra[column_name] = second
-
-        row_data = [row_1[col] for col in display_columns]
-
-        # Need to populate extra with values from the
-        # second table, if they are not being used
-        # for comparison but have different values.
-        extra.update(
-            {
-                col: row_2[col]
-                for col in display_only
-                if col in row_2 and row_2[col] != row_1[col]
-            }
+    if report_fails_only:
+        failing = np.flatnonzero(
+            ~_row_mask(table, expected_table, comparison_columns, strict)
         )
+        if fail_limit > 0:
+            failing = failing[:fail_limit]
+
+        data = [
+            _compare_row(
+                int(idx),
+                table_utils.get_row(table, idx),
+                table_utils.get_row(expected_table, idx),
+                comparison_columns,
+                display_columns,
+                strict,
+            )
+            for idx in failing
+        ]
+        return not data, data
 
-        row_comparison = RowComparison(idx, row_data, diff, errors, extra)
+    data = []
+    num_failures = 0
 
-        if not (report_fails_only and row_comparison.passed):
-            data.append(row_comparison)
+    for row_comparison in iter_row_comparisons(
+        table, expected_table, comparison_columns, display_columns, strict
+    ):
+        data.append(row_comparison)
 
         if not row_comparison.passed:
             num_failures += 1
@@ -897,10 +1186,36 @@ def compare_rows(
     return num_failures == 0, data
 
 
+def iter_row_comparisons(
+    table, expected_table, comparison_columns, display_columns, strict=True
+):
+    """
+    Lazily compare two tables row by row, yielding a
+    ``RowComparison`` for each row couple.
+
+    See ``compare_rows`` for the description of the parameters.
+    """
+    for idx, (row_1, row_2) in enumerate(
+        zip(
+            table_utils.iter_rows(table),
+            table_utils.iter_rows(expected_table),
+        )
+    ):
+        yield _compare_row(
+            idx, row_1, row_2, comparison_columns, display_columns, strict
+        )
+
+
 class TableMatch(Assertion):
     """
     Match two tables using ``compare_rows``, may generate
     custom message if tables cannot be compared for certain reasons.
+
+    If ``spill_path`` is given and the tables have more rows than
+    ``spill_threshold`` (``defaults.TABLE_SPILL_THRESHOLD`` by default),
+    the full comparison is written to a compressed attachment at
+    ``spill_path``. Only the failing rows and the first ``spill_sample``
+    rows are then kept in ``data``.
     """
 
     def __init__(
@@ -915,9 +1230,18 @@ class TableMatch(Assertion):
         strict=False,
         description=None,
         category=None,
+        spill_path=None,
+        spill_threshold=None,
+        spill_sample=None,
     ):
-        self.table = get_table(table)
-        self.expected_table = get_table(expected_table)
+        self.table = (
+            table if table_utils.is_dataframe(table) else get_table(table)
+        )
+        self.expected_table = (
+            expected_table
+            if table_utils.is_dataframe(expected_table)
+            else get_table(expected_table)
+        )
         self.include_columns = include_columns
         self.exclude_columns = exclude_columns
         self.strict = strict
@@ -926,10 +1250,24 @@ class TableMatch(Assertion):
         self.fail_limit = fail_limit
         self.report_fails_only = report_fail_only
 
+        self.spill_path = spill_path
+        self.spill_threshold = (
+            defaults.TABLE_SPILL_THRESHOLD
+            if spill_threshold is None
+            else spill_threshold
+        )
+        self.spill_sample = (
+            defaults.TABLE_SPILL_SAMPLE
+            if spill_sample is None
+            else spill_sample
+        )
+
         # these will populated by self.evaluate
         self.display_columns = []
         self.message = None
         self.data = []
+        self.spill = None
+        self.attachment = None
 
         super(TableMatch, self).__init__(
             description=description, category=category
@@ -945,7 +1283,7 @@ class TableMatch(Assertion):
             ).format(len_table, len_expected)
             return False
 
-        if not (self.table or self.expected_table):
+        if not len_table:
             self.message = "Both tables are empty."
             return True
 
@@ -961,9 +1299,18 @@ class TableMatch(Assertion):
             return False  # Fail on invalid tables
 
         self.display_columns = (
-            self.table[0].keys() if self.report_all else comparison_columns
+            table_utils.table_columns(self.table)
+            if self.report_all
+            else comparison_columns
         )
 
+        if (
+            self.spill_path
+            and not self.report_fails_only
+            and len_table > self.spill_threshold
+        ):
+            return self._spill_rows(comparison_columns)
+
         passed, self.data = compare_rows(
             table=self.table,
             expected_table=self.expected_table,
@@ -975,6 +1322,78 @@ class TableMatch(Assertion):
         )
         return passed
 
+    def _spill_rows(self, comparison_columns):
+        """
+        Stream row comparisons into the spill file, keeping
+        only failing and sample rows in memory.
+        """
+        num_rows = len(self.table)
+        num_failures = 0
+        columns = (
+            ["idx"] + list(self.display_columns) + ["diff", "errors", "extra"]
+        )
+
+        with table_utils.ColumnarWriter(self.spill_path, columns) as writer:
+            for row_comparison in iter_row_comparisons(
+                self.table,
+                self.expected_table,
+                comparison_columns,
+                self.display_columns,
+                self.strict,
+            ):
+                idx, row, diff, errors, extra = row_comparison
+                writer.write(
+                    [idx]
+                    + native_or_pformat_list(row)
+                    + [
+                        native_or_pformat_dict(diff),
+                        native_or_pformat_dict(errors),
+                        native_or_pformat_dict(extra),
+                    ]
+                )
+
+                if not row_comparison.passed:
+                    num_failures += 1
+                    self.data.append(row_comparison)
+                elif idx < self.spill_sample:
+                    self.data.append(row_comparison)
+
+                if self.fail_limit > 0 and num_failures >= self.fail_limit:
+                    break
+
+        # The full comparison lives in the attachment now
+        self.table = self.expected_table = None
+
+        self.attachment = Attachment(
+            filepath=self.spill_path,
+            description="Table comparison ({} rows)".format(writer.num_rows),
+        )
+        self.spill = {
+            "dst_path": self.attachment.dst_path,
+            "num_rows": writer.num_rows,
+            "chunk_size": writer.chunk_size,
+        }
+        if writer.num_rows < num_rows:
+            self.message = (
+                "Comparison stopped after {} failing rows, compared {} of {}"
+                " rows, showing failing rows and the first {} rows."
+                " Compared rows are attached as {}.".format(
+                    num_failures,
+                    writer.num_rows,
+                    num_rows,
+                    self.spill_sample,
+                    self.attachment.orig_filename,
+                )
+            )
+        else:
+            self.message = (
+                "Compared {} rows, showing failing rows and the first {}"
+                " rows. Full comparison is attached as {}.".format(
+                    num_rows, self.spill_sample, self.attachment.orig_filename
+                )
+            )
+        return num_failures == 0
+
 
 class TableDiff(TableMatch):
     """
@@ -1181,6 +1600,15 @@ class DictMatch(Assertion):
     """
     Match two dictionaries by comparing values under
     each key recursively.
+
+    A precompiled ``matcher`` can be passed when the same ``expected``
+    dictionary is matched many times, in that case the key filters, report
+    mode, value comparison function and ``fail_fast`` are taken from the
+    matcher.
+
+    With ``fail_fast`` the comparison stops at the first mismatch and only
+    that mismatch is kept for the report, for when just the pass / fail
+    status matters.
     """
 
     def __init__(
@@ -1195,7 +1623,17 @@ class DictMatch(Assertion):
         actual_description=None,
         expected_description=None,
         value_cmp_func=comparison.COMPARE_FUNCTIONS["native_equality"],
+        matcher=None,
+        fail_fast=False,
     ):
+        if matcher is not None:
+            expected = matcher.expected
+            include_keys = matcher.only
+            exclude_keys = matcher.ignore
+            report_mode = matcher.report_mode
+            value_cmp_func = matcher.value_cmp_func
+            fail_fast = matcher.fail_fast
+
         self.value = value
         self.expected = expected
         self.include_keys = include_keys
@@ -1204,6 +1642,8 @@ class DictMatch(Assertion):
         self.expected_description = expected_description
         self._report_mode = report_mode
         self._value_cmp_func = value_cmp_func
+        self._matcher = matcher
+        self.fail_fast = fail_fast
 
         self.comparison = None  # will be set by evaluate
         super(DictMatch, self).__init__(
@@ -1212,14 +1652,18 @@ class DictMatch(Assertion):
 
     def evaluate(self):
         """Evaluate the dict match."""
-        passed, cmp_result = comparison.compare(
-            lhs=self.value,
-            rhs=self.expected,
-            ignore=self.exclude_keys,
-            only=self.include_keys,
-            report_mode=self._report_mode,
-            value_cmp_func=self._value_cmp_func,
-        )
+        if self._matcher is not None:
+            passed, cmp_result = self._matcher.compare(self.value)
+        else:
+            passed, cmp_result = comparison.compare(
+                lhs=self.value,
+                rhs=self.expected,
+                ignore=self.exclude_keys,
+                only=self.include_keys,
+                report_mode=self._report_mode,
+                value_cmp_func=self._value_cmp_func,
+                fail_fast=self.fail_fast,
+            )
         self.comparison = flatten_dict_comparison(cmp_result)
         return passed
 
@@ -1241,6 +1685,7 @@ class FixMatch(DictMatch):
         category=None,
         actual_description=None,
         expected_description=None,
+        fail_fast=False,
     ):
         """
         If both FIX messages are typed, we enable strict type checking.
@@ -1266,6 +1711,7 @@ class FixMatch(DictMatch):
             actual_description=actual_description,
             expected_description=expected_description,
             value_cmp_func=value_cmp_func,
+            fail_fast=fail_fast,
         )
 
 
@@ -11,10 +11,11 @@ from past.builtins import basestring
 
 from testplan.common.utils.convert import nested_groups
 from testplan.common.utils.timing import utcnow
-from testplan.common.utils.table import TableEntry
+from testplan.common.utils.table import TableEntry, ColumnarWriter
 from testplan.common.utils.reporting import fmt
 from testplan.common.utils.convert import flatten_formatted_object
 from testplan.common.utils import path as path_utils
+from testplan.common.serialization.fields import native_or_pformat_list
 from testplan import defaults
 
 
@@ -230,16 +231,62 @@ class Log(BaseEntry):
 
 
 class TableLog(BaseEntry):
-    """Log a table to the report."""
+    """
+    Log a table to the report.
+
+    If ``spill_path`` is given and the table has more rows than
+    ``spill_threshold`` (``defaults.TABLE_SPILL_THRESHOLD`` by default),
+    the whole table is written to a compressed attachment at
+    ``spill_path`` and only the first ``spill_sample`` rows are kept
+    in the entry.
+    """
 
-    def __init__(self, table, display_index=False, description=None):
+    def __init__(
+        self,
+        table,
+        display_index=False,
+        description=None,
+        spill_path=None,
+        spill_threshold=None,
+        spill_sample=None,
+    ):
         self.table = get_table(table)
-        self.indices = range(len(self.table))
         self.display_index = display_index
         self.columns = self.table[0].keys()
+        self.spill = None
+        self.attachment = None
+
+        if spill_threshold is None:
+            spill_threshold = defaults.TABLE_SPILL_THRESHOLD
+        if spill_path and len(self.table) > spill_threshold:
+            self._spill_rows(
+                spill_path,
+                defaults.TABLE_SPILL_SAMPLE
+                if spill_sample is None
+                else spill_sample,
+            )
+
+        self.indices = range(len(self.table))
 
         super(TableLog, self).__init__(description=description)
 
+    def _spill_rows(self, spill_path, spill_sample):
+        """Write all rows to ``spill_path`` and keep a sample inline."""
+        with ColumnarWriter(spill_path, self.columns) as writer:
+            for row in self.table:
+                writer.write(native_or_pformat_list(row.values()))
+
+        self.table = self.table[:spill_sample]
+        self.attachment = Attachment(
+            filepath=spill_path,
+            description="Table ({} rows)".format(writer.num_rows),
+        )
+        self.spill = {
+            "dst_path": self.attachment.dst_path,
+            "num_rows": writer.num_rows,
+            "chunk_size": writer.chunk_size,
+        }
+
 
 class DictLog(BaseEntry):
     """Log a dict object to the report."""
@@ -81,6 +81,7 @@ class RegexSchema(AssertionSchema):
 class RegexMatchLineSchema(RegexSchema):
 
     match_context = fields.List(fields.Dict())
+    line_numbers = fields.List(fields.Integer())
 
 
 @registry.bind(asr.RegexFindIter)
@@ -126,6 +127,25 @@ class LineDiffSchema(AssertionSchema):
     delta = fields.List(custom_fields.NativeOrPretty())
 
 
+@registry.bind(asr.LogfileMatch)
+class LogfileMatchSchema(AssertionSchema):
+
+    log_path = fields.String()
+    patterns = fields.List(custom_fields.Unicode())
+    timeout = fields.Float()
+    matched_lines = fields.List(custom_fields.Unicode(allow_none=True))
+
+
+@registry.bind(asr.LogfileNotMatch)
+class LogfileNotMatchSchema(AssertionSchema):
+
+    log_path = fields.String()
+    pattern = custom_fields.Unicode()
+    start = fields.String(allow_none=True)
+    end = fields.String(allow_none=True)
+    matches = fields.List(fields.List(custom_fields.NativeOrPretty()))
+
+
 class ProcessExitStatusSchema(AssertionSchema):
 
     process = custom_fields.NativeOrPretty()
@@ -159,6 +179,7 @@ class TableMatchSchema(AssertionSchema):
     message = fields.String(allow_none=True)
     fail_limit = fields.Integer()
     report_fails_only = fields.Bool()
+    spill = fields.Dict(allow_none=True)
 
 
 @registry.bind(asr.XMLCheck)
@@ -192,6 +213,7 @@ class DictMatchSchema(AssertionSchema):
     actual_description = fields.String()
     expected_description = fields.String()
     comparison = fields.Raw()
+    fail_fast = fields.Boolean()
 
 
 @registry.bind(asr.DictMatchAll, asr.FixMatchAll)
@@ -56,6 +56,7 @@ class TableLogSchema(BaseSchema):
     indices = fields.List(fields.Integer(), allow_none=True)
     display_index = fields.Boolean()
     columns = fields.List(fields.String(), allow_none=False)
+    spill = fields.Dict(allow_none=True)
 
 
 @registry.bind(base.DictLog, base.FixLog)
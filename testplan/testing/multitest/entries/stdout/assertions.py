@@ -5,7 +5,6 @@ import re
 from terminaltables import AsciiTable
 
 import testplan.common.exporters.constants as constants
-from testplan.common.exporters.pdf import format_cell_data
 from testplan.common.utils.strings import Color
 
 from .. import assertions
@@ -160,6 +159,45 @@ class RegexMatchLineRenderer(AssertionRenderer):
         return "{}{}".format(pattern, entry.string)
 
 
+@registry.bind(assertions.LogfileMatch)
+class LogfileMatchRenderer(AssertionRenderer):
+    def get_assertion_details(self, entry):
+        """Return the line matched by each pattern."""
+        parts = ["File: `{}`".format(entry.log_path)]
+        for pattern, line in zip(entry.patterns, entry.matched_lines):
+            if line is None:
+                parts.append(
+                    "Pattern: `{}` - {}".format(
+                        pattern,
+                        Color.red("No match in {}s".format(entry.timeout)),
+                    )
+                )
+            else:
+                parts.append(
+                    "Pattern: `{}` - {}".format(pattern, Color.green(line))
+                )
+        return os.linesep.join(parts)
+
+
+@registry.bind(assertions.LogfileNotMatch)
+class LogfileNotMatchRenderer(AssertionRenderer):
+    def get_assertion_details(self, entry):
+        """Return the lines matched by the pattern, if any."""
+        parts = [
+            "File: `{}`".format(entry.log_path),
+            "Pattern: `{}`".format(entry.pattern),
+        ]
+        for line_no, line in entry.matches[: constants.NUM_DISPLAYED_ROWS]:
+            parts.append("{}: {}".format(line_no, Color.red(line)))
+        if len(entry.matches) > constants.NUM_DISPLAYED_ROWS:
+            parts.append(
+                "[truncated after displaying first {} matches ...]".format(
+                    constants.NUM_DISPLAYED_ROWS
+                )
+            )
+        return os.linesep.join(parts)
+
+
 @registry.bind(assertions.RegexMatchNotExists, assertions.RegexSearchNotExists)
 class RegexNotMatchRenderer(RegexMatchRenderer):
     highlight_color = "red"
@@ -200,6 +238,9 @@ class TableMatchRenderer(AssertionRenderer):
         display_index=False,
     ):
         """Return single row data to be printed"""
+        # Imported here as the pdf utilities pull in reportlab
+        from testplan.common.exporters.pdf import format_cell_data
+
         result = []
 
         for idx, column in enumerate(columns):
@@ -234,18 +275,21 @@ class TableMatchRenderer(AssertionRenderer):
         else:
             result = ""
 
+        # Spilled comparisons only keep some of the rows
+        display_index = entry.report_fails_only or entry.spill is not None
+
         row_data = [
             self.get_row_data(
                 row_comparison,
                 entry.display_columns,
-                display_index=entry.report_fails_only,
+                display_index=display_index,
             )
             for row_comparison in entry.data
         ]
 
         columns = (
             ["row"] + list(entry.display_columns)
-            if entry.report_fails_only
+            if display_index
             else entry.display_columns
         )
         ascii_table = (
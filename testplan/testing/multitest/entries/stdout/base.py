@@ -28,27 +28,37 @@ class StdOutRegistry(Registry):
         return os.linesep.join(parts)
 
     def log_entry(self, entry, stdout_style):
+        """
+        Log the header and details of ``entry``. Renderers are only invoked
+        for the parts that the given stdout style displays, so expensive
+        detail formatting is skipped entirely for hidden assertions.
+        """
         from testplan.testing.base import ASSERTION_INDENT
 
-        logger = self[entry]()
-        header = logger.get_header(entry)
-        details = logger.get_details(entry) or ""
         output_style = stdout_style.get_style(passing=bool(entry))
+        if not (
+            output_style.display_assertion
+            or output_style.display_assertion_detail
+        ):
+            return
 
-        if header is None:
-            raise ValueError(
-                "Empty header returned by"
-                " {logger} for {entry}".format(logger=logger, entry=entry)
-            )
-
-        header_msg = self.indented_msg(header, ASSERTION_INDENT)
-        details_msg = self.indented_msg(details, ASSERTION_INDENT + 2)
+        logger = self[entry]()
 
         if output_style.display_assertion:
-            self.logger.test_info(header_msg)
+            header = logger.get_header(entry)
+            if header is None:
+                raise ValueError(
+                    "Empty header returned by"
+                    " {logger} for {entry}".format(logger=logger, entry=entry)
+                )
+            self.logger.test_info(self.indented_msg(header, ASSERTION_INDENT))
 
-        if details and output_style.display_assertion_detail:
-            self.logger.test_info(details_msg)
+        if output_style.display_assertion_detail:
+            details = logger.get_details(entry)
+            if details:
+                self.logger.test_info(
+                    self.indented_msg(details, ASSERTION_INDENT + 2)
+                )
 
 
 registry = StdOutRegistry()
@@ -109,7 +119,12 @@ class MatPlotRenderer(BaseRenderer):
 class TableLogRenderer(BaseRenderer):
     def get_details(self, entry):
         rows = [[x for _, x in row.items()] for row in entry.table]
-        return AsciiTable([entry.columns] + rows).table
+        table = AsciiTable([entry.columns] + rows).table
+        if entry.spill:
+            table += "{}({} of {} rows shown, see attachment)".format(
+                os.linesep, len(rows), entry.spill["num_rows"]
+            )
+        return table
 
 
 @registry.bind(base.DictLog, base.FixLog)
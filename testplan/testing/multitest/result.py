@@ -7,13 +7,18 @@ after testcases have finished running.
 
 """
 import inspect
+import io
 import os
 import re
+import sys
 import uuid
 
+import six
+
 from testplan import defaults
 from testplan.defaults import STDOUT_STYLE
 from testplan.common.utils import comparison
+from testplan.report.testing.spill import EntrySpill
 
 from .entries import assertions, base
 from .entries.schemas.base import registry as schema_registry
@@ -87,15 +92,17 @@ class ExceptionCapture(object):
         return True
 
 
-def _bind_entry(entry, result_obj):
+def _bind_entry(entry, result_obj, caller_frame=None):
     """
     Appends return value of a assertion / log method to the ``Result`` object's
     ``entries`` list.
     """
-    # Second element is the caller
-    caller_frame = inspect.stack()[1]
-    entry.file_path = os.path.abspath(caller_frame[1])
-    entry.line_no = caller_frame[2]
+    if caller_frame is None:
+        # Looking up the caller frame directly is much cheaper than
+        # inspect.stack(), which reads the source of every frame
+        caller_frame = sys._getframe(1)  # pylint: disable=protected-access
+    entry.file_path = os.path.abspath(caller_frame.f_code.co_filename)
+    entry.line_no = caller_frame.f_lineno
 
     result_obj.entries.append(entry)
 
@@ -426,6 +433,66 @@ class RegexNamespace(AssertionNamespace):
         _bind_entry(entry, self.result)
         return entry
 
+    def matchline_stream(
+        self,
+        regexp,
+        source,
+        description=None,
+        category=None,
+        flags=0,
+        encoding=None,
+    ):
+        r"""
+        Checks if the given ``regexp`` returns a match (``re.match``) for any
+        of the lines of a text file or an iterable of lines. Lines are
+        matched one at a time so the whole text is never loaded in memory,
+        only the matching lines are kept for the report.
+
+        .. code-block:: python
+
+            result.regex.matchline_stream(
+                regexp=re.compile(r'.* ERROR .*'),
+                source=os.path.join(env.server.runpath, 'server.log'),
+            )
+
+        :param regexp: String pattern or compiled regexp object.
+        :type regexp: ``str`` or compiled regex
+        :param source: Path of a text file or iterable of lines to match
+                       against.
+        :type source: ``str`` or ``iterable`` of ``str``
+        :param flags: Regex flags that will be passed
+                      to the ``re.match`` function.
+        :type flags: ``int``
+        :param encoding: Encoding used to read ``source`` if it is a path,
+                         defaults to the platform encoding.
+        :type encoding: ``str``
+        :param description: Text description for the assertion.
+        :type description: ``str``
+        :param category: Custom category that will be used for summarization.
+        :type category: ``str``
+        :return: Assertion pass status
+        :rtype: ``bool``
+        """
+        if isinstance(source, six.string_types):
+            with io.open(source, "r", encoding=encoding) as lines:
+                entry = assertions.RegexMatchLine(
+                    regexp=regexp,
+                    string=lines,
+                    description=description,
+                    flags=flags,
+                    category=category,
+                )
+        else:
+            entry = assertions.RegexMatchLine(
+                regexp=regexp,
+                string=source,
+                description=description,
+                flags=flags,
+                category=category,
+            )
+        _bind_entry(entry, self.result)
+        return entry
+
 
 class TableNamespace(AssertionNamespace):
     """Contains logic for regular expression assertions."""
@@ -509,6 +576,11 @@ class TableNamespace(AssertionNamespace):
         either ``include_columns`` or ``exclude_columns`` arguments
         must be used to have column uniformity.
 
+        If the MultiTest ``spill_tables`` option is set, comparisons of
+        tables larger than ``TABLE_SPILL_THRESHOLD`` rows are written to a
+        compressed attachment, the report only keeps the failing rows and a
+        sample of the first rows.
+
         .. code-block:: python
 
             result.table.match(
@@ -574,7 +646,9 @@ class TableNamespace(AssertionNamespace):
             fail_limit=fail_limit,
             description=description,
             category=category,
+            spill_path=self.result._table_spill_path(),
         )
+        self.result._add_table_spill(entry)
         _bind_entry(entry, self.result)
         return entry
 
@@ -672,6 +746,10 @@ class TableNamespace(AssertionNamespace):
         """
         Logs a table to the report.
 
+        If the MultiTest ``spill_tables`` option is set, tables larger than
+        ``TABLE_SPILL_THRESHOLD`` rows are written to a compressed
+        attachment, the report only keeps the first rows.
+
         .. code-block:: python
 
             result.table.log(
@@ -693,8 +771,12 @@ class TableNamespace(AssertionNamespace):
         :rtype: ``bool``
         """
         entry = base.TableLog(
-            table=table, display_index=display_index, description=description
+            table=table,
+            display_index=display_index,
+            description=description,
+            spill_path=self.result._table_spill_path(),
         )
+        self.result._add_table_spill(entry)
         _bind_entry(entry, self.result)
 
 
@@ -831,6 +913,7 @@ class DictNamespace(AssertionNamespace):
         actual_description=None,
         expected_description=None,
         value_cmp_func=comparison.COMPARE_FUNCTIONS["native_equality"],
+        fail_fast=False,
     ):
         r"""
         Matches two dictionaries, supports nested data. Custom
@@ -894,6 +977,10 @@ class DictNamespace(AssertionNamespace):
                                and actual dicts. Defaults to using
                                `operator.eq()`.
         :type value_cmp_func: ``Callable[[Any, Any], bool]``
+        :param fail_fast: Stop comparing at the first mismatch and only
+                          report that mismatch, useful when the assertion
+                          is used as a filter, e.g. in a polling loop.
+        :type fail_fast: ``bool``
 
         :return: Assertion pass status
         :rtype: ``bool``
@@ -909,10 +996,105 @@ class DictNamespace(AssertionNamespace):
             actual_description=actual_description,
             category=category,
             value_cmp_func=value_cmp_func,
+            fail_fast=fail_fast,
         )
         _bind_entry(entry, self.result)
         return entry
 
+    def match_many(
+        self,
+        actuals,
+        expected,
+        description=None,
+        category=None,
+        include_keys=None,
+        exclude_keys=None,
+        report_mode=comparison.ReportOptions.ALL,
+        actual_description=None,
+        expected_description=None,
+        value_cmp_func=comparison.COMPARE_FUNCTIONS["native_equality"],
+        fail_fast=False,
+    ):
+        """
+        Matches each of the ``actuals`` dictionaries against the same
+        ``expected`` dictionary, adding a dict match entry per dictionary.
+
+        The ``expected`` dictionary is compiled once into a
+        :py:class:`~testplan.common.utils.comparison.DictMatcher`, which is
+        considerably faster than calling ``result.dict.match`` in a loop
+        when matching many dictionaries.
+
+        .. code-block:: python
+
+            result.dict.match_many(
+                actuals=received_messages,
+                expected={
+                    'foo': 1,
+                    'bar': comparison.In(['blue', 'red', 'yellow']),
+                },
+                exclude_keys=['timestamp'],
+                report_mode=comparison.ReportOptions.FAILS_ONLY,
+            )
+
+        :param actuals: Original dictionaries.
+        :type actuals: ``iterable`` of ``dict``
+        :param expected: Comparison dictionary, can contain custom comparators
+                         (e.g. regex, lambda functions)
+        :type expected: ``dict``
+        :param include_keys: Keys to exclusively consider in the comparison.
+        :type include_keys: ``list`` of ``object`` (items must be hashable)
+        :param exclude_keys: Keys to ignore in the comparison.
+        :type include_keys: ``list`` of ``object`` (items must be hashable)
+        :param report_mode: Specify which comparisons should be kept and
+                            reported. See ReportOptions enum for more detail.
+        :type report_mode: ``testplan.common.utils.comparison.ReportOptions``
+        :param actual_description: Column header description for original dict.
+        :type actual_description: ``str``
+        :param expected_description: Column header
+                                    description for expected dict.
+        :type expected_description: ``str``
+        :param description: Text description for the assertions.
+        :type description: ``str``
+        :param category: Custom category that will be used for summarization.
+        :type category: ``str``
+        :param value_cmp_func: Function to use to compare values in expected
+                               and actual dicts. Defaults to using
+                               `operator.eq()`.
+        :type value_cmp_func: ``Callable[[Any, Any], bool]``
+        :param fail_fast: Stop comparing at the first mismatch and only
+                          report that mismatch, useful when the assertion
+                          is used as a filter, e.g. in a polling loop.
+        :type fail_fast: ``bool``
+
+        :return: Assertion pass status, ``True`` if all dictionaries match
+        :rtype: ``bool``
+        """
+        matcher = comparison.DictMatcher(
+            expected=expected,
+            ignore=exclude_keys,
+            only=include_keys,
+            report_mode=report_mode,
+            value_cmp_func=value_cmp_func,
+            fail_fast=fail_fast,
+        )
+        caller_frame = sys._getframe(1)  # pylint: disable=protected-access
+        passed = True
+
+        for actual in actuals:
+            entry = assertions.DictMatch(
+                value=actual,
+                expected=expected,
+                description=description,
+                expected_description=expected_description,
+                actual_description=actual_description,
+                category=category,
+                matcher=matcher,
+            )
+            _bind_entry(entry, self.result, caller_frame=caller_frame)
+            passed = passed and bool(entry)
+
+        return passed
+
     def match_all(
         self,
         values,
@@ -1066,6 +1248,7 @@ class FixNamespace(AssertionNamespace):
         report_mode=comparison.ReportOptions.ALL,
         actual_description=None,
         expected_description=None,
+        fail_fast=False,
     ):
         """
         Matches two FIX messages, supports repeating groups (nested data).
@@ -1114,6 +1297,10 @@ class FixNamespace(AssertionNamespace):
         :type description: ``str``
         :param category: Custom category that will be used for summarization.
         :type category: ``str``
+        :param fail_fast: Stop comparing at the first mismatch and only
+                          report that mismatch, useful when the assertion
+                          is used as a filter, e.g. in a polling loop.
+        :type fail_fast: ``bool``
 
         :return: Assertion pass status
         :rtype: ``bool``
@@ -1128,6 +1315,7 @@ class FixNamespace(AssertionNamespace):
             report_mode=report_mode,
             expected_description=expected_description,
             actual_description=actual_description,
+            fail_fast=fail_fast,
         )
         _bind_entry(entry, self.result)
         return entry
@@ -1227,6 +1415,102 @@ class FixNamespace(AssertionNamespace):
         return entry
 
 
+class LogfileNamespace(AssertionNamespace):
+    """
+    Contains assertion logic that operates on log files, read with a
+    :py:class:`~testplan.common.utils.match.LogMatcher`.
+    """
+
+    def match(
+        self, log_matcher, regexp, timeout=5, description=None, category=None
+    ):
+        """
+        Checks that each of the patterns matches a line of the log file,
+        from the current position of ``log_matcher``. Lines written while
+        waiting are picked up until ``timeout`` seconds have elapsed. The
+        position of ``log_matcher`` is moved after the matched lines.
+
+        .. code-block:: python
+
+            log_matcher = LogMatcher(driver.logpath)
+            result.logfile.match(
+                log_matcher,
+                [r'.*Listener started', r'.*Connected to \\S+'],
+                timeout=10,
+            )
+
+        :param log_matcher: Log matcher of the log file.
+        :type log_matcher: ``testplan.common.utils.match.LogMatcher``
+        :param regexp: Pattern(s) to be matched, in any order.
+        :type regexp: ``str`` or compiled regex or a ``list`` of them
+        :param timeout: Seconds to wait for matching lines.
+        :type timeout: ``float``
+        :param description: Text description for the assertion.
+        :type description: ``str``
+        :param category: Custom category that will be used for summarization.
+        :type category: ``str``
+        :return: Assertion pass status
+        :rtype: ``bool``
+        """
+        entry = assertions.LogfileMatch(
+            log_matcher=log_matcher,
+            regexps=regexp,
+            timeout=timeout,
+            description=description,
+            category=category,
+        )
+        _bind_entry(entry, self.result)
+        return entry
+
+    def not_match(
+        self,
+        log_matcher,
+        regexp,
+        start=None,
+        end=None,
+        description=None,
+        category=None,
+    ):
+        """
+        Checks that the pattern matches none of the lines of the log file
+        between two marks of ``log_matcher``, without waiting for new lines.
+
+        .. code-block:: python
+
+            log_matcher.mark('start')
+            ...
+            log_matcher.mark('end')
+            result.logfile.not_match(
+                log_matcher, r'.*ERROR', start='start', end='end'
+            )
+
+        :param log_matcher: Log matcher of the log file.
+        :type log_matcher: ``testplan.common.utils.match.LogMatcher``
+        :param regexp: Pattern that should not be matched.
+        :type regexp: ``str`` or compiled regex
+        :param start: Mark to start from, defaults to the current position.
+        :type start: ``str``
+        :param end: Mark to stop at, defaults to the end of file.
+        :type end: ``str``
+        :param description: Text description for the assertion.
+        :type description: ``str``
+        :param category: Custom category that will be used for summarization.
+        :type category: ``str``
+        :return: Assertion pass status
+        :rtype: ``bool``
+        """
+        entry = assertions.LogfileNotMatch(
+            log_matcher=log_matcher,
+            regexp=regexp,
+            start=start,
+            end=end,
+            description=description,
+            category=category,
+        )
+        _bind_entry(entry, self.result)
+        return entry
+
+
 class Result(object):
     """
     Contains assertion methods and namespaces for generating test data.
@@ -1240,6 +1524,7 @@ class Result(object):
         "xml": XMLNamespace,
         "dict": DictNamespace,
         "fix": FixNamespace,
+        "logfile": LogfileNamespace,
     }
 
     def __init__(
@@ -1252,9 +1537,14 @@ class Result(object):
         _num_passing=defaults.SUMMARY_NUM_PASSING,
         _num_failing=defaults.SUMMARY_NUM_FAILING,
         _scratch=None,
+        _spill_path=None,
+        _spill_tables=False,
     ):
 
-        self.entries = []
+        if _spill_path is None:
+            self.entries = []
+        else:
+            self.entries = EntrySpill(_spill_path, schema_registry.serialize)
         self.attachments = []
 
         self.stdout_style = stdout_style or STDOUT_STYLE
@@ -1273,6 +1563,7 @@ class Result(object):
         self._num_passing = _num_passing
         self._num_failing = _num_failing
         self._scratch = _scratch
+        self._spill_tables = _spill_tables
 
     def subresult(self):
         """Subresult object to append/prepend assertions on another."""
@@ -1285,14 +1576,19 @@ class Result(object):
             _num_passing=self._num_passing,
             _num_failing=self._num_failing,
             _scratch=self._scratch,
+            _spill_tables=self._spill_tables,
         )
 
     def append(self, result):
         """Append entries from another result."""
-        self.entries += result.entries
+        self.entries.extend(result.entries)
 
     def prepend(self, result):
         """Prepend entries from another result."""
+        if isinstance(self.entries, EntrySpill):
+            raise RuntimeError(
+                "Cannot prepend entries to a result spilling its entries."
+            )
         self.entries = result.entries + self.entries
 
     def __enter__(self):
@@ -1389,6 +1685,8 @@ class Result(object):
     @property
     def passed(self):
         """Entries stored passed status."""
+        if isinstance(self.entries, EntrySpill):
+            return self.entries.passed
         return all(getattr(entry, "passed", True) for entry in self.entries)
 
     def log(self, message, description=None):
@@ -2040,6 +2338,22 @@ class Result(object):
         _bind_entry(attachment, self)
         return attachment
 
+    def _table_spill_path(self):
+        """
+        Path of the attachment that large tables are written to, or
+        ``None`` if spilling is not enabled or there is no scratch directory.
+        """
+        if not self._spill_tables or self._scratch is None:
+            return None
+        return os.path.join(
+            self._scratch, "table-{}.jsonl.gz".format(uuid.uuid4())
+        )
+
+    def _add_table_spill(self, entry):
+        """Attach the spilled rows of a table entry to the report."""
+        if entry.attachment is not None:
+            self.attachments.append(entry.attachment)
+
     def matplot(self, pyplot, width=2, height=2, description=None):
         """
         Displays a Matplotlib plot in the report.
@@ -2074,7 +2388,13 @@ class Result(object):
         """
         Return entry data in dictionary form. This will then be stored
         in related ``TestCaseReport``'s ``entries`` attribute.
+
+        If entries are spilled to disk, the spill file is closed and
+        entries are returned as a lazy
+        :py:class:`~testplan.report.testing.spill.SpilledEntries` sequence.
         """
+        if isinstance(self.entries, EntrySpill):
+            return self.entries.close()
         return [schema_registry.serialize(entry) for entry in self]
 
     def __repr__(self):
@@ -115,3 +115,5 @@ def schedule_tests_to_pool(name, pool, schedule_path=None, **pool_cfg):
     # All tasks scheduled once
     for uid in pool.task_assign_cnt:
         assert pool.task_assign_cnt[uid] == 1
+
+    return pool
@@ -88,6 +88,18 @@ def test_pool_basic():
     schedule_tests_to_pool(Pool, size=2)
 
 
+def test_pool_autoscale():
+    schedule_tests_to_pool(
+        Pool,
+        size=2,
+        autoscale=True,
+        max_size=4,
+        autoscale_interval=0.1,
+        max_cpu_load=100,
+        max_memory_load=100,
+    )
+
+
 def test_pool_custom_worker():
     class ThreadWorker(Worker):
         pass
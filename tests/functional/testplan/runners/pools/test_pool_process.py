@@ -27,6 +27,35 @@ def test_pool_basic():
     )
 
 
+def test_pool_forkserver():
+    """Scheduling to workers forked by a fork server."""
+    schedule_tests_to_pool(
+        "ProcPlan",
+        ProcessPool,
+        worker_start_method="forkserver",
+        worker_heartbeat=2,
+        heartbeats_miss_limit=2,
+    )
+
+
+def test_pool_autoscale():
+    """Scheduling to workers added and removed during the run."""
+    pool = schedule_tests_to_pool(
+        "ProcPlan",
+        ProcessPool,
+        size=1,
+        autoscale=True,
+        max_size=3,
+        autoscale_interval=0.5,
+        max_cpu_load=100,
+        max_memory_load=100,
+        worker_heartbeat=2,
+        heartbeats_miss_limit=2,
+    )
+    assert pool.autoscale_history
+    assert os.path.exists(os.path.join(pool.runpath, "autoscale.csv"))
+
+
 def test_kill_one_worker():
     """Kill one worker but pass after reassigning task."""
     pool_name = ProcessPool.__name__
@@ -91,7 +120,8 @@ def test_kill_one_worker():
             assert pool.task_assign_cnt[uid] == 1
 
 
-def test_kill_all_workers():
+@pytest.mark.parametrize("start_method", ("spawn", "forkserver"))
+def test_kill_all_workers(start_method):
     """Kill all workers and create a failed report."""
     pool_name = ProcessPool.__name__
     plan = Testplan(name="ProcPlan", parse_cmdline=False)
@@ -100,6 +130,7 @@ def test_kill_all_workers():
         name=pool_name,
         size=pool_size,
         task_retries_limit=pool_size,
+        worker_start_method=start_method,
         worker_heartbeat=2,
         heartbeats_miss_limit=2,
         max_active_loop_sleep=1,
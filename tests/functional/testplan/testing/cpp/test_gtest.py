@@ -1,7 +1,9 @@
 import os
 import platform
+import sys
 
 import pytest
+from lxml import etree
 
 from testplan import Testplan
 from testplan.common.utils.testing import (
@@ -67,3 +69,134 @@ def test_gtest(binary_dir, expected_report, report_status):
     check_report(expected=expected_report, actual=plan.report)
 
     assert plan.report.status == report_status
+
+
+MOCK_SHARDED_GTEST = """#!{python}
+import os
+import sys
+
+TESTS = [
+    ("SuiteA", "Test{{}}".format(idx)) for idx in range(3)
+] + [("SuiteB", "Test{{}}".format(idx)) for idx in range(3)]
+
+if "--gtest_list_tests" in sys.argv:
+    for suite in ("SuiteA", "SuiteB"):
+        print(suite + ".")
+        for _, case in TESTS[:3]:
+            print("  " + case)
+    sys.exit(0)
+
+output = [arg for arg in sys.argv if arg.startswith("--gtest_output=")][0]
+path = output.split(":", 1)[1]
+total = int(os.environ["GTEST_TOTAL_SHARDS"])
+index = int(os.environ["GTEST_SHARD_INDEX"])
+mine = [test for idx, test in enumerate(TESTS) if idx % total == index]
+print("shard {{}} ran {{}} tests".format(index, len(mine)))
+
+suites = []
+for name in ("SuiteA", "SuiteB"):
+    cases = [case for suite, case in mine if suite == name]
+    if cases:
+        suites.append(
+            '<testsuite name="{{}}" tests="{{}}" failures="0" disabled="0" '
+            'errors="0" time="0">{{}}</testsuite>'.format(
+                name,
+                len(cases),
+                "".join(
+                    '<testcase name="{{}}" status="run" time="0" '
+                    'classname="{{}}" />'.format(case, name)
+                    for case in cases
+                ),
+            )
+        )
+
+with open(path, "w") as report:
+    report.write(
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<testsuites tests="{{}}" failures="0" disabled="0" errors="0" '
+        'time="0" name="AllTests">{{}}</testsuites>'.format(
+            len(mine), "".join(suites)
+        )
+    )
+"""
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows", reason="GTest is skipped on Windows."
+)
+def test_gtest_shards(runpath):
+    """Sharded results are merged into a single report."""
+    binary_path = os.path.join(runpath, "shardedTests")
+    with open(binary_path, "w") as binary:
+        binary.write(MOCK_SHARDED_GTEST.format(python=sys.executable))
+    os.chmod(binary_path, 0o755)
+
+    plan = Testplan(name="plan", parse_cmdline=False)
+    plan.add(GTest(name="MyGTest", driver=binary_path, shards=3))
+
+    with log_propagation_disabled(TESTPLAN_LOGGER):
+        assert plan.run().run is True
+
+    report = plan.report.entries[0]
+    assert report.status == Status.PASSED
+    assert [suite.name for suite in report] == [
+        "SuiteA",
+        "SuiteB",
+        "ProcessChecks",
+    ]
+    for suite in report.entries[:2]:
+        assert sorted(case.name for case in suite) == [
+            "Test0",
+            "Test1",
+            "Test2",
+        ]
+
+    stdout = report.entries[-1].entries[0].entries[1]["message"]
+    for index in range(3):
+        assert "shard {} ran 2 tests".format(index) in stdout
+
+
+def test_gtest_process_test_data_streaming(runpath):
+    """
+    Testcase reports are built incrementally from the XML result file,
+    failure texts are kept and ``notrun`` testcases are left out.
+    """
+    report_path = os.path.join(runpath, "streaming_report.xml")
+    with open(report_path, "w") as report_file:
+        report_file.write(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<testsuites tests="2001" failures="1" name="AllTests">'
+            '<testsuite name="Big" tests="2000">'
+        )
+        for idx in range(2000):
+            report_file.write(
+                '<testcase name="Case{}" status="run" '
+                'classname="Big" />'.format(idx)
+            )
+        report_file.write(
+            "</testsuite>"
+            '<testsuite name="Mixed" tests="2">'
+            '<testcase name="Fails" status="run" classname="Mixed">'
+            '<failure message="boom">Expected: 1</failure>'
+            "</testcase>"
+            '<testcase name="Skipped" status="notrun" classname="Mixed" />'
+            "</testsuite>"
+            '<testsuite name="NotRun" tests="1">'
+            '<testcase name="Skipped" status="notrun" classname="NotRun" />'
+            "</testsuite>"
+            "</testsuites>"
+        )
+
+    test = GTest(name="MyGTest", driver=report_path)
+    test_data = etree.iterparse(
+        report_path, events=("start", "end"), tag=("testsuite", "testcase")
+    )
+    suites = test.process_test_data(test_data)
+
+    assert [suite.name for suite in suites] == ["Big", "Mixed"]
+    assert len(suites[0]) == 2000
+    assert [case.name for case in suites[1]] == ["Fails"]
+
+    failure = suites[1].entries[0].entries[0]
+    assert failure["passed"] is False
+    assert failure["content"] == "Expected: 1"
@@ -0,0 +1,101 @@
+"""Test spilling of testcase entries to disk."""
+import json
+
+import testplan
+from testplan.testing import multitest
+from testplan.report.testing.schemas import TestReportSchema
+from testplan.report.testing.spill import SpilledEntries
+
+
+@multitest.testsuite
+class Suite(object):
+    @multitest.testcase
+    def passing(self, env, result):
+        for idx in range(100):
+            result.log("Message {}".format(idx))
+            result.equal(idx, idx)
+        result.log(b"\xff\xfe binary")
+        with result.group(description="Group") as group:
+            group.dict.match({"a": 1}, {"a": 1})
+
+    @multitest.testcase
+    def failing(self, env, result):
+        result.true(True)
+        result.equal(1, 2, description="Failing")
+        with result.group(description="Failing group") as group:
+            group.fail("Failure in group")
+
+    @multitest.testcase(summarize=True)
+    def summarized(self, env, result):
+        for idx in range(20):
+            result.equal(idx, idx)
+
+
+def _run_plan(runpath, spill_entries):
+    plan = testplan.Testplan(
+        name="SpillPlan", parse_cmdline=False, runpath=runpath
+    )
+    plan.add(
+        multitest.MultiTest(
+            name="SpillTest", suites=[Suite()], spill_entries=spill_entries
+        )
+    )
+    plan.run()
+    return plan.report
+
+
+def _report_data(report):
+    data = TestReportSchema(strict=True).dump(report).data
+    suite_data = data["entries"][0]["entries"][0]
+    return json.loads(json.dumps(suite_data["entries"]))
+
+
+def _strip_times(data):
+    if isinstance(data, dict):
+        return {
+            key: _strip_times(value)
+            for key, value in data.items()
+            if key not in ("utc_time", "machine_time", "timer", "uid", "hash")
+        }
+    if isinstance(data, list):
+        return [_strip_times(value) for value in data]
+    return data
+
+
+def test_spill_entries(tmpdir):
+    """Spilled entries are reported the same as in memory entries."""
+    in_memory = _run_plan(str(tmpdir.join("in_memory")), False)
+    spilled = _run_plan(str(tmpdir.join("spilled")), True)
+
+    passing, failing, summarized = spilled.entries[0].entries[0].entries
+
+    assert isinstance(passing.entries, SpilledEntries)
+    assert len(passing) == 202
+    assert passing.entries.num_failing == 0
+    assert passing.passed
+
+    assert isinstance(failing.entries, SpilledEntries)
+    assert failing.failed
+    assert [entry["description"] for entry in failing.entries.failing] == [
+        "Failing",
+        "Failing group",
+    ]
+
+    # Summaries need all entries, they are not spilled
+    assert not isinstance(summarized.entries, SpilledEntries)
+
+    assert in_memory.passed == spilled.passed
+    assert _strip_times(_report_data(in_memory)) == _strip_times(
+        _report_data(spilled)
+    )
+
+
+def test_spill_entries_remote_worker(tmpdir, monkeypatch):
+    """Entries are kept in memory when running on a remote worker."""
+    monkeypatch.setenv("TESTPLAN_REMOTE_WORKSPACE", str(tmpdir))
+    report = _run_plan(str(tmpdir.join("remote")), True)
+
+    passing, failing, summarized = report.entries[0].entries[0].entries
+    assert not isinstance(passing.entries, SpilledEntries)
+    assert len(passing) == 202
+    assert failing.failed
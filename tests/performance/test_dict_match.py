@@ -0,0 +1,121 @@
+"""
+Benchmarks of matching many dicts against the same expected dict, comparing
+a precompiled matcher against calling compare for every dict, and fail fast
+dict match entries against fully reported ones.
+"""
+
+import re
+import time
+
+import pytest
+
+from testplan.common.utils import comparison
+from testplan.testing.multitest.entries import assertions
+from testplan.testing.multitest.entries.schemas.base import (
+    registry as schema_registry,
+)
+
+NUM_DICTS = 5000
+
+
+def _make_dicts(num_dicts):
+    dicts = []
+    for idx in range(num_dicts):
+        msg = {tag: "value{}".format(tag) for tag in range(30)}
+        msg.update(
+            {
+                "price": 11 + idx,
+                "side": "1",
+                "id": "ORD{}".format(idx),
+                "legs": [{"qty": 1, "side": "1"}, {"qty": 2, "side": "2"}],
+                "seq_num": idx,
+            }
+        )
+        dicts.append(msg)
+    return dicts
+
+
+def _make_expected():
+    expected = {tag: "value{}".format(tag) for tag in range(30)}
+    expected.update(
+        {
+            "price": comparison.Greater(10),
+            "side": comparison.In(["1", "2"]),
+            "id": re.compile(r"ORD\d+"),
+            "legs": [
+                {"qty": 1, "side": "1"},
+                {"qty": lambda qty: qty > 1, "side": "2"},
+            ],
+        }
+    )
+    return expected
+
+
+@pytest.mark.parametrize("report_mode", list(comparison.ReportOptions))
+def test_dict_matcher(report_mode):
+    """Precompiled DictMatcher vs compare called for every dict."""
+    actuals = _make_dicts(NUM_DICTS)
+    expected = _make_expected()
+
+    start = time.time()
+    results = [
+        comparison.compare(
+            actual, expected, ignore=["seq_num"], report_mode=report_mode
+        )
+        for actual in actuals
+    ]
+    uncompiled = time.time() - start
+
+    start = time.time()
+    matcher = comparison.DictMatcher(
+        expected, ignore=["seq_num"], report_mode=report_mode
+    )
+    compiled_results = [matcher.compare(actual) for actual in actuals]
+    compiled = time.time() - start
+
+    assert compiled_results == results
+
+    print(
+        "{} dict matches ({}): compare {:.3f}s,"
+        " DictMatcher {:.3f}s ({:.1f}x)".format(
+            NUM_DICTS,
+            report_mode.name,
+            uncompiled,
+            compiled,
+            uncompiled / compiled,
+        )
+    )
+
+
+@pytest.mark.parametrize("mismatch", (False, True))
+def test_dict_match_fail_fast(mismatch):
+    """DictMatch entries with fail_fast vs full comparison and report."""
+    actuals = _make_dicts(NUM_DICTS)
+    expected = _make_expected()
+    if mismatch:
+        expected[0] = "other"
+
+    timings = {}
+    for fail_fast in (False, True):
+        start = time.time()
+        for actual in actuals:
+            entry = assertions.DictMatch(
+                value=actual,
+                expected=expected,
+                exclude_keys=["seq_num"],
+                fail_fast=fail_fast,
+            )
+            assert bool(entry) is not mismatch
+            schema_registry.serialize(entry)
+        timings[fail_fast] = time.time() - start
+
+    print(
+        "{} dict match entries (mismatch={}): full {:.3f}s,"
+        " fail_fast {:.3f}s ({:.1f}x)".format(
+            NUM_DICTS,
+            mismatch,
+            timings[False],
+            timings[True],
+            timings[False] / timings[True],
+        )
+    )
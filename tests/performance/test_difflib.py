@@ -0,0 +1,104 @@
+"""Benchmark of line diffs on big text blocks."""
+
+import random
+import time
+
+import pytest
+
+from testplan.common.utils import difflib
+
+NUM_LINES = 100000
+
+
+def _log_lines(num_lines, seed):
+    rand = random.Random(seed)
+    return [
+        "2019-01-01 00:00:{:02d} INFO worker-{} processed order {}\n".format(
+            idx % 60, rand.randint(0, 8), rand.randint(0, 10 ** 6)
+        )
+        for idx in range(num_lines)
+    ]
+
+
+def _changed(lines, num_changes, seed):
+    rand = random.Random(seed)
+    lines = list(lines)
+    for _ in range(num_changes):
+        idx = rand.randrange(len(lines))
+        action = rand.choice(("replace", "insert", "delete", "blank"))
+        if action == "replace":
+            lines[idx] = lines[idx].replace("INFO", "WARN")
+        elif action == "insert":
+            lines.insert(idx, "unexpected line {}\n".format(idx))
+        elif action == "delete":
+            del lines[idx]
+        else:
+            lines.insert(idx, "\n")
+    return lines
+
+
+@pytest.mark.parametrize(
+    "description, num_changes",
+    (("identical", 0), ("few changes", 100), ("many changes", 5000)),
+)
+@pytest.mark.parametrize("mode", ("normal", "unified", "context"))
+def test_big_diff(description, num_changes, mode):
+    """Diff of 100k line logs with a varying number of changes."""
+    first = _log_lines(NUM_LINES, seed=1)
+    second = _changed(first, num_changes, seed=2)
+
+    start = time.time()
+    delta = list(
+        difflib.diff(
+            first,
+            second,
+            ignore_space_change=True,
+            unified=mode == "unified",
+            context=mode == "context",
+        )
+    )
+    elapsed = time.time() - start
+
+    assert bool(delta) is bool(num_changes)
+    print(
+        "{} diff of {} lines, {}: {:.3f}s".format(
+            mode, NUM_LINES, description, elapsed
+        )
+    )
+
+
+def test_big_diff_unrelated():
+    """Worst case, nothing in common between the two blocks."""
+    first = _log_lines(NUM_LINES, seed=1)
+    second = [line.upper() for line in first]
+
+    start = time.time()
+    delta = list(difflib.diff(first, second))
+    elapsed = time.time() - start
+
+    assert len(delta) == 2 * NUM_LINES + 2
+    print(
+        "normal diff of {} unrelated lines: {:.3f}s".format(NUM_LINES, elapsed)
+    )
+
+
+@pytest.mark.parametrize("num_lines", (2000, 8000))
+def test_big_diff_repetitive(num_lines):
+    """
+    Few distinct lines in a different order on each side, a shortest edit
+    script is too expensive to find and is only approximated.
+    """
+    first = ["line {}\n".format(idx % 10) for idx in range(num_lines)]
+    second = ["line {}\n".format(idx * 7 % 10) for idx in range(num_lines)]
+
+    start = time.time()
+    delta = list(difflib.diff(first, second))
+    elapsed = time.time() - start
+
+    assert delta
+    assert elapsed < 30
+    print(
+        "normal diff of {} repetitive lines: {:.3f}s".format(
+            num_lines, elapsed
+        )
+    )
@@ -0,0 +1,114 @@
+"""
+Throughput benchmark of the FIX receive path, in messages per second.
+
+The framer is measured on its own over a socket pair. The FIX server and
+client are measured end to end when pyfixmsg and a FIX spec file (set with
+the ``FIX_SPEC_FILE`` environment variable) are available.
+"""
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from testplan.common.utils.sockets.fix.parser import Framer
+
+NUM_MESSAGES = 50000
+
+
+def _fix_message(body):
+    body = body.replace(b"|", b"\x01")
+    head = b"8=FIX.4.2\x019=" + str(len(body)).encode() + b"\x01"
+    checksum = sum(bytearray(head + body)) % 256
+    return head + body + b"10=" + "{:03d}".format(checksum).encode() + b"\x01"
+
+
+def _sendall(sock, data):
+    sock.sendall(data)
+    sock.shutdown(socket.SHUT_WR)
+
+
+def test_framer_throughput():
+    """Frame a stream of small orders received over a socket pair."""
+    message = _fix_message(
+        b"35=D|49=CLIENT|56=SERVER|34=1|11=order|55=TEST|54=1|38=100|40=2|"
+        b"44=10.5|"
+    )
+    sender, receiver = socket.socketpair()
+    thread = threading.Thread(
+        target=_sendall, args=(sender, message * NUM_MESSAGES)
+    )
+
+    framer = Framer()
+    received = []
+    start = time.time()
+    thread.start()
+    try:
+        while framer.recv_from(receiver):
+            received.extend(framer.messages())
+    finally:
+        thread.join()
+        sender.close()
+        receiver.close()
+    elapsed = time.time() - start
+
+    assert received == [message] * NUM_MESSAGES
+    assert framer.pending == 0
+    print(
+        "Framed {} messages in {:.3f}s: {:.0f} msgs/sec".format(
+            NUM_MESSAGES, elapsed, NUM_MESSAGES / elapsed
+        )
+    )
+
+
+def test_fix_server_throughput():
+    """Send orders from a FIX client and receive them on the FIX server."""
+    pytest.importorskip("pyfixmsg")
+    spec_file = os.environ.get("FIX_SPEC_FILE")
+    if not spec_file:
+        pytest.skip("FIX_SPEC_FILE is not set")
+
+    from pyfixmsg.fixmessage import FixMessage
+    from pyfixmsg.codecs.stringfix import Codec
+    from pyfixmsg.reference import FixSpec
+
+    from testplan.common.utils.sockets.fix.client import Client
+    from testplan.common.utils.sockets.fix.server import Server
+
+    codec = Codec(spec=FixSpec(spec_file))
+    num_messages = NUM_MESSAGES // 10
+
+    server = Server(msgclass=FixMessage, codec=codec)
+    server.start()
+    client = Client(
+        msgclass=FixMessage,
+        codec=codec,
+        host=server.host,
+        port=server.port,
+        sender="CLIENT",
+        target="SERVER",
+    )
+    try:
+        client.connect()
+        client.sendlogon()
+        client.receive()
+
+        order = FixMessage({35: "D", 55: "TEST", 54: 1, 38: 100, 40: 2})
+        start = time.time()
+        for idx in range(num_messages):
+            order[11] = idx
+            client.send(order)
+        for _ in range(num_messages):
+            server.receive(timeout=10)
+        elapsed = time.time() - start
+    finally:
+        client.close()
+        server.stop()
+
+    print(
+        "Received {} messages in {:.3f}s: {:.0f} msgs/sec".format(
+            num_messages, elapsed, num_messages / elapsed
+        )
+    )
@@ -0,0 +1,52 @@
+"""Throughput benchmark of the HTTPClient driver against HTTPServer."""
+
+import os
+import time
+
+import requests
+
+from testplan.testing.multitest.driver import http
+
+NUM_REQUESTS = 200
+
+
+def test_http_client_throughput(runpath):
+    """
+    Send requests through the pooled HTTPClient and report requests/sec.
+    All responses must be received and the number of worker threads must
+    stay within the configured pool size.
+    """
+    server = http.HTTPServer(
+        name="bench_server", runpath=os.path.join(runpath, "bench_server")
+    )
+    with server:
+        for _ in range(NUM_REQUESTS):
+            server.queue_response(http.HTTPResponse(content=["ok"]))
+
+        client = http.HTTPClient(
+            name="bench_client",
+            host=server.host,
+            port=server.port,
+            pool_size=4,
+            runpath=os.path.join(runpath, "bench_client"),
+        )
+        with client:
+            start = time.time()
+            for _ in range(NUM_REQUESTS):
+                client.get("bench")
+
+            received = 0
+            while received < NUM_REQUESTS:
+                response = client.receive(timeout=10)
+                assert response is not None
+                assert response.status_code == requests.codes.ok
+                received += 1
+            elapsed = time.time() - start
+
+            assert len(client._executor._threads) <= 4
+
+    print(
+        "HTTPClient: {} requests in {:.3f}s ({:.1f} req/s)".format(
+            NUM_REQUESTS, elapsed, NUM_REQUESTS / elapsed
+        )
+    )
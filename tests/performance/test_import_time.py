@@ -0,0 +1,75 @@
+"""
+Import time benchmark of the testplan package, measured by the interpreter
+with ``-X importtime`` (Python 3.7+) in a fresh process.
+
+Exporters, interactive mode and the web UI must not be imported by a plain
+``import testplan``, as child process and remote workers import it too.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+LAZY_MODULES = (
+    "numpy",
+    "reportlab",
+    "matplotlib",
+    "flask",
+    "flask_restplus",
+    "requests",
+    "testplan.exporters.testing.pdf",
+    "testplan.exporters.testing.webserver",
+    "testplan.runnable.interactive",
+    "testplan.web_ui",
+)
+
+
+def _import_times(statement):
+    """
+    Import times of the modules imported by a statement.
+
+    :return: Cumulative import time in microseconds, by module name.
+    :rtype: ``dict``
+    """
+    proc = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    _, stderr = proc.communicate()
+    assert proc.returncode == 0, stderr.decode()
+
+    times = {}
+    for line in stderr.decode().splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="-X importtime requires Python 3.7"
+)
+def test_import_time():
+    """Import testplan and report the slowest top level imports."""
+    times = _import_times("import testplan")
+
+    imported = [
+        name
+        for name in times
+        if any(
+            name == module or name.startswith(module + ".")
+            for module in LAZY_MODULES
+        )
+    ]
+    assert imported == []
+
+    print("import testplan: {:.3f}s".format(times["testplan"] / 1e6))
+    for name, cumulative in sorted(
+        times.items(), key=lambda item: item[1], reverse=True
+    )[:15]:
+        print("{:>10.3f}s  {}".format(cumulative / 1e6, name))
@@ -0,0 +1,84 @@
+"""
+Benchmark of LogMatcher over a large log: matching several patterns in one
+pass, matching all lines between marks and the latency of picking up lines
+written while waiting.
+"""
+
+import threading
+import time
+
+from testplan.common.utils.match import LogMatcher
+
+NUM_LINES = 1000000
+
+
+def _write_log(path):
+    with open(path, "w") as log_file:
+        for idx in range(NUM_LINES):
+            level = "ERROR" if idx % 100000 == 0 else "INFO"
+            log_file.write(
+                "2020-01-01 00:00:00 {} line {} of the log\n".format(
+                    level, idx
+                )
+            )
+
+
+def test_match_each(tmpdir):
+    """Several patterns matched in one pass vs one scan per pattern."""
+    path = str(tmpdir.join("large.log"))
+    _write_log(path)
+    patterns = [r".* line {} of".format(idx) for idx in (999999, 500000, 3)]
+
+    matcher = LogMatcher(path)
+    start = time.time()
+    for pattern in patterns:
+        matcher.seek()
+        matcher.match(pattern)
+    sequential_time = time.time() - start
+
+    matcher.seek()
+    start = time.time()
+    matches = matcher.match_each(patterns)
+    single_pass_time = time.time() - start
+    assert all(matches)
+
+    matcher.seek()
+    start = time.time()
+    errors = matcher.match_all(r".* ERROR ")
+    match_all_time = time.time() - start
+    assert len(errors) == NUM_LINES // 100000
+
+    print(
+        "LogMatcher on {} lines: {} patterns one by one {:.3f}s,"
+        " in one pass {:.3f}s, match_all {:.3f}s".format(
+            NUM_LINES,
+            len(patterns),
+            sequential_time,
+            single_pass_time,
+            match_all_time,
+        )
+    )
+
+
+def test_match_latency(tmpdir):
+    """Delay between a line being written and being matched."""
+    path = str(tmpdir.join("growing.log"))
+    with open(path, "w") as log_file:
+        log_file.write("started\n")
+
+    matcher = LogMatcher(path)
+    matcher.seek_eof()
+    written = []
+
+    def append():
+        with open(path, "a") as log_file:
+            log_file.write("ready\n")
+        written.append(time.time())
+
+    timer = threading.Timer(0.5, append)
+    timer.start()
+    matcher.match(r"^ready$", timeout=5)
+    matched = time.time()
+    timer.join()
+
+    print("LogMatcher latency: {:.3f}s".format(matched - written[0]))
@@ -0,0 +1,71 @@
+"""
+Benchmark of regex line matching over a large log, comparing the streaming
+``matchline_stream`` against ``matchline`` on the whole text.
+"""
+
+import collections
+import os
+import time
+import tracemalloc
+
+import mock
+
+from testplan.testing.multitest import result as result_mod
+
+NUM_LINES = 500000
+
+
+def _regex_namespace():
+    mock_result = mock.MagicMock()
+    mock_result.entries = collections.deque()
+    return result_mod.RegexNamespace(mock_result)
+
+
+def _timed(func, **kwargs):
+    tracemalloc.start()
+    start = time.time()
+    result = func(**kwargs)
+    elapsed = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def _read_and_match(regex_ns, path):
+    with open(path) as log_file:
+        return regex_ns.matchline(regexp=r".* ERROR .*", value=log_file.read())
+
+
+def test_matchline_stream(tmpdir):
+    """Match lines of a file without loading it vs on the whole text."""
+    path = str(tmpdir.join("large.log"))
+    with open(path, "w") as log_file:
+        for idx in range(NUM_LINES):
+            level = "ERROR" if idx % 100000 == 0 else "INFO"
+            log_file.write(
+                "2020-01-01 00:00:00 {} line {} of the log{}".format(
+                    level, idx, os.linesep
+                )
+            )
+
+    regex_ns = _regex_namespace()
+    whole, whole_time, whole_peak = _timed(
+        _read_and_match, regex_ns=regex_ns, path=path
+    )
+    stream, stream_time, stream_peak = _timed(
+        regex_ns.matchline_stream, regexp=r".* ERROR .*", source=path
+    )
+
+    assert whole.line_numbers == stream.line_numbers
+    assert len(stream.line_numbers) == NUM_LINES // 100000
+
+    print(
+        "matchline on {} lines: whole text {:.3f}s / {:.1f}MB peak,"
+        " stream {:.3f}s / {:.1f}MB peak".format(
+            NUM_LINES,
+            whole_time,
+            whole_peak / 2.0 ** 20,
+            stream_time,
+            stream_peak / 2.0 ** 20,
+        )
+    )
@@ -0,0 +1,56 @@
+"""
+Benchmark of the memory used by a testcase logging many entries, with its
+entries kept in memory vs spilled to disk.
+"""
+
+import time
+import tracemalloc
+
+from testplan.report import TestCaseReport
+from testplan.testing.multitest import result as result_mod
+
+NUM_ENTRIES = 20000
+
+
+def _run_testcase(spill_path=None):
+    tracemalloc.start()
+    start = time.time()
+
+    result = result_mod.Result(_spill_path=spill_path)
+    for idx in range(NUM_ENTRIES):
+        result.dict.log({35: "D", 11: "order-{}".format(idx), 38: idx})
+    report = TestCaseReport(name="testcase")
+    report.extend(result.serialized_entries)
+    passed = report.passed
+
+    elapsed = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return report, passed, elapsed, peak
+
+
+def test_spill_entries(tmpdir):
+    """Peak memory of a testcase with in memory vs spilled entries."""
+    (
+        in_memory,
+        in_memory_passed,
+        in_memory_time,
+        in_memory_peak,
+    ) = _run_testcase()
+    spilled, spilled_passed, spilled_time, spilled_peak = _run_testcase(
+        str(tmpdir.join("entries.jsonl"))
+    )
+
+    assert in_memory_passed and spilled_passed
+    assert len(in_memory) == len(spilled) == NUM_ENTRIES
+
+    print(
+        "{} dict.log entries: in memory {:.3f}s / {:.1f}MB peak,"
+        " spilled {:.3f}s / {:.1f}MB peak".format(
+            NUM_ENTRIES,
+            in_memory_time,
+            in_memory_peak / 2.0 ** 20,
+            spilled_time,
+            spilled_peak / 2.0 ** 20,
+        )
+    )
@@ -0,0 +1,107 @@
+"""
+Benchmark of table assertions, comparing the column-wise comparison used
+for reporting failures only against the row by row comparison.
+"""
+
+import time
+
+import pytest
+
+from testplan.testing.multitest.entries import assertions
+
+NUM_ROWS = 100000
+COLUMNS = ["symbol", "price", "qty", "side"]
+
+
+def _make_table(num_rows, mismatch_every=0):
+    table = []
+    for idx in range(num_rows):
+        qty = idx % 1000
+        if mismatch_every and idx % mismatch_every == 0:
+            qty = -1
+        table.append(
+            {
+                "symbol": "SYM{}".format(idx % 500),
+                "price": idx * 0.25,
+                "qty": qty,
+                "side": "BUY" if idx % 2 else "SELL",
+            }
+        )
+    return table
+
+
+def _timed(func, **kwargs):
+    start = time.time()
+    result = func(**kwargs)
+    return result, time.time() - start
+
+
+def _compare(table, expected_table, report_fails_only):
+    return assertions.compare_rows(
+        table=table,
+        expected_table=expected_table,
+        comparison_columns=COLUMNS,
+        display_columns=COLUMNS,
+        report_fails_only=report_fails_only,
+    )
+
+
+@pytest.mark.parametrize("mismatch_every", (0, 1000))
+def test_compare_rows_fails_only(mismatch_every):
+    """Report failures only vs row by row comparison of all rows."""
+    table = _make_table(NUM_ROWS)
+    expected_table = _make_table(NUM_ROWS, mismatch_every=mismatch_every)
+
+    (passed, all_rows), row_by_row = _timed(
+        _compare,
+        table=table,
+        expected_table=expected_table,
+        report_fails_only=False,
+    )
+    (fast_passed, failures), column_wise = _timed(
+        _compare,
+        table=table,
+        expected_table=expected_table,
+        report_fails_only=True,
+    )
+
+    assert fast_passed == passed
+    assert failures == [row for row in all_rows if not row.passed]
+
+    print(
+        "compare_rows on {} rows: row by row {:.3f}s,"
+        " failures only {:.3f}s ({:.1f}x)".format(
+            NUM_ROWS, row_by_row, column_wise, row_by_row / column_wise
+        )
+    )
+
+
+def test_table_diff_dataframe():
+    """TableDiff of two ``pandas.DataFrame`` objects vs list of dicts."""
+    pandas = pytest.importorskip("pandas")
+
+    table = _make_table(NUM_ROWS)
+    expected_table = _make_table(NUM_ROWS, mismatch_every=1000)
+    frame = pandas.DataFrame(table, columns=COLUMNS)
+    expected_frame = pandas.DataFrame(expected_table, columns=COLUMNS)
+
+    rows_diff, rows_time = _timed(
+        assertions.TableDiff,
+        table=table,
+        expected_table=expected_table,
+        report_fail_only=True,
+    )
+    frame_diff, frame_time = _timed(
+        assertions.TableDiff,
+        table=frame,
+        expected_table=expected_frame,
+        report_fail_only=True,
+    )
+
+    assert bool(frame_diff) is bool(rows_diff) is False
+    assert frame_diff.data == rows_diff.data
+
+    print(
+        "TableDiff on {} rows: list of dicts {:.3f}s,"
+        " DataFrame {:.3f}s".format(NUM_ROWS, rows_time, frame_time)
+    )
@@ -0,0 +1,68 @@
+"""Unit tests for the FIX messages parser."""
+import socket
+
+import pytest
+
+from testplan.common.utils.sockets.fix.parser import Framer
+
+
+def _fix_message(body):
+    """Build a raw FIX message with correct BodyLength and CheckSum."""
+    body = body.replace(b"|", b"\x01")
+    head = b"8=FIX.4.2\x019=" + str(len(body)).encode() + b"\x01"
+    checksum = sum(bytearray(head + body)) % 256
+    return head + body + b"10=" + "{:03d}".format(checksum).encode() + b"\x01"
+
+
+MESSAGES = [
+    _fix_message(b"35=A|49=CLIENT|56=SERVER|34=1|98=0|108=600|"),
+    _fix_message(b"35=D|49=CLIENT|56=SERVER|34=2|58=10=not a checksum|"),
+    _fix_message(b"35=0|49=CLIENT|56=SERVER|34=3|"),
+]
+
+
+@pytest.mark.parametrize("split_size", (1, 7, 64, 4096))
+def test_framer_split(split_size):
+    """Messages are framed whatever the size of the received data."""
+    stream = b"".join(MESSAGES)
+    framer = Framer(buffer_size=32)
+    received = []
+
+    for idx in range(0, len(stream), split_size):
+        framer.feed(stream[idx : idx + split_size])
+        received.extend(framer.messages())
+
+    assert received == MESSAGES
+    assert framer.pending == 0
+
+
+def test_framer_resync():
+    """Bytes outside of messages and wrong BodyLength values are skipped."""
+    wrong_length = MESSAGES[2].replace(b"\x019=", b"\x019=1", 1)
+    framer = Framer()
+    framer.feed(b"garbage\x01" + MESSAGES[0] + wrong_length + MESSAGES[1])
+
+    assert framer.messages() == [MESSAGES[0], wrong_length, MESSAGES[1]]
+
+    framer.feed(MESSAGES[2][:-1])
+    assert framer.messages() == []
+    framer.feed(MESSAGES[2][-1:])
+    assert framer.messages() == [MESSAGES[2]]
+
+
+def test_framer_recv_from():
+    """Coalesced messages received from a socket are framed in a batch."""
+    sender, receiver = socket.socketpair()
+    try:
+        sender.sendall(b"".join(MESSAGES * 100))
+        framer = Framer(buffer_size=128)
+        received = []
+        while len(received) < 300:
+            assert framer.recv_from(receiver) > 0
+            received.extend(framer.messages())
+        assert received == MESSAGES * 100
+
+        sender.close()
+        assert framer.recv_from(receiver) == 0
+    finally:
+        receiver.close()
@@ -1,3 +1,7 @@
+import collections
+import functools
+import re
+
 import pytest
 from testplan.common.utils import comparison as cmp
 
@@ -82,3 +86,128 @@ def test_comparator_composition(
 ):
     assert composed_callable(value) == expected
     assert str(composed_callable) == description
+
+
+@pytest.mark.parametrize(
+    "actual,expected,ignore,only,report_mode",
+    (
+        ({"a": 1, "b": "x"}, {"a": 1, "b": "x"}, None, None, "ALL"),
+        ({"a": 1, "b": "x"}, {"a": 2, "c": "y"}, None, None, "ALL"),
+        (
+            {"a": [1, 2, 3], "b": {"c": "foo", "d": 5}},
+            {
+                "a": [1, 2, lambda v: isinstance(v, int)],
+                "b": {"c": re.compile(r"f\w+"), "d": cmp.Greater(10)},
+            },
+            None,
+            None,
+            "ALL",
+        ),
+        (
+            {"a": [1, 2], "b": {"c": 1, "d": 2}, "e": 3},
+            {"a": [1, 2, 3], "b": {"c": 1, "d": 3}, "f": 4},
+            ["d"],
+            None,
+            "ALL",
+        ),
+        (
+            {"a": 1, "b": 2, "c": {"a": 1, "b": 5}},
+            {"a": 1, "b": 3, "c": {"a": 1, "b": 2}, "z": 1},
+            None,
+            ["a", "c", "y"],
+            "NO_IGNORED",
+        ),
+        (
+            {"a": 1, "b": 2, "c": [{"a": 1}, {"a": 2}]},
+            {"a": 1, "b": 3, "c": [{"a": 1}, {"a": cmp.Less(2)}]},
+            None,
+            None,
+            "FAILS_ONLY",
+        ),
+        (None, {"a": 1}, None, None, "ALL"),
+        ({"a": 1}, None, None, None, "ALL"),
+    ),
+)
+def test_dict_matcher(actual, expected, ignore, only, report_mode):
+    """DictMatcher gives the same result as compare, every time."""
+    report_mode = cmp.ReportOptions[report_mode]
+    matcher = cmp.DictMatcher(
+        expected, ignore=ignore, only=only, report_mode=report_mode
+    )
+    result = cmp.compare(
+        actual, expected, ignore=ignore, only=only, report_mode=report_mode
+    )
+
+    assert matcher.compare(actual) == result
+    assert matcher.compare(actual) == result
+
+
+def test_dict_matcher_invalid_report_mode():
+    with pytest.raises(ValueError):
+        cmp.DictMatcher({"a": 1}, report_mode="ALL")
+
+
+@pytest.mark.parametrize("use_matcher", (False, True))
+def test_compare_fail_fast(use_matcher):
+    """Only the first mismatching key is compared and reported."""
+    called = []
+
+    def record(value):
+        called.append(value)
+        return True
+
+    expected = collections.OrderedDict(
+        [("a", 1), ("b", {"c": 1, "d": [1, 3]}), ("e", record)]
+    )
+    actual = {"a": 1, "b": {"c": 1, "d": [1, 2]}, "e": 5}
+
+    if use_matcher:
+        compare = cmp.DictMatcher(expected, fail_fast=True).compare
+    else:
+        compare = functools.partial(cmp.compare, rhs=expected, fail_fast=True)
+
+    passed, comparisons = compare(actual)
+    assert not passed
+    assert comparisons == [
+        (
+            "b",
+            cmp.Match.FAIL,
+            (
+                2,
+                [
+                    (
+                        "d",
+                        cmp.Match.FAIL,
+                        (
+                            1,
+                            [
+                                (3, "p", (0, "int", "1")),
+                                (3, "f", (0, "int", "2")),
+                            ],
+                        ),
+                    )
+                ],
+            ),
+            (
+                2,
+                [
+                    (
+                        "d",
+                        cmp.Match.FAIL,
+                        (
+                            1,
+                            [
+                                (3, "p", (0, "int", "1")),
+                                (3, "f", (0, "int", "3")),
+                            ],
+                        ),
+                    )
+                ],
+            ),
+        )
+    ]
+    assert called == []
+
+    actual["b"]["d"][1] = 3
+    assert compare(actual) == (True, [])
+    assert called == [5]
@@ -0,0 +1,270 @@
+import itertools
+import random
+
+import pytest
+
+from testplan.common.utils import difflib
+
+
+LINES = ("a\n", "b\n", " a\n", "a  \n", "a b\n", "ab\n", "\n", "  \n", "#\n")
+
+
+def _random_lines(rand, max_len):
+    return [rand.choice(LINES) for _ in range(rand.randint(0, max_len))]
+
+
+def _sequence_matcher_opcodes(differ, a, b):
+    """Opcodes of Differ.get_opcodes, computed by SequenceMatcher."""
+    if differ.ignore_space_change or differ.ignore_whitespaces:
+        a, b = [
+            [
+                difflib.SpaceIgnoredString(
+                    line, differ.ignore_space_change, differ.ignore_whitespaces
+                )
+                for line in lines
+            ]
+            for lines in (a, b)
+        ]
+
+    matcher = difflib.SequenceMatcher(differ.linejunk, a, b)
+    for tag, alo, ahi, blo, bhi in matcher.get_opcodes():
+        if tag == "replace":
+            for opcode in differ._fancy_replace(a, alo, ahi, b, blo, bhi):
+                yield opcode
+        else:
+            yield tag, alo, ahi, blo, bhi
+
+
+def test_matcher_fuzzy_strings():
+    """Lines equal after ignoring whitespaces are matched."""
+    a, b = [
+        [difflib.SpaceIgnoredString(line, True) for line in lines]
+        for lines in (["x\n", "a  b\n", "c\n"], ["a b \n", "c\n", "y\n"])
+    ]
+    matcher = difflib.SequenceMatcher(None, a, b)
+    assert matcher.find_longest_match(0, 3, 0, 3) == (1, 0, 2)
+    assert matcher.get_opcodes() == [
+        ("delete", 0, 1, 0, 0),
+        ("equal", 1, 3, 0, 2),
+        ("insert", 3, 3, 2, 3),
+    ]
+
+
+def _lcs_length(a, b):
+    """Length of the longest common subsequence, via dynamic programming."""
+    lengths = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i, j in itertools.product(
+        range(len(a) - 1, -1, -1), range(len(b) - 1, -1, -1)
+    ):
+        lengths[i][j] = (
+            lengths[i + 1][j + 1] + 1
+            if a[i] == b[j]
+            else max(lengths[i + 1][j], lengths[i][j + 1])
+        )
+    return lengths[0][0]
+
+
+def _check_opcodes(opcodes, a, b, key=lambda line: line):
+    """
+    Check that opcodes cover both sequences and that equal lines are equal,
+    return the number of equal lines.
+    """
+    i = j = matched = 0
+    for tag, alo, ahi, blo, bhi in opcodes:
+        assert (alo, blo) == (i, j)
+        if tag == "equal":
+            assert [key(line) for line in a[alo:ahi]] == [
+                key(line) for line in b[blo:bhi]
+            ]
+            matched += ahi - alo
+        i, j = ahi, bhi
+    assert (i, j) == (len(a), len(b))
+    return matched
+
+
+def _edited_lines(rand, size):
+    """Distinct lines mixed with junk lines, and a copy with a few edits."""
+    a = [
+        rand.choice(("\n", "  \n", "# \n"))
+        if rand.random() < 0.3
+        else "line {}\n".format(idx)
+        for idx in range(size)
+    ]
+    b = list(a)
+    for _ in range(rand.randint(0, 6)):
+        idx = rand.randint(0, len(b))
+        if rand.random() < 0.5:
+            del b[idx : idx + rand.randint(1, 3)]
+        else:
+            b[idx:idx] = [
+                rand.choice(("new {}\n".format(rand.random()), "\n", "# \n"))
+                for _ in range(rand.randint(1, 3))
+            ]
+    return (a, b) if rand.random() < 0.5 else (b, a)
+
+
+def test_line_opcodes_minimal():
+    """Opcodes must cover both sequences and match as many lines as LCS."""
+    rand = random.Random(0)
+    for _ in range(500):
+        a = [rand.choice("abcd") + "\n" for _ in range(rand.randint(0, 12))]
+        b = [rand.choice("abcd") + "\n" for _ in range(rand.randint(0, 12))]
+        assert _check_opcodes(difflib.line_opcodes(a, b), a, b) == (
+            _lcs_length(a, b)
+        )
+
+
+def test_line_opcodes_too_expensive():
+    """
+    Very different inputs are compared into valid opcodes, matching close
+    to the 1200 lines of their longest common subsequence.
+    """
+    a = ["line {}\n".format(idx % 10) for idx in range(3000)]
+    b = ["line {}\n".format(idx * 7 % 10) for idx in range(3000)]
+    assert _check_opcodes(difflib.line_opcodes(a, b), a, b) >= 1000
+
+
+@pytest.mark.parametrize("max_len", (10, 300))
+def test_differ_opcodes(max_len):
+    """Merged opcodes are the same as merging the detailed ones."""
+    rand = random.Random(max_len)
+    for _ in range(2000 // max_len + 50):
+        a = _random_lines(rand, max_len)
+        b = _random_lines(rand, max_len)
+        differ = difflib.Differ(
+            linejunk=rand.choice((None, difflib.IS_LINE_JUNK)),
+            ignore_space_change=rand.random() < 0.3,
+            ignore_whitespaces=rand.random() < 0.3,
+            ignore_blank_lines=rand.random() < 0.3,
+        )
+
+        opcodes = list(differ.get_opcodes(a, b))
+        _check_opcodes(
+            opcodes,
+            a,
+            b,
+            key=lambda line: difflib._line_key(
+                line, differ.ignore_space_change, differ.ignore_whitespaces
+            ),
+        )
+
+        merged = differ._merge_opcodes(opcodes)
+        if differ.ignore_blank_lines:
+            merged = differ._merge_opcodes(
+                differ._verify_blank_lines(a, b, merged)
+            )
+        assert list(differ.get_merged_opcodes(a, b)) == list(merged)
+
+
+def test_differ_opcodes_edited():
+    """
+    Opcodes are the same as comparing lines with SequenceMatcher when the
+    lines that line up the two sides are not repeated.
+    """
+    rand = random.Random(0)
+    for _ in range(300):
+        a, b = _edited_lines(rand, rand.randint(0, 60))
+        differ = difflib.Differ(
+            linejunk=difflib.IS_LINE_JUNK,
+            ignore_space_change=rand.random() < 0.3,
+            ignore_whitespaces=rand.random() < 0.3,
+        )
+        assert list(differ.get_opcodes(a, b)) == list(
+            _sequence_matcher_opcodes(differ, a, b)
+        )
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    (
+        (["c\n", "\n"], ["\n", "d\n"], ["1d0", "< c", "2a2", "> d"]),
+        (["a\n", "\n", "# \n"], ["\n"], ["1d0", "< a", "3d1", "< # "]),
+    ),
+)
+def test_diff_junk_lines(a, b, expected):
+    """Blank lines still line up the two sides."""
+    assert "".join(difflib.diff(a, b)).splitlines() == expected
+
+
+@pytest.mark.parametrize(
+    "a, b, kwargs, expected",
+    (
+        (
+            ["a\n", "b\n"],
+            ["a \n", "  b\n"],
+            {"ignore_space_change": True},
+            [("equal", 0, 1, 0, 1), ("replace", 1, 2, 1, 2)],
+        ),
+        (
+            ["a b\n", "c\n"],
+            ["a  b \n", "c\n"],
+            {"ignore_space_change": True},
+            [("equal", 0, 2, 0, 2)],
+        ),
+        (
+            ["a b\n", "c\n"],
+            ["ab\n", "c\n"],
+            {"ignore_whitespaces": True},
+            [("equal", 0, 2, 0, 2)],
+        ),
+        (
+            ["x\n", "\n", "y\n"],
+            ["p\n", "\n", "q\n"],
+            {"linejunk": difflib.IS_LINE_JUNK},
+            [("replace", 0, 3, 0, 3)],
+        ),
+        (
+            ["x\n", "\n", "y\n"],
+            ["x\n", "\n", "q\n"],
+            {"linejunk": difflib.IS_LINE_JUNK},
+            [("equal", 0, 2, 0, 2), ("replace", 2, 3, 2, 3)],
+        ),
+    ),
+)
+def test_line_opcodes_options(a, b, kwargs, expected):
+    """Whitespace options and junk lines are respected."""
+    assert difflib.line_opcodes(a, b, **kwargs) == expected
+
+
+def test_diff_formats():
+    """Normal, unified and context diffs of the same change."""
+    first = "one\ntwo\nthree\n"
+    second = "ore\nthree\nemu\n"
+
+    assert "".join(difflib.diff(first, second)).splitlines() == [
+        "1,2c1",
+        "< one",
+        "< two",
+        "---",
+        "> ore",
+        "3a3",
+        "> emu",
+    ]
+    assert "".join(difflib.diff(first, second, unified=True)).splitlines()[
+        2:
+    ] == ["@@ -1,3 +1,3 @@", "-one", "-two", "+ore", " three", "+emu"]
+    assert "".join(difflib.diff(first, second, context=True)).splitlines()[
+        2:
+    ] == [
+        "***************",
+        "*** 1,3 ****",
+        "! one",
+        "! two",
+        "  three",
+        "--- 1,3 ----",
+        "! ore",
+        "  three",
+        "+ emu",
+    ]
+
+
+def test_diff_ignore_blank_lines():
+    """Inserted or deleted blank lines are not reported."""
+    assert (
+        list(
+            difflib.diff(
+                "abc\n\nxyz\n", "abc\nxyz\n\n", ignore_blank_lines=True
+            )
+        )
+        == []
+    )
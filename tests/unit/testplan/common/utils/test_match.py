@@ -2,10 +2,11 @@ import os
 import re
 import itertools
 import tempfile
+import threading
 
 import pytest
 
-from testplan.common.utils.match import LogMatcher
+from testplan.common.utils.match import LogMatcher, compile_regex
 from testplan.common.utils import timing
 
 
@@ -90,3 +91,84 @@ class TestLogMatcher(object):
 
         assert match is not None
         assert match.group(0) == "Match me!"
+
+    @pytest.mark.parametrize("chunk_size", (1, 7, 1024))
+    def test_match_each(self, basic_logfile, chunk_size):
+        """All patterns are matched in a single pass, in any order."""
+        matcher = LogMatcher(log_path=basic_logfile, chunk_size=chunk_size)
+        matches = matcher.match_each([r"fourth", r"^s\w+"])
+        assert [match.group(0) for match in matches] == ["fourth", "second"]
+
+        # The position is moved after the last line needed for a match.
+        assert matcher.match(r"\w+").group(0) == "fifth"
+
+        matcher.seek()
+        matches = matcher.match_each(
+            [r"third", r"sixth"], timeout=0.1, raise_on_timeout=False
+        )
+        assert matches[0].group(0) == "third"
+        assert matches[1] is None
+
+        with pytest.raises(timing.TimeoutException):
+            matcher.match_each([r"sixth"], timeout=0.1)
+
+    @pytest.mark.parametrize("chunk_size", (1, 7, 1024))
+    def test_match_all_between_marks(self, basic_logfile, chunk_size):
+        """Lines are only matched between the marks."""
+        matcher = LogMatcher(log_path=basic_logfile, chunk_size=chunk_size)
+        matcher.match(r"first")
+        matcher.mark("start")
+        matcher.match(r"third")
+        matcher.mark("end")
+
+        assert [
+            match.group(0) for match in matcher.match_all(r"\w+", "start")
+        ] == ["second", "third", "fourth", "fifth"]
+        assert list(
+            (line_no, match.group(0))
+            for line_no, match in matcher.iter_matches(
+                r"\w+", start="start", end="end"
+            )
+        ) == [(1, "second"), (2, "third")]
+        assert matcher.not_match(r"first", start="start", end="end")
+        assert not matcher.not_match(r"fourth")
+        assert matcher.line_number(matcher.marks["end"]) == 3
+
+    def test_match_appended_lines(self, tmpdir):
+        """Lines written while waiting are matched, even partial ones."""
+        log_path = str(tmpdir.join("app.log"))
+        with open(log_path, "wb") as log_file:
+            log_file.write(b"start\r\nfour")
+
+        matcher = LogMatcher(log_path=log_path)
+        assert matcher.match(r"^start$").group(0) == "start"
+
+        def append():
+            with open(log_path, "ab") as log_file:
+                log_file.write(b"teen\nend\n")
+
+        timer = threading.Timer(0.2, append)
+        timer.start()
+        try:
+            match = matcher.match(r"^fourteen$", timeout=5)
+        finally:
+            timer.join()
+        assert match.group(0) == "fourteen"
+        assert matcher.line_number(matcher.position) == 2
+
+
+def test_compile_regex():
+    """Patterns are compiled once per (pattern, flags)."""
+    regex = compile_regex(r"first \w+")
+    assert regex.match("first line")
+    assert compile_regex(r"first \w+") is regex
+
+    ignorecase = compile_regex(r"first \w+", re.IGNORECASE)
+    assert ignorecase is not regex
+    assert ignorecase.match("FIRST LINE")
+
+    assert compile_regex(regex) is regex
+
+    binary = compile_regex(b"first \\w+")
+    assert binary is not regex
+    assert binary.match(b"first line")
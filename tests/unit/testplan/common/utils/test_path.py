@@ -46,3 +46,30 @@ def test_hashfile(tmpdir):
     # Check that the has produced by our hash_file utility matches the
     # reference value.
     assert path.hash_file(tmpfile) == ref_sha
+
+
+def test_dir_manifest(tmpdir):
+    """Files are described by hash and mode, links by target."""
+    tmpdir.join("top.txt").write("top")
+    tmpdir.join("sub", "nested.txt").write("nested", ensure=True)
+    tmpdir.join("sub", "nested.pyc").write("bytecode")
+    tmpdir.join("build", "out.o").write("object", ensure=True)
+    os.chmod(str(tmpdir.join("top.txt")), 0o755)
+    os.symlink("top.txt", str(tmpdir.join("link.txt")))
+    os.symlink("sub", str(tmpdir.join("linked_dir")))
+
+    manifest = path.dir_manifest(str(tmpdir), exclude=["*.pyc", "build"])
+
+    assert manifest == {
+        "top.txt": {
+            "sha1": path.hash_file(str(tmpdir.join("top.txt"))),
+            "mode": 0o755,
+        },
+        "sub/nested.txt": {
+            "sha1": path.hash_file(str(tmpdir.join("sub", "nested.txt"))),
+            "mode": os.stat(str(tmpdir.join("sub", "nested.txt"))).st_mode
+            & 0o7777,
+        },
+        "link.txt": {"link": "top.txt"},
+        "linked_dir": {"link": "sub"},
+    }
@@ -0,0 +1,116 @@
+"""Unit tests for the process utilities."""
+
+import os
+import sys
+import time
+import subprocess
+
+import psutil
+import pytest
+
+from testplan.common.utils import process
+
+posix_only = pytest.mark.skipif(
+    os.name != "posix", reason="Process groups are POSIX only."
+)
+
+
+def test_wait_process():
+    """`wait_process` should return as soon as the process exits."""
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(0.2)"]
+    )
+
+    assert process.wait_process(proc, timeout=0) is None
+
+    start = time.time()
+    assert process.wait_process(proc, timeout=10) == 0
+    assert time.time() - start < 5
+
+
+def test_wait_process_timeout():
+    """`wait_process` should return None if the process is still alive."""
+    proc = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(100)"]
+    )
+    try:
+        assert process.wait_process(proc, timeout=0.1) is None
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+@posix_only
+def test_kill_process_group():
+    """
+    Children of a process group leader are signalled along with it, so
+    orphaned children do not hold up the kill for the whole timeout.
+    """
+    proc = subprocess.Popen(
+        "sleep 100 & sleep 100 & wait", shell=True, preexec_fn=os.setsid,
+    )
+    children = []
+    for _ in range(50):
+        children = psutil.Process(proc.pid).children(recursive=True)
+        if len(children) == 2:
+            break
+        time.sleep(0.05)
+
+    assert process.is_process_group_leader(proc.pid)
+
+    start = time.time()
+    process.kill_process(proc, timeout=5)
+    assert time.time() - start < 4
+
+    assert proc.returncode is not None
+    _, alive = psutil.wait_procs(children, timeout=1)
+    assert not alive
+
+
+class TestEnforceTimeout(object):
+    """Test timeouts enforced by the shared supervisor."""
+
+    @staticmethod
+    def _sleep_proc(duration):
+        return subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import time; time.sleep({})".format(duration),
+            ]
+        )
+
+    def test_kill_on_timeout(self):
+        """Processes are killed shortly after their own deadline."""
+        killed = []
+        slow = self._sleep_proc(100)
+        slower = self._sleep_proc(100)
+
+        start = time.time()
+        process.enforce_timeout(
+            slower, timeout=0.6, callback=lambda: killed.append(slower)
+        )
+        process.enforce_timeout(
+            slow, timeout=0.2, callback=lambda: killed.append(slow)
+        )
+
+        slow.wait()
+        assert time.time() - start < 0.6
+        slower.wait()
+        assert time.time() - start < 1.2
+        assert killed == [slow, slower]
+
+    def test_cancel_timeout(self):
+        """Processes which exited in time are no longer supervised."""
+        killed = []
+        proc = self._sleep_proc(0)
+
+        process.enforce_timeout(
+            proc, timeout=0.2, callback=lambda: killed.append(proc)
+        )
+        proc.wait()
+        process.cancel_timeout(proc)
+
+        time.sleep(0.4)
+        assert killed == []
+        assert proc.returncode == 0
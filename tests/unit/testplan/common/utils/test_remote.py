@@ -0,0 +1,93 @@
+"""Unit tests for the remote execution utilities."""
+import getpass
+import subprocess
+
+import pytest
+
+from testplan.common.utils import remote
+
+
+@pytest.fixture
+def binaries(monkeypatch):
+    """Fixed ssh and scp binaries, counting the PATH lookups."""
+    lookups = []
+
+    def check_output(cmd, **kwargs):
+        lookups.append(cmd)
+        return "/usr/bin/{}\n".format(cmd.split()[-1]).encode()
+
+    monkeypatch.delenv("SSH_BINARY", raising=False)
+    monkeypatch.delenv("SCP_BINARY", raising=False)
+    monkeypatch.delenv("RSYNC_BINARY", raising=False)
+    monkeypatch.setattr(remote, "_BINARIES", {})
+    monkeypatch.setattr(subprocess, "check_output", check_output)
+    return lookups
+
+
+def test_binary_resolved_once(binaries):
+    """The ssh binary is looked up on the PATH on the first command only."""
+    for _ in range(3):
+        cmd = remote.ssh_cmd({"host": "host1"}, "ls")
+    assert cmd == ["/usr/bin/ssh", "{}@host1".format(getpass.getuser()), "ls"]
+    assert binaries == ["which ssh"]
+
+
+def test_ssh_cmd_multiplexed(binaries):
+    """Commands reuse the master connection when a control path is set."""
+    ssh_cfg = {"host": "host1", "control_path": "/tmp/ctl/master"}
+    user_host = "{}@host1".format(getpass.getuser())
+
+    assert remote.ssh_cmd(ssh_cfg, "ls") == [
+        "/usr/bin/ssh",
+        "-o",
+        "ControlPath=/tmp/ctl/master",
+        user_host,
+        "ls",
+    ]
+    assert remote.ssh_cmd(dict(ssh_cfg, control="start"), "") == [
+        "/usr/bin/ssh",
+        "-o",
+        "ControlPath=/tmp/ctl/master",
+        "-o",
+        "ControlMaster=yes",
+        "-o",
+        "ControlPersist={}".format(remote.SSH_CONTROL_PERSIST),
+        "-f",
+        "-N",
+        user_host,
+    ]
+    assert remote.ssh_cmd(dict(ssh_cfg, control="exit"), "") == [
+        "/usr/bin/ssh",
+        "-o",
+        "ControlPath=/tmp/ctl/master",
+        "-O",
+        "exit",
+        user_host,
+    ]
+
+
+def test_copy_cmd_multiplexed(binaries, monkeypatch):
+    """Copy commands pass the ssh options to scp or to rsync's ssh."""
+    options = remote.ssh_options({"host": "h", "control_path": "/tmp/m"})
+    assert remote.copy_cmd("src", "h:dst", extra_ssh_options=options) == [
+        "/usr/bin/scp",
+        "-r",
+        "-o",
+        "ControlPath=/tmp/m",
+        "src",
+        "h:dst",
+    ]
+
+    monkeypatch.setenv("RSYNC_BINARY", "/usr/bin/rsync")
+    assert remote.copy_cmd(
+        "src", "h:dst", port=2222, extra_ssh_options=options
+    ) == [
+        "/usr/bin/rsync",
+        "-r",
+        "-l",
+        "-e",
+        "/usr/bin/ssh -p 2222 -o ControlPath=/tmp/m",
+        "src",
+        "h:dst",
+    ]
+    assert binaries == ["which scp", "which ssh"]
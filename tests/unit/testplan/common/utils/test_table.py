@@ -1,5 +1,11 @@
+import os
+
 import pytest
-from testplan.common.utils.table import TableEntry
+from testplan.common.utils.table import (
+    TableEntry,
+    ColumnarWriter,
+    read_columnar,
+)
 
 
 class TestTableEntry(object):
@@ -30,3 +36,23 @@ class TestTableEntry(object):
     )
     def test_validation_success(self, value):
         TableEntry(value)
+
+
+def test_columnar_roundtrip(tmpdir):
+    """Rows are written in column oriented chunks and read back."""
+    path = str(tmpdir.join("table.jsonl.gz"))
+
+    with ColumnarWriter(path, ["name", "age"], chunk_size=2) as writer:
+        writer.write(["Bob", 32])
+        writer.write(["Susan", 24])
+        writer.write([b"Joe", None])
+
+    assert writer.num_rows == 3
+    assert os.path.getsize(path) > 0
+
+    columns, chunks = read_columnar(path)
+    assert columns == ["name", "age"]
+    assert list(chunks) == [
+        {"name": ["Bob", "Susan"], "age": [32, 24]},
+        {"name": [repr(b"Joe")], "age": [None]},
+    ]
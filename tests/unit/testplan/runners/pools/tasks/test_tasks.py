@@ -1,6 +1,9 @@
 """Unit test for task classes."""
 
 import os
+import sys
+import importlib
+
 from testplan.runners.pools.tasks import (
     Task,
     RunnableTaskAdaptor,
@@ -252,6 +255,44 @@ class TestTaskInitAndMaterialization(object):
         )
         materialized_task_result(task, 4)
 
+    def test_target_cache(self, monkeypatch):  # pylint: disable=R0201
+        """Targets are imported once per process, not once per task."""
+        dirname = os.path.dirname(os.path.abspath(__file__))
+        path = os.path.join(dirname, "data", "relative")
+        imported = []
+        import_module = importlib.import_module
+
+        def counting_import_module(name, *args, **kwargs):
+            imported.append(name)
+            return import_module(name, *args, **kwargs)
+
+        monkeypatch.setattr("testplan.runners.pools.tasks.base._TARGETS", {})
+        monkeypatch.setattr(importlib, "import_module", counting_import_module)
+        sys_path = list(sys.path)
+        for _ in range(3):
+            task = Task(
+                "Multiplier", module="sample_tasks", args=(4,), path=path
+            )
+            materialized_task_result(task, 8)
+        assert imported == ["sample_tasks"]
+        assert sys.path == sys_path
+
+        task = Task("sample_tasks.Multiplier", args=(4,), path=path)
+        materialized_task_result(task, 8)
+        assert imported == ["sample_tasks", "sample_tasks"]
+
+    def test_affinity(self):  # pylint: disable=R0201
+        """Task affinity defaults to the module of the target."""
+        assert Task("Runnable", module=__name__).affinity == __name__
+        assert Task("sample_tasks.Multiplier").affinity == "sample_tasks"
+        assert Task("Multiplier").affinity is None
+        assert Task(callable_to_runnable).affinity == __name__
+        assert Task(Runnable()).affinity is None
+        assert (
+            Task("Runnable", module=__name__, affinity="suite").affinity
+            == "suite"
+        )
+
 
 # pylint: disable=R0201
 class TestTaskSerialization(object):
@@ -275,6 +316,11 @@ class TestTaskSerialization(object):
         task = Task("Multiplier", module="sample_tasks", args=(4,), path=path)
         materialized_task_result(task, 8, serialize=True)
 
+    def test_serialize_affinity(self):
+        """Explicit affinity keys are serialized along with the task."""
+        task = Task("Runnable", module=__name__, affinity="suite")
+        assert Task().loads(task.dumps()).affinity == "suite"
+
     def test_raise_on_serialization(self):
         """TODO."""
         try:
@@ -1,6 +1,7 @@
 """TODO."""
 
 import os
+import threading
 
 from testplan.common.utils.path import default_runpath
 from testplan.runners.pools import base as pools_base
@@ -173,3 +174,224 @@ class TestPoolIsolated:
             worker = pool._workers["0"]
 
         assert worker._restart_count == 0
+
+
+def test_scaling_decision():
+    """Workers are added and removed within [min_size, max_size]."""
+    pool = pools_base.Pool(
+        name="MyPool",
+        size=2,
+        autoscale=True,
+        min_size=1,
+        max_size=8,
+        autoscale_interval=1,
+    )
+
+    def decision(**stats):
+        base = dict(busy=0, queued=0, latency=None, cpu=10, memory=10)
+        base.update(stats)
+        return pool._scaling_decision(base)
+
+    assert decision(workers=0, queued=10) == (1, "below min_size")
+    assert decision(workers=2, busy=2, queued=10) == (4, "queue depth")
+    assert decision(workers=6, busy=6, queued=10) == (8, "queue depth")
+    assert decision(workers=4, busy=3, queued=2) == (5, "queue depth")
+    assert decision(workers=4, busy=4, queued=2, latency=1) == (
+        4,
+        "queue drains within interval",
+    )
+    assert decision(workers=4, busy=4, queued=20, latency=1) == (
+        8,
+        "queue depth",
+    )
+    assert decision(workers=4, busy=2) == (3, "idle workers")
+    assert decision(workers=1) == (1, "steady")
+    assert decision(workers=4, busy=4) == (4, "steady")
+    assert decision(workers=4, busy=2, queued=10, cpu=95) == (
+        3,
+        "host load cpu=95% memory=10%",
+    )
+    assert decision(workers=4, busy=4, queued=10, memory=95) == (
+        4,
+        "host load cpu=10% memory=95%",
+    )
+
+
+def test_autoscale(tmpdir):
+    """
+    Workers are added for unassigned tasks, idle ones are told to stop on
+    their next task pull request and removed.
+    """
+    pool = pools_base.Pool(
+        name="MyPool",
+        size=2,
+        worker_type=ControllableWorker,
+        autoscale=True,
+        min_size=1,
+        max_size=6,
+        autoscale_interval=3600,
+        max_cpu_load=100,
+        max_memory_load=100,
+        runpath=str(tmpdir),
+    )
+    pool._start_monitor_thread = False
+
+    with pool:
+        # No task was added before the pool started
+        assert len(pool._workers) == 1
+
+        for _ in range(6):
+            task = Task(target=Runnable(5))
+            pool.add(task, uid=task.uid())
+
+        for size in (2, 4, 6, 6):
+            pool._autoscale()
+            assert len(pool._workers) == size
+            assert all(
+                worker.status.tag == worker.STATUS.STARTED
+                for worker in pool._workers
+            )
+
+        worker = pool._workers["0"]
+        msg_factory = communication.Message(**worker.metadata)
+        received = worker.transport.send_and_receive(
+            msg_factory.make(msg_factory.TaskPullRequest, data=6)
+        )
+        assert received.cmd == communication.Message.TaskSending
+        assert len(received.data) == 6
+
+        # The last idle worker is removed
+        pool._autoscale()
+        assert pool._retiring == {"5"}
+        retired = pool._workers["5"]
+        msg_factory = communication.Message(**retired.metadata)
+        received = retired.transport.send_and_receive(
+            msg_factory.make(msg_factory.TaskPullRequest, data=1)
+        )
+        assert received.cmd == communication.Message.Stop
+
+        pool._autoscale()
+        assert "5" not in pool._workers
+        assert retired.status.tag == retired.STATUS.STOPPED
+        assert pool._retiring == {"4"}
+
+    assert [stats["target"] for stats in pool.autoscale_history] == [
+        2,
+        4,
+        6,
+        6,
+        5,
+        4,
+    ]
+    with open(os.path.join(str(tmpdir), "autoscale.csv")) as csv_file:
+        lines = csv_file.read().splitlines()
+    assert lines[0] == ",".join(pool.AUTOSCALE_FIELDS)
+    assert len(lines) == 7
+
+
+def test_affinity_scheduling():
+    """
+    Workers take the tasks with the affinity of their previous tasks first,
+    and steal the tasks left for other workers when there is no other one.
+    """
+    pool = pools_base.Pool(
+        name="MyPool", size=2, worker_type=ControllableWorker
+    )
+    pool._start_monitor_thread = False
+
+    def pull(worker):
+        msg_factory = communication.Message(**worker.metadata)
+        received = worker.transport.send_and_receive(
+            msg_factory.make(msg_factory.TaskPullRequest, data=1)
+        )
+        assert received.cmd == communication.Message.TaskSending
+        return received.data[0]
+
+    def run(worker, task):
+        msg_factory = communication.Message(**worker.metadata)
+        received = worker.transport.send_and_receive(
+            msg_factory.make(
+                msg_factory.TaskResults, data=[worker.execute(task)]
+            )
+        )
+        assert received.cmd == communication.Message.Ack
+
+    with pool:
+        worker0, worker1 = pool._workers["0"], pool._workers["1"]
+        tasks = {}
+        for name in ("A1", "B1", "A2", "B2", "B3", "C1"):
+            tasks[name] = Task(target=Runnable(5), affinity=name[0])
+            pool.add(tasks[name], uid=tasks[name].uid())
+
+        assert pull(worker0) is tasks["A1"]
+        assert pull(worker1) is tasks["B1"]
+        run(worker1, tasks["B1"])
+        # B2 is preferred to A2, next in the queue
+        assert pull(worker1) is tasks["B2"]
+        run(worker0, tasks["A1"])
+        assert pull(worker0) is tasks["A2"]
+        run(worker0, tasks["A2"])
+        run(worker1, tasks["B2"])
+        # B3 is left to worker1 while it is idle
+        assert pull(worker0) is tasks["C1"]
+        # Unless there is no other task
+        assert pull(worker0) is tasks["B3"]
+
+
+def test_affinity_scheduling_many_tasks():
+    """
+    Tasks sharing an affinity are indexed, picking a task does not go
+    through the queued tasks left to an idle worker.
+    """
+    pool = pools_base.Pool(
+        name="MyPool", size=2, worker_type=ControllableWorker
+    )
+    pool._start_monitor_thread = False
+
+    with pool:
+        worker0, worker1 = pool._workers["0"], pool._workers["1"]
+        shared = [Task(target=Runnable(5), affinity="A") for _ in range(5000)]
+        others = [Task(target=Runnable(5)) for _ in range(2)]
+        for task in shared + others:
+            pool.add(task, uid=task.uid())
+        pool._assign_affinity("A", worker0)
+
+        # worker0 is idle, its tasks are taken last by worker1
+        picked = [pool._next_task(worker1) for _ in range(len(shared) + 2)]
+        assert picked == [task.uid() for task in others + shared]
+        assert pool._next_task(worker1) is None
+
+        for task in shared:
+            pool.unassigned.append(task.uid())
+        picked = [pool._next_task(worker0) for _ in range(len(shared))]
+        assert picked == [task.uid() for task in shared]
+        assert not pool.unassigned
+
+
+def test_task_queue_concurrent_append():
+    """
+    Tasks appended by another thread while tasks are being taken are
+    neither lost nor taken twice.
+    """
+    queue = pools_base._TaskQueue(lambda uid: uid % 3 or None)
+    uids = list(range(20000))
+
+    def append():
+        for uid in uids:
+            queue.append(uid)
+
+    thread = threading.Thread(target=append)
+    thread.start()
+    taken = []
+    while thread.is_alive() or queue:
+        for affinity in (1, 2):
+            entry = queue.first_of(affinity)
+            if entry is not None:
+                taken.append(queue.pop(entry))
+        entry = queue.first()
+        if entry is not None:
+            taken.append(queue.pop(entry))
+    thread.join()
+
+    assert sorted(taken) == uids
+    assert list(queue) == []
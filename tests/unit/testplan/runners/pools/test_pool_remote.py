@@ -0,0 +1,162 @@
+"""Unit tests for the remote pool."""
+
+import logging
+import threading
+import time
+
+import six
+
+from testplan.common.utils.remote import copy_cmd, ssh_cmd
+from testplan.runners.pools import remote
+from testplan.runners.pools.remote import (
+    RemoteWorker,
+    _LocationPaths,
+    _WorkspaceSeeds,
+    _accepts_extra_ssh_options,
+)
+
+
+def test_workspace_seeds_tree():
+    """
+    Hosts that received the workspace seed it to the others, the number of
+    copies made from the local host stays logarithmic in the number of hosts.
+    """
+    seeds = _WorkspaceSeeds()
+    sources = {}
+
+    def copy_workspace(host):
+        seed = seeds.acquire()
+        sources[host] = seed["host"] if seed else None
+        time.sleep(0.05)
+        seeds.release(seed, {"host": host})
+
+    hosts = ["host{}".format(idx) for idx in range(15)]
+    threads = [
+        threading.Thread(target=copy_workspace, args=(host,)) for host in hosts
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(sources) == sorted(hosts)
+
+    def depth(host):
+        return 1 if sources[host] is None else 1 + depth(sources[host])
+
+    # 15 hosts are seeded in 4 rounds of copies, allow for slow threads
+    assert max(depth(host) for host in hosts) <= 6
+    assert list(sources.values()).count(None) <= 6
+
+
+def test_accepts_extra_ssh_options():
+    """Only copy commands taking extra_ssh_options are multiplexed."""
+
+    def old_copy_cmd(source, target, exclude=None, port=None, deref=True):
+        return ["scp", source, target]
+
+    def any_copy_cmd(source, target, **kwargs):
+        return ["scp", source, target]
+
+    assert _accepts_extra_ssh_options(copy_cmd)
+    assert _accepts_extra_ssh_options(any_copy_cmd)
+    assert not _accepts_extra_ssh_options(old_copy_cmd)
+
+
+def test_ssh_master_default_ssh_cmd_only(monkeypatch):
+    """
+    A user defined ssh_cmd may not handle the master connection control, no
+    master connection is started with it.
+    """
+    commands = []
+    monkeypatch.setattr(
+        remote, "execute_cmd", lambda cmd, **kwargs: commands.append(cmd) or 1
+    )
+
+    def user_ssh_cmd(ssh_cfg, command):
+        return ["ssh", ssh_cfg["host"], command]
+
+    for cmd, started in ((user_ssh_cmd, False), (ssh_cmd, True)):
+        worker = type(
+            "Worker",
+            (object,),
+            dict(
+                _start_ssh_master=six.get_unbound_function(
+                    RemoteWorker._start_ssh_master
+                ),
+                _stop_ssh_master=six.get_unbound_function(
+                    RemoteWorker._stop_ssh_master
+                ),
+            ),
+        )()
+        worker.cfg = type(
+            "Config",
+            (object,),
+            dict(
+                ssh_multiplex=True,
+                ssh_cmd=staticmethod(cmd),
+                remote_host="host1",
+            ),
+        )
+        worker.ssh_cfg = {"host": "host1"}
+        worker.logger = logging.getLogger(__name__)
+        worker._ssh_control_dir = None
+
+        del commands[:]
+        worker._start_ssh_master()
+        assert bool(commands) is started
+        assert worker.ssh_cfg == {"host": "host1"}
+
+
+class _SeededWorker(object):
+    """Remote worker state used when seeding its workspace."""
+
+    _seed_workspace = six.get_unbound_function(RemoteWorker._seed_workspace)
+    _remote_copy_path = six.get_unbound_function(
+        RemoteWorker._remote_copy_path
+    )
+
+    def __init__(self, host):
+        self.cfg = type(
+            "Config",
+            (object,),
+            dict(
+                remote_host=host,
+                copy_cmd=staticmethod(copy_cmd),
+                ssh_cmd=staticmethod(ssh_cmd),
+                workspace_exclude=None,
+            ),
+        )
+        self.ssh_cfg = {"host": host, "control_path": "/tmp/ctl/master"}
+        self.logger = logging.getLogger(__name__)
+        self._user = "user"
+        self._workspace_paths = _LocationPaths("/local/ws", "/remote/ws")
+        self._remote_testplan_path = "/remote/testplan"
+
+    def _copy_local_workspace(self):
+        raise AssertionError("workspace copied from the local host")
+
+
+def test_seed_workspace_from_host(monkeypatch):
+    """
+    Copies between hosts run the copy binary by name on the seed host, the
+    host is then released as a seed without its master connection.
+    """
+    monkeypatch.setenv("SSH_BINARY", "/opt/bin/ssh")
+    monkeypatch.setenv("SCP_BINARY", "/opt/bin/scp")
+    monkeypatch.delenv("RSYNC_BINARY", raising=False)
+    commands = []
+    monkeypatch.setattr(
+        remote, "execute_cmd", lambda cmd, **kwargs: commands.append(cmd) or 0
+    )
+
+    seeds = _WorkspaceSeeds()
+    seeds.acquire()
+    seeds.release({"host": "host1"})
+    _SeededWorker("host2")._seed_workspace(seeds)
+
+    assert len(commands) == 1
+    assert commands[0][0] == "/opt/bin/ssh"
+    assert commands[0][-1] == "scp -r /remote/ws user@host2:/remote/testplan"
+    assert seeds.acquire() == {"host": "host1"}
+    assert seeds.acquire() == {"host": "host2"}
@@ -75,3 +75,19 @@ class TestProcPool(object):
 
             assert proc_pool.status.tag == proc_pool.status.STOPPED
             assert len(current_proc.children()) == len(start_children)
+
+
+def test_forked_process_wait():
+    """Waiting for a forked process without timeout returns its exit code."""
+
+    class ForkServer(object):
+        def __init__(self):
+            self.polls = 0
+
+        def returncode(self, pid):
+            self.polls += 1
+            return 3 if self.polls > 2 else None
+
+    forked = process.ForkedProcess(1234, ForkServer())
+    assert forked.wait() == 3
+    assert forked.poll() == 3
@@ -0,0 +1,140 @@
+"""Unit tests for the workspace delta sync."""
+
+import io
+import os
+import sys
+import json
+import time
+import tarfile
+import subprocess
+
+from testplan.common.utils.path import dir_manifest
+from testplan.runners.pools import workspace_sync
+
+SCRIPT = os.path.join(
+    os.path.dirname(workspace_sync.__file__), "workspace_sync.py"
+)
+
+
+def _sync(workspace, cache, dest):
+    """Sync a workspace, running the script steps as the remote host does."""
+    manifest = dir_manifest(workspace)
+    digests = sorted(
+        {entry["sha1"] for entry in manifest.values() if "sha1" in entry}
+    )
+
+    proc = subprocess.Popen(
+        [sys.executable, SCRIPT, "missing", "--cache", cache],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    missing, _ = proc.communicate("\n".join(digests).encode("ascii"))
+    missing = set(missing.decode("ascii").split())
+
+    proc = subprocess.Popen(
+        [sys.executable, SCRIPT, "receive", "--cache", cache, "--dest", dest],
+        stdin=subprocess.PIPE,
+    )
+    workspace_sync.send(proc.stdin, workspace, manifest, missing)
+    proc.stdin.close()
+    assert proc.wait() == 0
+    return missing
+
+
+def test_sync(tmpdir):
+    """Only the files missing from the cache are sent."""
+    workspace = tmpdir.join("workspace")
+    workspace.join("run.sh").write("#!/bin/sh\n", ensure=True)
+    workspace.join("run.sh").chmod(0o755)
+    workspace.join("pkg", "a.py").write("a = 1\n", ensure=True)
+    workspace.join("pkg", "b.py").write("b = 2\n")
+    workspace.join("pkg", "copy_of_a.py").write("a = 1\n")
+    os.symlink("pkg/a.py", str(workspace.join("link.py")))
+    cache = str(tmpdir.join("cache"))
+    dest = str(tmpdir.join("remote", "workspace"))
+
+    assert len(_sync(str(workspace), cache, dest)) == 3
+    assert dir_manifest(dest) == dir_manifest(str(workspace))
+
+    # Changed and removed files are updated
+    workspace.join("pkg", "b.py").write("b = 3\n")
+    workspace.join("pkg", "copy_of_a.py").remove()
+    assert _sync(str(workspace), cache, dest) == {
+        dir_manifest(str(workspace))["pkg/b.py"]["sha1"]
+    }
+    assert dir_manifest(dest) == dir_manifest(str(workspace))
+
+    # Another workspace with the same files only uses the cache
+    other_dest = str(tmpdir.join("remote", "other_workspace"))
+    assert _sync(str(workspace), cache, other_dest) == set()
+    assert dir_manifest(other_dest) == dir_manifest(str(workspace))
+
+
+def _fetch(root, dest, state):
+    """Fetch the files changed under a directory as the remote worker does."""
+    proc = subprocess.Popen(
+        [sys.executable, SCRIPT, "changed", "--root", root],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    proc.stdin.write(json.dumps(state).encode("utf-8"))
+    proc.stdin.close()
+    count = workspace_sync.extract(proc.stdout, dest, state)
+    proc.stdout.close()
+    assert proc.wait() == 0
+    return count
+
+
+def test_fetch_changed(tmpdir):
+    """Only the files created or changed since the last fetch are fetched."""
+    runpath = tmpdir.join("remote_runpath")
+    runpath.join("test1", "stdout").write("line 1\n", ensure=True)
+    runpath.join("test1", "report.xml").write("<xml/>")
+    dest = str(tmpdir.join("runpath"))
+    state = {}
+
+    assert _fetch(str(runpath), dest, state) == 2
+    assert _fetch(str(runpath), dest, state) == 0
+
+    runpath.join("test1", "stdout").write("line 2\n", mode="a")
+    runpath.join("test2", "stdout").write("test 2\n", ensure=True)
+    assert _fetch(str(runpath), dest, state) == 2
+    assert dir_manifest(dest) == dir_manifest(str(runpath))
+
+
+def test_changed_file_truncated(tmpdir, monkeypatch):
+    """Files truncated while they are fetched do not corrupt the stream."""
+    runpath = tmpdir.join("remote_runpath")
+    runpath.join("a.log").write("x" * 1000, ensure=True)
+    runpath.join("b.log").write("y" * 1000)
+    gettarinfo = tarfile.TarFile.gettarinfo
+
+    def truncating_gettarinfo(archive, name, *args, **kwargs):
+        info = gettarinfo(archive, name, *args, **kwargs)
+        if name.endswith("a.log"):
+            runpath.join("a.log").write("x" * 10)
+        return info
+
+    monkeypatch.setattr(tarfile.TarFile, "gettarinfo", truncating_gettarinfo)
+    stream = io.BytesIO()
+    workspace_sync.changed(str(runpath), {}, stream)
+    monkeypatch.undo()
+
+    stream.seek(0)
+    dest = tmpdir.join("runpath")
+    state = {}
+    assert workspace_sync.extract(stream, str(dest), state) == 2
+    assert dest.join("a.log").read() == "x" * 10 + "\0" * 990
+    assert dest.join("b.log").read() == "y" * 1000
+    # Fetched again as its size changed
+    assert _fetch(str(runpath), str(dest), state) == 1
+    assert dir_manifest(str(dest)) == dir_manifest(str(runpath))
+
+
+def test_rate_limited_reader():
+    """Reading is slowed down to the given rate."""
+    reader = workspace_sync.RateLimitedReader(io.BytesIO(b"x" * 1000), 10000)
+    start = time.time()
+    while reader.read(100):
+        pass
+    assert time.time() - start >= 0.09
@@ -1,6 +1,8 @@
 """TODO."""
 
 import os
+import subprocess
+import sys
 import uuid
 
 from testplan import Testplan, TestplanResult
@@ -213,3 +215,39 @@ def test_testplan_runpath():
     assert plan.runpath is None
     plan.run()
     assert plan.runpath == runpath_maker(plan._runnable)
+
+
+BYTECODE_CACHE_SCRIPT = """
+import os, sys
+from testplan import Testplan
+plan = Testplan(name="MyPlan", parse_cmdline=False, bytecode_cache=sys.argv[1])
+sys.path.insert(0, sys.argv[2])
+import cached_module
+"""
+
+
+def test_testplan_bytecode_cache(tmpdir):
+    """
+    Bytecode is only written to the cache directory, on Python versions
+    supporting it, never next to the sources.
+    """
+    cache_dir = tmpdir.mkdir("cache")
+    source_dir = tmpdir.mkdir("sources")
+    source_dir.join("cached_module.py").write("VALUE = 1\n")
+
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-c",
+            BYTECODE_CACHE_SCRIPT,
+            str(cache_dir),
+            str(source_dir),
+        ]
+    )
+
+    assert source_dir.listdir() == [source_dir.join("cached_module.py")]
+    cached = [path.basename for path in cache_dir.visit("*.pyc")]
+    if hasattr(sys, "pycache_prefix"):
+        assert any(name.startswith("cached_module.") for name in cached)
+    else:
+        assert cached == []
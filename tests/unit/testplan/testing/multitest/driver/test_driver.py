@@ -1,5 +1,9 @@
 """Unit tests for the driver base."""
 
+import os
+import time
+
+from testplan.common.entity import Environment
 from testplan.testing.multitest.driver import base
 
 
@@ -73,3 +77,50 @@ class TestPrePostCallables(object):
 
         assert driver.pre_stop_called
         assert driver.post_stop_called
+
+
+class TestEnvironmentStop(object):
+    """Test stopping drivers of an environment."""
+
+    class SlowStopDriver(base.Driver):
+        def __init__(self, **options):
+            super(TestEnvironmentStop.SlowStopDriver, self).__init__(**options)
+            self.stopped_at = None
+
+        def stopping(self):
+            time.sleep(0.5)
+            self.stopped_at = time.time()
+
+    def _start_env(self, runpath, async_stop):
+        env = Environment()
+        for idx in range(3):
+            env.add(
+                self.SlowStopDriver(
+                    name="Driver{}".format(idx),
+                    runpath=os.path.join(runpath, str(idx)),
+                    async_stop=async_stop,
+                )
+            )
+        env.start()
+        return env
+
+    def test_concurrent_stop(self, runpath):
+        """Drivers are stopped concurrently and stop latency is recorded."""
+        env = self._start_env(runpath, async_stop=True)
+
+        start = time.time()
+        env.stop(reversed=True)
+
+        assert time.time() - start < 1.5
+        assert not env.stop_exceptions
+        for driver in env:
+            assert driver.status.tag == driver.STATUS.STOPPED
+            assert env.stop_timer[driver.uid()].elapsed >= 0.5
+
+    def test_sequential_stop(self, runpath):
+        """Drivers without async_stop are stopped in reverse order."""
+        env = self._start_env(runpath, async_stop=False)
+        env.stop(reversed=True)
+
+        stop_times = [driver.stopped_at for driver in env]
+        assert stop_times == sorted(stop_times, reverse=True)
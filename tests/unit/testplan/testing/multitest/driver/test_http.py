@@ -102,3 +102,21 @@ class TestHTTP(object):
         http_client.flush()
         msg = http_client.receive(timeout=0.1)
         assert msg is None
+
+    def test_client_stop_cancels_queued(self, http_server, runpath):
+        """Requests still queued when the client stops are not sent."""
+        client = http.HTTPClient(
+            name="http_client_stop",
+            host=http_server.host,
+            port=http_server.port,
+            timeout=2,
+            pool_size=1,
+            runpath=os.path.join(runpath, "client_stop"),
+        )
+        with client:
+            for _ in range(3):
+                client.get("random/text")
+            pending = [future for future, _ in client._pending_requests]
+
+        assert all(future.cancelled() for future in pending[1:])
+        http_server.respond(http.HTTPResponse(content=["text"]))
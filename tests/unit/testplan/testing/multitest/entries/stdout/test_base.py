@@ -0,0 +1,72 @@
+import mock
+import pytest
+
+from testplan.report.testing.styles import Style
+from testplan.testing.multitest.entries import assertions
+from testplan.testing.multitest.entries.stdout import base
+
+
+class CountingRenderer(object):
+    """Records how many times the header & details have been rendered."""
+
+    header_calls = 0
+    details_calls = 0
+
+    def get_header(self, entry):
+        CountingRenderer.header_calls += 1
+        return "header"
+
+    def get_details(self, entry):
+        CountingRenderer.details_calls += 1
+        return "details"
+
+
+@pytest.fixture
+def registry():
+    CountingRenderer.header_calls = 0
+    CountingRenderer.details_calls = 0
+    registry = base.StdOutRegistry()
+    registry.bind_default()(CountingRenderer)
+    registry.logger = mock.MagicMock()
+    return registry
+
+
+@pytest.mark.parametrize(
+    "style, passing, header_calls, details_calls",
+    (
+        (Style("testcase", "testcase"), True, 0, 0),
+        (Style("testcase", "testcase"), False, 0, 0),
+        (Style("testcase", "assertion"), True, 0, 0),
+        (Style("testcase", "assertion"), False, 1, 0),
+        (Style("testcase", "assertion-detail"), False, 1, 1),
+        (Style("assertion-detail", "assertion-detail"), True, 1, 1),
+    ),
+)
+def test_log_entry_renders_displayed_parts_only(
+    registry, style, passing, header_calls, details_calls
+):
+    """Renderers should not be invoked for output the style hides."""
+    entry = assertions.IsTrue(passing)
+    registry.log_entry(entry=entry, stdout_style=style)
+
+    assert CountingRenderer.header_calls == header_calls
+    assert CountingRenderer.details_calls == details_calls
+    assert registry.logger.test_info.call_count == (
+        header_calls + details_calls
+    )
+
+
+def test_log_entry_empty_header():
+    """A missing header is an error when the assertion is displayed."""
+    registry = base.StdOutRegistry()
+
+    @registry.bind_default()
+    class NoHeaderRenderer(base.BaseRenderer):
+        def get_header(self, entry):
+            return None
+
+    with pytest.raises(ValueError):
+        registry.log_entry(
+            entry=assertions.IsTrue(False),
+            stdout_style=Style("testcase", "assertion"),
+        )
@@ -485,6 +485,33 @@ class TestRegexFindIter(BaseRegexTest):
         )
 
 
+class TestRegexMatchLine(object):
+    def test_string(self):
+        string = os.linesep.join(["first line", "second", "third line"])
+        assertion = assertions.RegexMatchLine(r"\w+ line$", string)
+
+        assert assertion
+        assert assertion.string == string
+        assert assertion.match_indexes == [(0, 0, 10), (2, 0, 10)]
+        assert assertion.line_numbers == [0, 2]
+
+    def test_iterable(self):
+        """Only matching lines are kept for lines read from an iterable."""
+        lines = iter(["first line\n", "second\n", "third line\r\n", "x"])
+        assertion = assertions.RegexMatchLine(r"\w+ line$", lines)
+
+        assert assertion
+        assert assertion.string == os.linesep.join(
+            ["first line", "third line"]
+        )
+        assert assertion.match_indexes == [(0, 0, 10), (1, 0, 10)]
+        assert assertion.line_numbers == [0, 2]
+
+        assertion = assertions.RegexMatchLine(r"fourth", iter(["first"]))
+        assert not assertion
+        assert assertion.string == ""
+
+
 EQUAL_SLICES_PARAM_NAMES = "actual,expected,slices,expected_data"
 
 
@@ -1052,6 +1079,37 @@ class TestColumnContains(object):
             expected=False,
         )
 
+    def test_dataframe(self):
+        """Columns of ``pandas.DataFrame`` objects are checked directly."""
+        pandas = pytest.importorskip("pandas")
+
+        table = pandas.DataFrame(
+            {"symbol": ["AAPL", "GOOG"], "amount": [3, 7]}
+        )
+
+        assertion = assertions.ColumnContain(
+            table=table, values=[3, 5], column="amount"
+        )
+        assert bool(assertion) is False
+        assert assertion.data == [
+            assertions.ColumnContainComparison(idx=0, value=3, passed=True),
+            assertions.ColumnContainComparison(idx=1, value=7, passed=False),
+        ]
+        assert type(assertion.data[0].value) is int
+
+        assertion = assertions.ColumnContain(
+            table=table,
+            values=["AAPL"],
+            column="symbol",
+            report_fails_only=True,
+        )
+        assert bool(assertion) is False
+        assert assertion.data == [
+            assertions.ColumnContainComparison(
+                idx=1, value="GOOG", passed=False
+            )
+        ]
+
 
 GET_COMPARISON_COLUMNS_PARAM_NAMES = (
     "table_1,table_2," "include_columns,exclude_columns,expected"
@@ -1491,6 +1549,90 @@ class TestTableMatch(object):
         assert error_orig == error_expected
         assert row_comparison.extra == {"bar": error_func}
 
+    @pytest.mark.parametrize(COMPARE_ROWS_PARAM_NAMES, COMPARE_ROWS_PARAMS)
+    def test_compare_rows_fails_only(
+        self,
+        table,
+        expected_table,
+        comparison_columns,
+        display_columns,
+        strict,
+        fail_limit,
+        report_fails_only,
+        expected_result,
+    ):
+        """
+        Column-wise comparison used when reporting failures only
+        must produce the same failures as the row by row comparison.
+        """
+        passed, row_comparisons = assertions.compare_rows(
+            table=table,
+            expected_table=expected_table,
+            comparison_columns=comparison_columns,
+            display_columns=display_columns,
+            strict=strict,
+        )
+        failures = [row for row in row_comparisons if not row.passed]
+
+        assert assertions.compare_rows(
+            table=table,
+            expected_table=expected_table,
+            comparison_columns=comparison_columns,
+            display_columns=display_columns,
+            strict=strict,
+            report_fails_only=True,
+        ) == (passed, failures)
+
+    def test_compare_rows_fails_only_limit(self):
+        """Only the first ``fail_limit`` failing rows are compared."""
+        table = [{"foo": idx, "bar": "x"} for idx in range(100)]
+        expected_table = [
+            {"foo": idx if idx % 10 else -1, "bar": re.compile("x")}
+            for idx in range(100)
+        ]
+
+        passed, row_comparisons = assertions.compare_rows(
+            table=table,
+            expected_table=expected_table,
+            comparison_columns=["foo", "bar"],
+            display_columns=["foo", "bar"],
+            fail_limit=3,
+            report_fails_only=True,
+        )
+
+        assert passed is False
+        assert [row.idx for row in row_comparisons] == [0, 10, 20]
+        assert row_comparisons[1] == assertions.RowComparison(
+            10, [10, "x"], {"foo": -1}, {}, {"bar": expected_table[10]["bar"]}
+        )
+
+    def test_dataframes(self):
+        """TableMatch & TableDiff accept ``pandas.DataFrame`` objects."""
+        pandas = pytest.importorskip("pandas")
+
+        table = pandas.DataFrame(
+            {"name": ["Bob", "Susan", "Joe"], "age": [32, 24, 51]},
+            columns=["name", "age"],
+        )
+        expected = [["name", "age"], ["Bob", 32], ["Susan", 25], ["Joe", 51]]
+
+        match = assertions.TableMatch(table=table, expected_table=expected)
+        assert bool(match) is False
+        assert match.display_columns == ["name", "age"]
+        assert [row.idx for row in match.data] == [0, 1, 2]
+        assert match.data[1].data == ["Susan", 24]
+        assert match.data[1].diff == {"age": 25}
+
+        diff = assertions.TableDiff(
+            table=table,
+            expected_table=pandas.DataFrame(
+                {"name": ["Bob", "Susan", "Joe"], "age": [32, 24, 51]}
+            ),
+            report_fail_only=True,
+        )
+        assert bool(diff) is True
+        assert diff.data == []
+
     def _test_evaluate(
         self,
         table,
@@ -254,6 +254,30 @@ def test_run_testcases_iter():
         _check_param_testcase_report(testcase_report, i)
 
 
+@multitest.testsuite
+class TableSuite(object):
+    @multitest.testcase
+    def case(self, env, result):
+        result.table.log([{"idx": idx} for idx in range(30)])
+
+
+def test_spill_tables(tmpdir, monkeypatch):
+    """Large tables are only spilled if the spill_tables option is set."""
+    monkeypatch.setattr(defaults, "TABLE_SPILL_THRESHOLD", 10)
+    for spill_tables in (False, True):
+        mtest = multitest.MultiTest(
+            name="MTest",
+            suites=[TableSuite()],
+            runpath=str(tmpdir.join(str(spill_tables))),
+            spill_tables=spill_tables,
+            **MTEST_DEFAULT_PARAMS
+        )
+        mtest.run()
+        testcase_report = mtest.report.entries[0].entries[0]
+        assert bool(testcase_report.entries[0]["spill"]) is spill_tables
+        assert len(testcase_report.attachments) == int(spill_tables)
+
+
 def _check_parallel_testcase(testcase_report, i):
     """
     Check that ith testcase report in the ParallelSuite is as expected after
@@ -12,6 +12,13 @@ from testplan.testing.multitest import MultiTest
 from testplan.common.utils import comparison
 from testplan.common.utils import testing
 from testplan.common.utils import path as path_utils
+from testplan.common.utils import table as table_utils
+from testplan.common.utils.match import LogMatcher
+from testplan.report import TestCaseReport
+from testplan.report.testing.spill import SpilledEntries
+from testplan.testing.multitest.entries.schemas.base import (
+    registry as schema_registry,
+)
 
 
 @testsuite
@@ -234,6 +241,127 @@ class TestDictNamespace(object):
         dict_assert = dict_ns.result.entries.popleft()
         assert len(dict_assert.comparison) == 1
 
+    def test_match_many(self, dict_ns):
+        """Test matching many dicts against the same expected dict."""
+        expected = {"key": comparison.Greater(5), "other": "foo"}
+        actuals = [{"key": 10, "other": "foo"}, {"key": 6, "other": "foo"}]
+
+        assert dict_ns.match_many(actuals, expected, description="Many")
+        assert len(dict_ns.result.entries) == 2
+        for actual in actuals:
+            dict_assert = dict_ns.result.entries.popleft()
+            assert dict_assert.value == actual
+            assert dict_assert.expected == expected
+            assert dict_assert.description == "Many"
+            assert dict_assert.passed
+            assert dict_assert.file_path == os.path.abspath(
+                __file__.replace(".pyc", ".py")
+            )
+
+        actuals.append({"key": 1, "other": "foo", "extra": 1})
+        assert not dict_ns.match_many(
+            actuals,
+            expected,
+            description="Discard passing comparisons",
+            exclude_keys=["extra"],
+            report_mode=comparison.ReportOptions.FAILS_ONLY,
+        )
+        assert len(dict_ns.result.entries) == 3
+        assert [entry.passed for entry in dict_ns.result.entries] == [
+            True,
+            True,
+            False,
+        ]
+        dict_assert = dict_ns.result.entries.pop()
+        assert dict_assert.exclude_keys == ["extra"]
+        assert len(dict_assert.comparison) == 1
+
+    def test_fail_fast(self, dict_ns):
+        """Test a dict match that only reports the first mismatch."""
+        expected = {"key{}".format(i): i for i in range(10)}
+        actual = expected.copy()
+        actual["key3"] = actual["key7"] = -1
+
+        assert not dict_ns.match(actual, expected, fail_fast=True)
+        dict_assert = dict_ns.result.entries.popleft()
+        assert dict_assert.fail_fast
+        assert [row[1] for row in dict_assert.comparison] == ["key3"]
+
+        assert dict_ns.match(expected.copy(), expected, fail_fast=True)
+        dict_assert = dict_ns.result.entries.popleft()
+        assert dict_assert.comparison == []
+
+
+class TestRegexNamespace(object):
+    """Unit testcases for the result.RegexNamespace class."""
+
+    def test_matchline_stream(self, tmpdir):
+        """Lines of a file or an iterable are matched one at a time."""
+        mock_result = mock.MagicMock()
+        mock_result.entries = collections.deque()
+        regex_ns = result_mod.RegexNamespace(mock_result)
+
+        log_path = str(tmpdir.join("app.log"))
+        with open(log_path, "w") as log_file:
+            log_file.writelines(
+                "{} line {}\n".format("ERROR" if idx == 7 else "INFO", idx)
+                for idx in range(10)
+            )
+
+        assert regex_ns.matchline_stream(r"ERROR line \d+$", log_path)
+        entry = mock_result.entries.popleft()
+        assert entry.string == "ERROR line 7"
+        assert entry.line_numbers == [7]
+
+        assert not regex_ns.matchline_stream(
+            r"ERROR", iter(["INFO a", "INFO b"])
+        )
+
+
+class TestLogfileNamespace(object):
+    """Unit testcases for the result.LogfileNamespace class."""
+
+    def test_match(self, tmpdir):
+        """Patterns are matched against the lines of the log file."""
+        mock_result = mock.MagicMock()
+        mock_result.entries = collections.deque()
+        logfile_ns = result_mod.LogfileNamespace(mock_result)
+
+        log_path = str(tmpdir.join("app.log"))
+        with open(log_path, "w") as log_file:
+            log_file.write("INFO started\nERROR failed\nINFO stopped\n")
+        log_matcher = LogMatcher(log_path)
+
+        assert logfile_ns.match(log_matcher, [r"INFO st\w+", r"ERROR"])
+        entry = mock_result.entries.popleft()
+        assert entry.matched_lines == ["INFO started", "ERROR failed"]
+
+        assert not logfile_ns.match(log_matcher, r"ERROR", timeout=0.1)
+        entry = mock_result.entries.popleft()
+        assert entry.matched_lines == [None]
+
+    def test_not_match(self, tmpdir):
+        """Lines between the marks must not match the pattern."""
+        mock_result = mock.MagicMock()
+        mock_result.entries = collections.deque()
+        logfile_ns = result_mod.LogfileNamespace(mock_result)
+
+        log_path = str(tmpdir.join("app.log"))
+        with open(log_path, "w") as log_file:
+            log_file.write("INFO started\nERROR failed\nINFO stopped\n")
+        log_matcher = LogMatcher(log_path)
+        log_matcher.match(r"ERROR")
+        log_matcher.mark("after_error")
+
+        assert logfile_ns.not_match(log_matcher, r"ERROR", start="after_error")
+        entry = mock_result.entries.popleft()
+        assert entry.matches == []
+
+        log_matcher.seek()
+        assert not logfile_ns.not_match(log_matcher, r"ERROR")
+        entry = mock_result.entries.pop()
+        assert entry.matches == [(1, "ERROR failed")]
+
 
 class TestFIXNamespace(object):
     """Unit testcases for the result.FixNamespace class."""
@@ -386,3 +514,148 @@ class TestResultBaseNamespace(object):
             hash=attachment_entry.hash, filesize=attachment_entry.filesize
         )
         assert attachment_entry.dst_path == expected_dst_path
+
+    def test_spill_entries(self, tmpdir):
+        """Entries are serialized to the spill file as they are added."""
+        spill_path = str(tmpdir.join("entries.jsonl"))
+        result = result_mod.Result(_spill_path=spill_path)
+
+        for idx in range(10):
+            result.equal(idx, idx)
+        result.log(b"\xff binary")
+        with result.group(description="Group") as group:
+            group.equal(1, 2, description="Failing")
+        assert len(result) == 12
+        assert not result.passed
+
+        entries = result.serialized_entries
+        assert isinstance(entries, SpilledEntries)
+        assert len(entries) == 12
+        assert [entry["description"] for entry in entries.failing] == ["Group"]
+
+        data = list(entries)
+        assert data[0]["type"] == "Equal"
+        assert data[10]["message"] == b"\xff binary"
+        assert data[11]["entries"][0]["description"] == "Failing"
+        assert entries[-1] == data[11]
+
+        with pytest.raises(RuntimeError):
+            result.prepend(result_mod.Result())
+
+        report = TestCaseReport(name="testcase")
+        report.extend(entries)
+        assert report.entries is entries
+        assert report.failed
+
+
+class TestTableNamespace(object):
+    """Test spilling of large tables into attachments."""
+
+    @pytest.fixture
+    def result(self, tmpdir):
+        return result_mod.Result(_scratch=str(tmpdir), _spill_tables=True)
+
+    def test_match_spill(self, result):
+        """Large comparisons keep failing & sample rows only."""
+        num_rows = 30
+        actual = [["name", "value"]] + [
+            ["row{}".format(idx), idx] for idx in range(num_rows)
+        ]
+        expected = [["name", "value"]] + [
+            ["row{}".format(idx), -1 if idx == 20 else idx]
+            for idx in range(num_rows)
+        ]
+
+        with mock.patch.multiple(
+            result_mod.defaults,
+            TABLE_SPILL_THRESHOLD=10,
+            TABLE_SPILL_SAMPLE=5,
+        ):
+            entry = result.table.match(actual, expected)
+
+        assert not entry
+        assert [row.idx for row in entry.data] == [0, 1, 2, 3, 4, 20]
+        assert entry.table is None and entry.expected_table is None
+        assert result.attachments == [entry.attachment]
+        assert entry.spill["num_rows"] == num_rows
+        assert entry.spill["dst_path"] == entry.attachment.dst_path
+
+        columns, chunks = table_utils.read_columnar(
+            entry.attachment.source_path
+        )
+        assert columns == ["idx", "name", "value", "diff", "errors", "extra"]
+        spilled = [chunk for chunk in chunks]
+        assert len(spilled) == 1
+        assert spilled[0]["idx"] == list(range(num_rows))
+        assert spilled[0]["diff"][20] == {"value": -1}
+
+        serialized = schema_registry.serialize(entry)
+        assert len(serialized["data"]) == 6
+        assert serialized["spill"] == entry.spill
+
+    def test_log_spill(self, result):
+        """Large logged tables keep the first rows only."""
+        table = [{"idx": idx} for idx in range(30)]
+
+        with mock.patch.multiple(
+            result_mod.defaults,
+            TABLE_SPILL_THRESHOLD=10,
+            TABLE_SPILL_SAMPLE=5,
+        ):
+            result.table.log(table)
+
+        entry = result.entries[-1]
+        assert entry.table == table[:5]
+        assert list(entry.indices) == list(range(5))
+        assert result.attachments == [entry.attachment]
+        assert entry.spill["num_rows"] == 30
+
+        _, chunks = table_utils.read_columnar(entry.attachment.source_path)
+        assert next(chunks)["idx"] == list(range(30))
+
+    def test_match_spill_fail_limit(self, result):
+        """Rows after the fail limit are neither compared nor attached."""
+        actual = [["value"]] + [[idx] for idx in range(30)]
+        expected = [["value"]] + [
+            [-1 if idx % 10 == 5 else idx] for idx in range(30)
+        ]
+
+        with mock.patch.multiple(
+            result_mod.defaults,
+            TABLE_SPILL_THRESHOLD=10,
+            TABLE_SPILL_SAMPLE=5,
+        ):
+            entry = result.table.match(actual, expected, fail_limit=2)
+
+        assert not entry
+        assert [row.idx for row in entry.data] == [0, 1, 2, 3, 4, 5, 15]
+        assert entry.spill["num_rows"] == 16
+        assert entry.message.startswith(
+            "Comparison stopped after 2 failing rows, compared 16 of 30 rows"
+        )
+
+    def test_no_spill(self, tmpdir, result):
+        """
+        Small tables, results without scratch and results not spilling
+        tables are not spilled.
+        """
+        result.table.log([{"idx": idx} for idx in range(30)])
+        entry = result.entries[-1]
+        assert entry.spill is None
+        assert not result.attachments
+
+        not_spilling = result_mod.Result(_scratch=str(tmpdir))
+        with mock.patch.multiple(
+            result_mod.defaults,
+            TABLE_SPILL_THRESHOLD=10,
+            TABLE_SPILL_SAMPLE=5,
+        ):
+            not_spilling.table.log([{"idx": idx} for idx in range(30)])
+        assert not_spilling.entries[-1].spill is None
+        assert not not_spilling.attachments
+
+        entry = result_mod.Result().table.match(
+            [["a"]] + [[1]] * 20000, [["a"]] + [[1]] * 20000
+        )
+        assert entry.spill is None
+        assert len(entry.data) == 20000